@@ -0,0 +1,4 @@
+"""Microbenchmarks for the RacePulse client pipeline.
+
+Run from the repository root, e.g. `python -m benchmarks.event_factory`.
+"""
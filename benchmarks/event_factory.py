@@ -0,0 +1,78 @@
+"""
+Events per second of `EventFactory.parse`, compared with the previous path.
+
+Results are per topic, in events per second.
+
+The legacy path imported `EventParser`, looked up the registry, built a new
+parser and a `RawTimingEvent` (with `datetime.now()`) for every event. The
+compiled path is a single dispatch-table lookup and call.
+
+Usage:
+    python -m benchmarks.event_factory [--seconds 1]
+"""
+
+import argparse
+from datetime import datetime, timezone
+import time
+from typing import Any, Callable
+
+from custom_components.racepulse.client.decorators import _PARSER_REGISTRY
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+from custom_components.racepulse.client.models import RawTimingEvent
+
+from .samples import MIX
+
+
+def legacy_parse(event_type: LiveTimingEvent, raw: Any) -> Any:
+    """`EventFactory.parse` as it was before the dispatch table."""
+    from custom_components.racepulse.client.interfaces import EventParser  # noqa: F401
+
+    parser_cls = _PARSER_REGISTRY.get(event_type)
+    raw_event = RawTimingEvent(
+        event_type=event_type,
+        payload=raw,
+        datetime_utc=datetime.now(timezone.utc),
+    )
+    if parser_cls:
+        try:
+            return parser_cls().parse(raw_event)
+        except Exception:
+            pass
+    return raw_event
+
+
+def measure(
+    parse: Callable[[LiveTimingEvent, Any], Any],
+    event_type: LiveTimingEvent,
+    payload: Any,
+    seconds: float,
+) -> float:
+    """Return the events per second `parse` sustains for one payload."""
+    events = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            parse(event_type, payload)
+        events += 100
+    return events / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1.0, help="per run")
+    args = parser.parse_args()
+
+    print(f"{'topic':<16}{'legacy':>14}{'compiled':>14}{'speedup':>10}")
+    for event_type, payload in MIX:
+        before = measure(legacy_parse, event_type, payload, args.seconds)
+        after = measure(EventFactory.parse, event_type, payload, args.seconds)
+        print(
+            f"{event_type.value:<16}{before:>14,.0f}{after:>14,.0f}"
+            f"{after / before:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Gaps after a one-car update, recomputed in full vs by the `GapEngine`.
+
+Replays a stream of race updates that each change one car's interval. The
+baseline sorts the field and walks every car per event, as a sensor without
+shared state does; the engine recomputes only the updated car and the cars
+whose gaps derive from it. Results are in events per second.
+
+Requires NumPy.
+
+Usage:
+    python -m benchmarks.gap_engine [--seconds 1] [--events 1000]
+"""
+
+import argparse
+import copy
+import random
+import time
+from typing import Any, Callable, List, Optional, Tuple
+
+from custom_components.racepulse.client.analytics import GapEngine
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+from custom_components.racepulse.client.models import TimingData
+from custom_components.racepulse.client.state import TopicStateStore
+from custom_components.racepulse.helpers import parse_int
+
+from .samples import TIMING_DATA
+
+
+def replay(count: int) -> List[TimingData]:
+    """Incrementally parsed events, each changing one car's interval."""
+    rng = random.Random(0)
+    store = TopicStateStore()
+    store.replace(LiveTimingEvent.TIMING_DATA, copy.deepcopy(TIMING_DATA))
+    timing = EventFactory.parse(
+        LiveTimingEvent.TIMING_DATA, store.get(LiveTimingEvent.TIMING_DATA)
+    )
+
+    numbers = list(timing.lines)
+    events = []
+    for _ in range(count):
+        interval = f"+{rng.randint(0, 2)}.{rng.randint(0, 999):03d}"
+        delta = {
+            "Lines": {
+                rng.choice(numbers): {"IntervalToPositionAhead": {"Value": interval}}
+            }
+        }
+        merged = store.apply(LiveTimingEvent.TIMING_DATA, delta)
+        timing = EventFactory.parse_incremental(
+            LiveTimingEvent.TIMING_DATA, timing, merged, delta
+        )
+        events.append(timing)
+    return events
+
+
+def full_gaps(timing: TimingData) -> List[Tuple[str, Optional[int], Optional[int]]]:
+    """Sort the field and walk every car, as `GapEngine` derives them."""
+    running = sorted(
+        (line for line in timing.lines.values() if parse_int(line.position) > 0),
+        key=lambda line: parse_int(line.position),
+    )
+
+    tower, ahead = [], None
+    for i, line in enumerate(running):
+        gap = line.gap_to_leader_ms
+        if gap is None:
+            gap = line.time_diff_to_fastest_ms
+        interval = line.interval_to_position_ahead_ms
+        if interval is None:
+            interval = line.time_diff_to_position_ahead_ms
+        if not i:
+            gap, interval = 0, None
+        elif ahead is not None:
+            if gap is None and interval is not None:
+                gap = ahead + interval
+            if interval is None and gap is not None:
+                interval = gap - ahead
+        tower.append((str(line.racing_number), gap, interval))
+        ahead = gap
+    return tower
+
+
+def measure(run: Callable[[], Any], seconds: float) -> float:
+    """Return the calls per second `run` sustains."""
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        calls += run()
+    return calls / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1.0, help="per run")
+    parser.add_argument("--events", type=int, default=1000)
+    args = parser.parse_args()
+
+    events = replay(args.events)
+
+    def full() -> int:
+        for timing in events:
+            full_gaps(timing)
+        return len(events)
+
+    def engine() -> int:
+        gaps = GapEngine()
+        for timing in events:
+            gaps.apply(timing)
+            gaps.tower
+        return len(events)
+
+    before = measure(full, args.seconds)
+    after = measure(engine, args.seconds)
+
+    gaps = GapEngine()
+    for timing in events:
+        gaps.apply(timing)
+    per_event = gaps.recomputed / len(events)
+    print(f"cars: {len(events[-1].lines)}, cars recomputed per event: {per_event:.1f}")
+    print(f"{'full':<10}{before:>14,.0f} events/s")
+    print(f"{'engine':<10}{after:>14,.0f} events/s")
+    print(f"{'speedup':<10}{after / before:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
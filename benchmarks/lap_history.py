@@ -0,0 +1,140 @@
+"""
+Lap history kept as parsed events vs the array-backed `LapHistory`.
+
+Replays a race distance of lap completions for every driver in the sample
+`TimingData`. The baseline keeps one parsed `TimingData` per lap and
+rebuilds each driver's lap times from it on every query; `LapHistory`
+appends one row per driver per lap into preallocated arrays and reads the
+column back. Reports the memory held and the queries per second of "mean
+of the last five laps, for every driver".
+
+Requires NumPy.
+
+Usage:
+    python -m benchmarks.lap_history [--laps 57] [--seconds 1]
+"""
+
+import argparse
+import copy
+import math
+import time
+import tracemalloc
+from typing import Any, Callable, List
+
+from custom_components.racepulse.client.analytics import LapHistory
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+from custom_components.racepulse.client.models import TimingData
+from custom_components.racepulse.client.state import TopicStateStore
+
+from .samples import TIMING_DATA
+
+WINDOW = 5
+
+
+def replay(laps: int) -> List[TimingData]:
+    """One incrementally parsed `TimingData` per lap, every driver one lap on."""
+    store = TopicStateStore()
+    store.replace(LiveTimingEvent.TIMING_DATA, copy.deepcopy(TIMING_DATA))
+    timing = EventFactory.parse(
+        LiveTimingEvent.TIMING_DATA, store.get(LiveTimingEvent.TIMING_DATA)
+    )
+
+    events = [timing]
+    start = {num: line.number_of_laps for num, line in timing.lines.items()}
+    for lap in range(1, laps + 1):
+        delta = {
+            "Lines": {
+                num: {
+                    "NumberOfLaps": start[num] + lap,
+                    "LastLapTime": {"Value": f"1:{30 + (lap + i) % 5}.{lap:03d}"},
+                }
+                for i, num in enumerate(start)
+            }
+        }
+        merged = store.apply(LiveTimingEvent.TIMING_DATA, delta)
+        timing = EventFactory.parse_incremental(
+            LiveTimingEvent.TIMING_DATA, timing, merged, delta
+        )
+        events.append(timing)
+    return events
+
+
+def event_query(events: List[TimingData]) -> List[float]:
+    """Rebuild every driver's lap times from the kept events."""
+    means = []
+    for num in events[-1].lines:
+        times, laps = [], None
+        for timing in events:
+            line = timing.lines[num]
+            if line.number_of_laps != laps and line.last_lap_time:
+                laps = line.number_of_laps
+                times.append(line.last_lap_time.value_ms or math.nan)
+        recent = times[-WINDOW:]
+        means.append(sum(recent) / len(recent))
+    return means
+
+
+def history_query(history: LapHistory) -> List[float]:
+    """Read every driver's lap times back from their ring."""
+    means = []
+    for num in history.racing_numbers:
+        # NumPy's per-call overhead outweighs its speed on five values.
+        recent = history.laps(num).column("lap_ms")[-WINDOW:].tolist()
+        means.append(sum(recent) / len(recent))
+    return means
+
+
+def build_history(events: List[TimingData]) -> LapHistory:
+    history = LapHistory()
+    for timing in events:
+        history.apply_timing(timing)
+    return history
+
+
+def held_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by `build()` while its result is alive."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def measure(run: Callable[[], Any], seconds: float) -> float:
+    """Return the calls per second `run` sustains."""
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        run()
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--laps", type=int, default=57)
+    parser.add_argument("--seconds", type=float, default=1.0, help="per run")
+    args = parser.parse_args()
+
+    events = replay(args.laps)
+    history = build_history(events)
+
+    # Incremental parsing shares unchanged objects between the kept events,
+    # so the baseline is already cheaper than independent snapshots.
+    kept = held_bytes(lambda: replay(args.laps))
+    arrays = held_bytes(lambda: build_history(events))
+
+    before = measure(lambda: event_query(events), args.seconds)
+    after = measure(lambda: history_query(history), args.seconds)
+
+    print(f"laps: {args.laps}, drivers: {len(history.racing_numbers)}")
+    print(f"{'':<10}{'memory KiB':>14}{'queries/s':>14}")
+    print(f"{'events':<10}{kept / 1024:>14,.0f}{before:>14,.0f}")
+    print(f"{'history':<10}{arrays / 1024:>14,.0f}{after:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Memory held by a race's worth of parsed timing history.
+
+Parses one `TimingData` and one `TimingAppData` snapshot per lap for a full
+race distance and keeps every event, the way lap histories do. The same
+history is then copied into equivalent dataclasses without `__slots__` to
+show what the per-instance `__dict__` used to cost.
+
+Usage:
+    python -m benchmarks.memory [--laps 57]
+"""
+
+import argparse
+import copy
+from dataclasses import fields, is_dataclass, make_dataclass
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+
+from .samples import TIMING_APP_DATA, TIMING_DATA
+
+_UNSLOTTED: Dict[type, type] = {}
+
+
+def unslotted(value: Any) -> Any:
+    """Deep-copy `value`, replacing slotted dataclasses with `__dict__` twins."""
+    if isinstance(value, dict):
+        return {key: unslotted(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [unslotted(item) for item in value]
+    if not is_dataclass(value) or isinstance(value, type):
+        return value
+
+    cls = type(value)
+    if cls not in _UNSLOTTED:
+        _UNSLOTTED[cls] = make_dataclass(
+            cls.__name__, [(f.name, f.type) for f in fields(cls)], frozen=True
+        )
+    twin = _UNSLOTTED[cls]
+    return twin(**{f.name: unslotted(getattr(value, f.name)) for f in fields(cls)})
+
+
+def parse_history(laps: int) -> List[Any]:
+    """Parse a fresh pair of snapshots per lap, so no objects are shared."""
+    history = []
+    for _ in range(laps):
+        for event_type, payload in (
+            (LiveTimingEvent.TIMING_DATA, TIMING_DATA),
+            (LiveTimingEvent.TIMING_APP, TIMING_APP_DATA),
+        ):
+            history.append(EventFactory.parse(event_type, copy.deepcopy(payload)))
+    return history
+
+
+def held_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated by `build()` while its result is alive."""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--laps", type=int, default=57)
+    args = parser.parse_args()
+
+    # Payload dicts are dropped after parsing; only the events stay alive.
+    slotted = held_bytes(lambda: parse_history(args.laps))
+    history = parse_history(args.laps)
+    with_dict = held_bytes(lambda: unslotted(history))
+
+    print(f"laps: {args.laps}, events: {len(history)}")
+    print(f"slotted   {slotted / 1024:>10,.0f} KiB per session")
+    print(f"__dict__  {with_dict / 1024:>10,.0f} KiB per session")
+    print(f"saved     {1 - slotted / with_dict:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""Representative topic payloads shared by the benchmarks."""
+
+from typing import Any, Dict
+
+from custom_components.racepulse.client.enums import LiveTimingEvent
+
+RACING_NUMBERS = [
+    "1",
+    "4",
+    "10",
+    "11",
+    "12",
+    "14",
+    "16",
+    "18",
+    "22",
+    "23",
+    "27",
+    "30",
+    "31",
+    "43",
+    "44",
+    "55",
+    "63",
+    "81",
+    "87",
+    "5",
+]
+
+
+def _speed(value: str) -> Dict[str, Any]:
+    return {
+        "Value": value,
+        "Status": 0,
+        "OverallFastest": False,
+        "PersonalFastest": False,
+    }
+
+
+def timing_line(position: int, number: str) -> Dict[str, Any]:
+    """A complete `TimingData` line, as found in a subscribe snapshot."""
+    return {
+        "TimeDiffToFastest": f"+{position * 0.312:.3f}",
+        "TimeDiffToPositionAhead": "+0.312",
+        "Line": position,
+        "Position": str(position),
+        "ShowPosition": True,
+        "RacingNumber": number,
+        "Retired": False,
+        "InPit": False,
+        "PitOut": False,
+        "Stopped": False,
+        "Status": 0,
+        "Sectors": [
+            {
+                "Stopped": False,
+                "Value": "28.111",
+                "Status": 0,
+                "OverallFastest": False,
+                "PersonalFastest": True,
+                "Segments": [{"Status": 2049} for _ in range(8)],
+                "PreviousValue": "28.254",
+            }
+            for _ in range(3)
+        ],
+        "Speeds": {
+            "I1": _speed("253"),
+            "I2": _speed("181"),
+            "FL": _speed("294"),
+            "ST": _speed("312"),
+        },
+        "BestLapTime": {"Value": "1:30.857", "Lap": 12},
+        "LastLapTime": {
+            "Value": "1:31.102",
+            "Status": 0,
+            "OverallFastest": False,
+            "PersonalFastest": False,
+        },
+        "NumberOfLaps": 24,
+        "NumberOfPitStops": 1,
+    }
+
+
+TIMING_DATA: Dict[str, Any] = {
+    "Lines": {
+        number: timing_line(position, number)
+        for position, number in enumerate(RACING_NUMBERS, start=1)
+    },
+    "Withheld": False,
+}
+
+TIMING_APP_DATA: Dict[str, Any] = {
+    "Lines": {
+        number: {
+            "RacingNumber": number,
+            "Line": position,
+            "Stints": [
+                {
+                    "LapFlags": 0,
+                    "Compound": compound,
+                    "New": "true",
+                    "TyresNotChanged": "0",
+                    "TotalLaps": 18,
+                    "StartLaps": 0,
+                    "LapTime": "1:32.345",
+                    "LapNumber": 17,
+                }
+                for compound in ("MEDIUM", "HARD")
+            ],
+        }
+        for position, number in enumerate(RACING_NUMBERS, start=1)
+    }
+}
+
+DRIVER_LIST: Dict[str, Any] = {
+    number: {
+        "RacingNumber": number,
+        "BroadcastName": f"D DRIVER{number}",
+        "FullName": f"Driver DRIVER{number}",
+        "Tla": f"D{number:0>2}",
+        "Line": position,
+        "TeamName": f"Team {(position + 1) // 2}",
+        "TeamColour": "4781D7",
+        "FirstName": "Driver",
+        "LastName": f"Driver{number}",
+        "Reference": f"DRIVER{number:0>2}",
+        "HeadshotUrl": f"https://media.formula1.com/{number}.png",
+        "PublicIdRight": f"common/f1/2025/{number}right",
+    }
+    for position, number in enumerate(RACING_NUMBERS, start=1)
+}
+
+WEATHER_DATA: Dict[str, Any] = {
+    "AirTemp": "28.5",
+    "Humidity": "73.0",
+    "Pressure": "1008.9",
+    "Rainfall": "0",
+    "TrackTemp": "36.1",
+    "WindDirection": "124",
+    "WindSpeed": "1.2",
+}
+
+TRACK_STATUS: Dict[str, Any] = {"Status": "1", "Message": "AllClear"}
+
+HEARTBEAT: Dict[str, Any] = {"Utc": "2025-10-03T14:26:58.0863771Z", "_kf": True}
+
+# Roughly the mix of a live session: mostly timing, some status topics.
+MIX = [
+    (LiveTimingEvent.TIMING_DATA, TIMING_DATA),
+    (LiveTimingEvent.TRACK_STATUS, TRACK_STATUS),
+    (LiveTimingEvent.WEATHER_DATA, WEATHER_DATA),
+    (LiveTimingEvent.HEARTBEAT, HEARTBEAT),
+]
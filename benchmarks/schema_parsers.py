@@ -0,0 +1,164 @@
+"""
+Events per second of the generated parsers, compared with hand-written ones.
+
+Results are per topic, in events per second.
+
+The hand-written parsers below are the ones the generated parsers replaced,
+kept verbatim as the baseline: the generated code should match them.
+
+Usage:
+    python -m benchmarks.schema_parsers [--seconds 1]
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Tuple
+
+from custom_components.racepulse.client.enums import LiveTimingEvent, TyreCompound
+from custom_components.racepulse.client.models import (
+    Driver,
+    DriverList,
+    DriverStints,
+    Stint,
+    TimingApp,
+    WeatherData,
+)
+from custom_components.racepulse.client.schema import compile_parser
+from custom_components.racepulse.helpers import (
+    parse_bool,
+    parse_float,
+    parse_int,
+    parse_time_ms,
+)
+
+from .samples import DRIVER_LIST, TIMING_APP_DATA, WEATHER_DATA
+
+
+def hand_written_weather_data(payload: Any) -> WeatherData:
+    payload = payload or {}
+
+    return WeatherData(
+        air_temperature=parse_float(payload.get("AirTemp")),
+        humidity=parse_float(payload.get("Humidity")),
+        air_pressure=parse_float(payload.get("Pressure")),
+        rainfall=parse_float(payload.get("Rainfall")),
+        track_temperature=parse_float(payload.get("TrackTemp")),
+        wind_direction=parse_float(payload.get("WindDirection")),
+        wind_speed=parse_float(payload.get("WindSpeed")),
+    )
+
+
+def hand_written_driver_list(payload: Any) -> DriverList:
+    drivers: dict[str, Driver] = {}
+    for num, data in payload.items():
+        drivers[num] = Driver(
+            racing_number=parse_int(data["RacingNumber"]),
+            broadcast_name=data["BroadcastName"],
+            full_name=data["FullName"],
+            tla=data["Tla"],
+            line=parse_int(data["Line"]),
+            team_name=data["TeamName"],
+            team_colour=data["TeamColour"],
+            first_name=data["FirstName"],
+            last_name=data["LastName"],
+            reference=data["Reference"],
+            headshot_url=data["HeadshotUrl"],
+            public_id_right=data["PublicIdRight"],
+        )
+    return DriverList(drivers=drivers)
+
+
+def hand_written_timing_app(payload: Any) -> TimingApp:
+    lines_data = payload.get("Lines", {})
+
+    lines = {}
+
+    for num, data in lines_data.items():
+        stints_list = data.get("Stints", [])
+
+        stints = {}
+        for i, stint_data in enumerate(stints_list):
+            stints[str(i)] = Stint(
+                lap_flags=parse_int(stint_data.get("LapFlags")),
+                compound=TyreCompound(stint_data.get("Compound") or "UNKNOWN"),
+                new=parse_bool(stint_data.get("New")),
+                tyres_not_changed=parse_int(stint_data.get("TyresNotChanged")),
+                total_laps=parse_int(stint_data.get("TotalLaps")),
+                start_laps=parse_int(stint_data.get("StartLaps")),
+                lap_time=stint_data.get("LapTime", ""),
+                lap_time_ms=parse_time_ms(stint_data.get("LapTime")),
+                lap_number=parse_int(stint_data.get("LapNumber")),
+            )
+
+        lines[num] = DriverStints(
+            racing_number=parse_int(data.get("RacingNumber")),
+            line=parse_int(data.get("Line")),
+            stints=stints,
+        )
+
+    return TimingApp(lines=lines)
+
+
+def measure(parse: Callable[[Any], Any], payload: Any, seconds: float) -> float:
+    """Return the events per second `parse` sustains for one payload."""
+    events = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            parse(payload)
+        events += 100
+    return events / (time.perf_counter() - started)
+
+
+def best_of(
+    rounds: int, first: Callable[[], float], second: Callable[[], float]
+) -> Tuple[float, float]:
+    """Alternate two measurements and keep the best of each, to damp noise."""
+    results = [(first(), second()) for _ in range(rounds)]
+    return max(r[0] for r in results), max(r[1] for r in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1.0, help="per run")
+    parser.add_argument("--rounds", type=int, default=3, help="runs per parser")
+    args = parser.parse_args()
+
+    print(f"{'topic':<16}{'hand-written':>14}{'generated':>14}{'speedup':>10}")
+    for event_type, model, hand_written, payload in (
+        (
+            LiveTimingEvent.WEATHER_DATA,
+            WeatherData,
+            hand_written_weather_data,
+            WEATHER_DATA,
+        ),
+        (
+            LiveTimingEvent.DRIVER_LIST,
+            DriverList,
+            hand_written_driver_list,
+            DRIVER_LIST,
+        ),
+        (
+            LiveTimingEvent.TIMING_APP,
+            TimingApp,
+            hand_written_timing_app,
+            TIMING_APP_DATA,
+        ),
+    ):
+        generated = compile_parser(model)
+        assert hand_written(payload) == generated(payload)
+
+        before, after = best_of(
+            args.rounds,
+            lambda: measure(hand_written, payload, args.seconds),
+            lambda: measure(generated, payload, args.seconds),
+        )
+        print(
+            f"{event_type.value:<16}{before:>14,.0f}{after:>14,.0f}"
+            f"{after / before:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Stint degradation refitted per lap vs the running `StintPace` statistics.
+
+Fills a `LapHistory` with a race of laps for 20 cars, two stints each,
+then times keeping every stint's fit current after each new lap: the
+baseline refits the stint's laps with `numpy.polyfit`, `StintPace` adds the
+lap to its running sums. Results are in laps per second.
+
+Requires NumPy.
+
+Usage:
+    python -m benchmarks.stint_pace [--laps 70] [--cars 20]
+"""
+
+import argparse
+import random
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+from custom_components.racepulse.client.analytics import (
+    LapHistory,
+    LapRing,
+    StintPace,
+)
+
+
+def fill(laps: int, cars: int) -> List[Tuple[str, LapRing]]:
+    """Rings with one pit stop halfway, in the order the laps complete."""
+    rng = random.Random(0)
+    rings = [(str(car), LapRing()) for car in range(1, cars + 1)]
+    for lap in range(1, laps + 1):
+        for _, ring in rings:
+            stint = 0 if lap <= laps // 2 else 1
+            ring.append(
+                lap=lap,
+                lap_ms=90_000 + 80 * lap + rng.randint(-300, 300),
+                sectors=(),
+                compound=stint,
+                stint=stint,
+                pit=lap in (laps // 2, laps // 2 + 1),
+            )
+    return rings
+
+
+def refit(rings: List[Tuple[str, LapRing]], laps: int) -> float:
+    """Refit the current stint of a car after each of its laps."""
+    started = time.perf_counter()
+    for row in range(laps):
+        for _, ring in rings:
+            stint = ring.stint[: row + 1]
+            fit = (stint == stint[-1]) & ~ring.pit[: row + 1]
+            if fit.sum() >= 2:
+                np.polyfit(ring.lap[: row + 1][fit], ring.lap_ms[: row + 1][fit], 1)
+    return laps * len(rings) / (time.perf_counter() - started)
+
+
+def running(rings: List[Tuple[str, LapRing]], laps: int) -> float:
+    """Add each lap to the running statistics of its stint."""
+    pace = StintPace(LapHistory())
+    started = time.perf_counter()
+    for row in range(laps):
+        for num, ring in rings:
+            pace.add(num, ring, row)
+            pace.current(num)
+    return laps * len(rings) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--laps", type=int, default=70)
+    parser.add_argument("--cars", type=int, default=20)
+    args = parser.parse_args()
+
+    rings = fill(args.laps, args.cars)
+    before = refit(rings, args.laps)
+    after = running(rings, args.laps)
+
+    print(f"laps: {args.laps}, cars: {args.cars}")
+    print(f"{'refit':<10}{before:>14,.0f} laps/s")
+    print(f"{'running':<10}{after:>14,.0f} laps/s")
+    print(f"{'speedup':<10}{after / before:>13.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Timestamps per second of `parse_datetime`, compared with the previous helper.
+
+The previous helper replaced "Z" and called `datetime.fromisoformat` on
+every call (after the parsers had already replaced "Z" once). The new path
+calls `datetime.fromisoformat` once on the raw string and falls back to
+slicing the fixed feed format by hand; both are measured on unique
+timestamps.
+
+Usage:
+    python -m benchmarks.timestamps [--seconds 1]
+"""
+
+import argparse
+from datetime import datetime, timedelta
+import time
+from typing import Any, Callable, List, Optional
+
+from custom_components.racepulse.helpers import (
+    _parse_fixed_timestamp,
+    parse_datetime,
+)
+
+
+def legacy_parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """`helpers.parse_datetime` as called by the parsers before."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(
+            value.replace("Z", "+00:00").replace("Z", "+00:00")
+        )
+    except (ValueError, TypeError):
+        return None
+
+
+def timestamps(count: int) -> List[str]:
+    start = datetime(2025, 10, 3, 14, 0, 0)
+    return [
+        (start + timedelta(microseconds=i * 137_911)).strftime("%Y-%m-%dT%H:%M:%S.%f")
+        + "3Z"  # the feed sends 7 fractional digits
+        for i in range(count)
+    ]
+
+
+def measure(parse: Callable[[str], Any], values: List[str], seconds: float) -> float:
+    """Return the timestamps per second `parse` sustains over `values`."""
+    parsed = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for value in values:
+            parse(value)
+        parsed += len(values)
+    return parsed / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1.0, help="per run")
+    args = parser.parse_args()
+
+    unique = timestamps(100_000)
+
+    print(f"{'path':<28}{'timestamps/s':>16}")
+    for name, parse, values in (
+        ("legacy", legacy_parse_datetime, unique),
+        ("parse_datetime", parse_datetime, unique),
+        ("slicing fallback", _parse_fixed_timestamp, unique),
+    ):
+        print(f"{name:<28}{measure(parse, values, args.seconds):>16,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Leaderboard work per event, Python loops vs the columnar `TimingTower`.
+
+A leaderboard query orders the field, derives gaps to the leader and finds
+battles. The Python baseline loops over `TimingData.lines` in every sensor;
+the tower applies the event once and every sensor reads the shared result.
+Results are in events per second, for a number of sensors per event.
+
+Requires NumPy.
+
+Usage:
+    python -m benchmarks.timing_tower [--seconds 1] [--sensors 1 4 8]
+"""
+
+import argparse
+import copy
+import math
+import time
+from typing import Any, Callable, List, Tuple
+
+from custom_components.racepulse.client.analytics import TimingTower
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+from custom_components.racepulse.client.models import TimingData
+from custom_components.racepulse.client.state import TopicStateStore
+from custom_components.racepulse.helpers import parse_int
+
+from .samples import TIMING_DATA
+
+THRESHOLD_MS = 1000
+
+
+def python_query(timing: TimingData) -> Tuple[List[float], List[Tuple[str, str]]]:
+    """Order, gaps and battles with loops over `lines.values()`."""
+    running = sorted(
+        (line for line in timing.lines.values() if parse_int(line.position) > 0),
+        key=lambda line: parse_int(line.position),
+    )
+
+    gaps, gap = [], 0.0
+    for i, line in enumerate(running):
+        if line.time_diff_to_fastest_ms is not None:
+            gap = float(line.time_diff_to_fastest_ms)
+        elif not i:
+            gap = 0.0
+        elif line.time_diff_to_position_ahead_ms is not None:
+            gap += line.time_diff_to_position_ahead_ms
+        else:
+            gap = math.nan
+        gaps.append(gap)
+
+    battles = [
+        (str(ahead.racing_number), str(behind.racing_number))
+        for ahead, behind in zip(running, running[1:])
+        if behind.time_diff_to_position_ahead_ms is not None
+        and behind.time_diff_to_position_ahead_ms <= THRESHOLD_MS
+    ]
+    return gaps, battles
+
+
+def tower_query(tower: TimingTower) -> Any:
+    return tower.gaps(), tower.battles(THRESHOLD_MS)
+
+
+def measure(run: Callable[[], Any], seconds: float) -> float:
+    """Return the calls per second `run` sustains."""
+    calls = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            run()
+        calls += 100
+    return calls / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=1.0, help="per run")
+    parser.add_argument(
+        "--sensors", type=int, nargs="+", default=[1, 4, 8], help="per event"
+    )
+    args = parser.parse_args()
+
+    store = TopicStateStore()
+    store.replace(LiveTimingEvent.TIMING_DATA, copy.deepcopy(TIMING_DATA))
+    timing = EventFactory.parse(
+        LiveTimingEvent.TIMING_DATA, store.get(LiveTimingEvent.TIMING_DATA)
+    )
+
+    # Alternate between two events in which one driver's sector time differs,
+    # so that every event changes one line of the tower.
+    delta = {"Lines": {"44": {"Sectors": {"1": {"Value": "28.002"}}}}}
+    merged = store.apply(LiveTimingEvent.TIMING_DATA, delta)
+    updated = EventFactory.parse_incremental(
+        LiveTimingEvent.TIMING_DATA, timing, merged, delta
+    )
+    events = [timing, updated]
+    tower = TimingTower()
+    tower.apply(timing)
+
+    print(f"{'sensors':<10}{'python':>14}{'tower':>14}{'speedup':>10}")
+    for sensors in args.sensors:
+        state = [0]
+
+        def python_event() -> None:
+            state[0] ^= 1
+            for _ in range(sensors):
+                python_query(events[state[0]])
+
+        def tower_event() -> None:
+            state[0] ^= 1
+            tower.apply(events[state[0]])
+            for _ in range(sensors):
+                tower_query(tower)
+
+        before = measure(python_event, args.seconds)
+        after = measure(tower_event, args.seconds)
+        print(f"{sensors:<10}{before:>14,.0f}{after:>14,.0f}{after / before:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
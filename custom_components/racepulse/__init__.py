@@ -6,10 +6,11 @@ from typing import TYPE_CHECKING
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core_config import Config
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN, PLATFORMS, STARTUP_MESSAGE
-from .client import F1SignalRClient
+from .client import DelayBuffer
+from .client.state import SessionState
+from .hub import RacePulseHub
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -18,26 +19,41 @@ SCAN_INTERVAL = timedelta(seconds=30)
 _LOGGER: logging.Logger = logging.getLogger(__package__)
 
 
-async def async_setup(hass: HomeAssistant, config: Config):
+async def async_setup(hass: "HomeAssistant", config: Config):
     """Set up this integration using YAML is not supported."""
     return True
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,
+    hass: "HomeAssistant",
     entry: ConfigEntry,
 ) -> bool:
     """Set up the F1 Live Timing integration from a config entry."""
 
-    session = async_get_clientsession(hass)
-    client = F1SignalRClient(session)
+    # All entries share one upstream connection, owned by the hub.
+    hub = RacePulseHub.async_get(hass)
+    client = hub.acquire(entry.entry_id)
+
+    # Entities attach to the notifier: the client itself, or a buffer that
+    # delays events to stay in sync with the TV broadcast.
+    delay_buffer = None
+    if delay := entry.data.get("live_delay_seconds", 0):
+        delay_buffer = DelayBuffer(delay)
+        hub.attach(entry.entry_id, delay_buffer)
+
+    # Each entry's state follows its own notifier, so a delayed entry never
+    # reads values ahead of the events it receives.
+    state = SessionState()
+    if delay_buffer is not None:
+        delay_buffer.attach(state)
+    else:
+        hub.attach(entry.entry_id, state)
 
-    connect_task = hass.async_create_task(client.connect())
-
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
-        "connect_task": connect_task,
+        "delay_buffer": delay_buffer,
+        "notifier": delay_buffer or client,
+        "state": state,
     }
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -47,7 +63,7 @@ async def async_setup_entry(
 
 
 async def async_unload_entry(
-    hass: HomeAssistant,
+    hass: "HomeAssistant",
     entry: ConfigEntry,
 ) -> bool:
     """Unload the F1 Live Timing config entry."""
@@ -56,22 +72,18 @@ async def async_unload_entry(
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if data:
-        client: F1SignalRClient = data["client"]
-        connect_task = data["connect_task"]
-
-        # Ask client to stop reconnect loop and close WS
-        await client.disconnect()
+        # Closes the upstream connection if this was the last entry.
+        await RacePulseHub.async_get(hass).release(entry.entry_id)
 
-        # Now cancel/await the outer loop task that HA owns
-        if not connect_task.done():
-            connect_task.cancel()
+        if delay_buffer := data["delay_buffer"]:
+            delay_buffer.close()
 
     _LOGGER.info("[%s] Integration unloaded", DOMAIN)
     return unload_ok
 
 
 async def async_reload_entry(
-    hass: HomeAssistant,
+    hass: "HomeAssistant",
     entry: ConfigEntry,
 ) -> None:
     """Reload config entry."""
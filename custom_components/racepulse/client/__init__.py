@@ -1,3 +1,12 @@
+from .archive_importer import ArchiveImporter
+from .delay_buffer import DelayBuffer
 from .f1_signalr_client import F1SignalRClient
+from .replay_client import ReplayClient, ReplayStats
 
-__all__ = [F1SignalRClient]
+__all__ = [
+    "ArchiveImporter",
+    "DelayBuffer",
+    "F1SignalRClient",
+    "ReplayClient",
+    "ReplayStats",
+]
@@ -0,0 +1,21 @@
+"""
+Analytics over parsed events for the RacePulse F1 client.
+
+Requires NumPy. Unlike the rest of the client, this package is optional:
+import it only where NumPy is available.
+"""
+
+from .gap_engine import GapEngine, TowerEntry
+from .lap_history import LapHistory, LapRing
+from .stint_pace import StintPace, StintStats
+from .timing_tower import TimingTower
+
+__all__ = [
+    "GapEngine",
+    "LapHistory",
+    "LapRing",
+    "StintPace",
+    "StintStats",
+    "TimingTower",
+    "TowerEntry",
+]
@@ -0,0 +1,194 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from ..enums import LiveTimingEvent
+from ...helpers import parse_int
+
+if TYPE_CHECKING:
+    from ..interfaces.event import Event
+    from ..interfaces.notifiable import Notifiable
+    from ..models import DriverTiming, TimingData
+
+
+@dataclass(frozen=True, slots=True)
+class TowerEntry:
+    """
+    One car in the running order, with numeric gaps.
+
+    Attributes:
+        racing_number: The driver's racing number.
+        position: The running position, from 1.
+        gap_to_leader_ms: Gap to the leader in milliseconds, or None if
+                          unknown (e.g. the car is lapped).
+        interval_ms: Interval to the car ahead in milliseconds, or None if
+                     unknown or for the leader.
+        catching: Whether the car is catching the one ahead.
+    """
+
+    racing_number: str
+    position: int
+    gap_to_leader_ms: Optional[int]
+    interval_ms: Optional[int]
+    catching: bool
+
+
+def _gap(line: "DriverTiming") -> Optional[int]:
+    # Race sessions send GapToLeader, the others TimeDiffToFastest.
+    if line.gap_to_leader_ms is not None:
+        return line.gap_to_leader_ms
+    return line.time_diff_to_fastest_ms
+
+
+def _interval(line: "DriverTiming") -> Optional[int]:
+    if line.interval_to_position_ahead_ms is not None:
+        return line.interval_to_position_ahead_ms
+    return line.time_diff_to_position_ahead_ms
+
+
+class GapEngine:
+    """
+    Numeric gaps and intervals of every car, kept in running order.
+
+    An observer of `TimingData`. Gaps and intervals are read from
+    `GapToLeader`/`IntervalToPositionAhead` in races and from
+    `TimeDiffToFastest`/`TimeDiffToPositionAhead` otherwise. Where the feed
+    has no gap for a car it is derived from the car ahead plus the interval,
+    and a missing interval from the two gaps.
+
+    Only the lines that changed since the previous event are looked at. A
+    changed gap or interval recomputes that car and the cars behind it whose
+    values derive from it, stopping at the first car that comes out
+    unchanged; only a change of running order recomputes the whole field.
+    Sensors read the cached `tower` or a single car's entry in O(1).
+
+    Example:
+        engine = GapEngine()
+        client.attach(engine, topics={LiveTimingEvent.TIMING_DATA})
+        ...
+        entry = engine.get("44")
+        entry.gap_to_leader_ms, entry.interval_ms
+    """
+
+    def __init__(self) -> None:
+        self._seen: Dict[str, "DriverTiming"] = {}
+        self._positions: Dict[str, int] = {}
+        self._feed: Dict[str, Tuple[Optional[int], Optional[int], bool]] = {}
+        self._order: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._entries: Dict[str, TowerEntry] = {}
+        self._tower: Optional[Tuple[TowerEntry, ...]] = ()
+        self.version = 0
+        self.recomputed = 0
+
+    # --- Reading ---
+    @property
+    def tower(self) -> Tuple[TowerEntry, ...]:
+        """Every classified car, leader first."""
+        if self._tower is None:
+            self._tower = tuple(self._entries[num] for num in self._order)
+        return self._tower
+
+    def get(self, racing_number: str) -> Optional[TowerEntry]:
+        """The entry of a car, or None if it has no running position."""
+        return self._entries.get(racing_number)
+
+    def ahead(self, racing_number: str) -> Optional[TowerEntry]:
+        """The entry of the car ahead, or None for the leader."""
+        index = self._index.get(racing_number)
+        if not index:
+            return None
+        return self._entries[self._order[index - 1]]
+
+    def behind(self, racing_number: str) -> Optional[TowerEntry]:
+        """The entry of the car behind, or None for the last car."""
+        index = self._index.get(racing_number)
+        if index is None or index + 1 >= len(self._order):
+            return None
+        return self._entries[self._order[index + 1]]
+
+    # --- Updates ---
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook: follow `TimingData` events."""
+        if message.data_type == LiveTimingEvent.TIMING_DATA:
+            self.apply(message)
+
+    def apply(self, timing: "TimingData") -> None:
+        """Update the gaps of the cars whose lines changed."""
+        lines = timing.lines
+        reorder = len(self._seen) > len(lines) and any(
+            num not in lines for num in self._seen
+        )
+        dirty: Set[str] = set()
+
+        for num, line in lines.items():
+            if self._seen.get(num) is line:
+                continue
+            self._seen[num] = line
+
+            position = parse_int(line.position)
+            if self._positions.get(num) != position:
+                self._positions[num] = position
+                reorder = True
+
+            feed = (_gap(line), _interval(line), line.catching)
+            if self._feed.get(num) != feed:
+                self._feed[num] = feed
+                dirty.add(num)
+
+        if reorder:
+            for num in [n for n in self._seen if n not in lines]:
+                del self._seen[num], self._positions[num], self._feed[num]
+            self._reorder()
+        elif indices := [self._index[n] for n in dirty if n in self._index]:
+            if not self._recompute(min(indices), max(indices)):
+                return
+        else:
+            return
+
+        self._tower = None
+        self.version += 1
+
+    def _reorder(self) -> None:
+        running = sorted(
+            (num for num, position in self._positions.items() if position > 0),
+            key=self._positions.__getitem__,
+        )
+        self._order = running
+        self._index = {num: i for i, num in enumerate(running)}
+        for num in [n for n in self._entries if n not in self._index]:
+            del self._entries[num]
+        self._recompute(0, len(running) - 1)
+
+    def _recompute(self, first: int, last: int) -> bool:
+        """
+        Recompute from `first`, at least up to `last`, until nothing changes.
+
+        Returns:
+            Whether any entry changed.
+        """
+        order, entries = self._order, self._entries
+        changed = False
+        previous = entries[order[first - 1]] if first > 0 else None
+
+        for index in range(first, len(order)):
+            num = order[index]
+            gap, interval, catching = self._feed[num]
+            if previous is None:
+                gap, interval = 0, None
+            else:
+                ahead = previous.gap_to_leader_ms
+                if gap is None and interval is not None and ahead is not None:
+                    gap = ahead + interval
+                if interval is None and gap is not None and ahead is not None:
+                    interval = gap - ahead
+
+            entry = TowerEntry(num, index + 1, gap, interval, catching)
+            self.recomputed += 1
+            if entries.get(num) == entry:
+                if index >= last:
+                    break
+            else:
+                entries[num] = entry
+                changed = True
+            previous = entry
+        return changed
@@ -0,0 +1,412 @@
+import logging
+import math
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..enums import LiveTimingEvent, TyreCompound
+from ...const import DOMAIN
+
+if TYPE_CHECKING:
+    from ..interfaces.event import Event
+    from ..interfaces.notifiable import Notifiable
+    from ..models import (
+        DriverStints,
+        DriverTiming,
+        SessionInfo,
+        TimingApp,
+        TimingData,
+    )
+
+_LOGGER = logging.getLogger(__name__)
+
+SECTORS = 3
+
+# Laps kept per driver; covers the longest race on the calendar.
+CAPACITY = 100
+
+# Compound codes stored in the `compound` column; -1 means unknown.
+COMPOUNDS = tuple(TyreCompound)
+_CODES = {compound: code for code, compound in enumerate(COMPOUNDS)}
+
+
+def _ms(value: Optional[int]) -> float:
+    return math.nan if value is None else value
+
+
+def _lap_ms(line: "DriverTiming") -> float:
+    last = line.last_lap_time
+    return _ms(last and last.value_ms)
+
+
+class LapRing:
+    """
+    The last `capacity` completed laps of one driver, one row per lap.
+
+    Every column is a preallocated NumPy array written in place, so appending
+    a lap is O(1) and never allocates; once full, the oldest lap is
+    overwritten. Columns are read through `column()`, oldest lap first.
+
+    Columns:
+        lap: The lap number.
+        lap_ms: The lap time in milliseconds (float32, NaN if unknown).
+        sectors: The sector times of the lap, shape `(n, 3)`.
+        compound: Index into `COMPOUNDS` of the tyre, -1 if unknown.
+        stint: Index of the stint the lap was driven in, -1 if unknown.
+        tyre_age: Laps on the tyre set at the end of the lap, 0 if unknown.
+        pit: Whether the car was in the pit lane during the lap.
+    """
+
+    __slots__ = (
+        "lap",
+        "lap_ms",
+        "sectors",
+        "compound",
+        "stint",
+        "tyre_age",
+        "pit",
+        "_capacity",
+        "_count",
+        "_next",
+    )
+
+    COLUMNS = ("lap", "lap_ms", "sectors", "compound", "stint", "tyre_age", "pit")
+
+    def __init__(self, capacity: int = CAPACITY):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.lap = np.zeros(capacity, dtype=np.int16)
+        self.lap_ms = np.full(capacity, np.nan, dtype=np.float32)
+        self.sectors = np.full((capacity, SECTORS), np.nan, dtype=np.float32)
+        self.compound = np.full(capacity, -1, dtype=np.int8)
+        self.stint = np.full(capacity, -1, dtype=np.int8)
+        self.tyre_age = np.zeros(capacity, dtype=np.int16)
+        self.pit = np.zeros(capacity, dtype=bool)
+        self._capacity = capacity
+        self._count = 0
+        self._next = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def last(self) -> Optional[int]:
+        """Row index of the latest lap, or None if the ring is empty."""
+        if not self._count:
+            return None
+        return (self._next - 1) % self._capacity
+
+    def append(
+        self,
+        lap: int,
+        lap_ms: float,
+        sectors: Iterable[float],
+        compound: int = -1,
+        stint: int = -1,
+        tyre_age: int = 0,
+        pit: bool = False,
+    ) -> None:
+        """Record a completed lap, overwriting the oldest one if full."""
+        row = self._next
+        self.lap[row] = lap
+        self.lap_ms[row] = lap_ms
+        self.sectors[row] = np.nan
+        for i, value in enumerate(sectors):
+            self.sectors[row, i] = value
+        self.compound[row] = compound
+        self.stint[row] = stint
+        self.tyre_age[row] = tyre_age
+        self.pit[row] = pit
+
+        self._next = (row + 1) % self._capacity
+        self._count = min(self._count + 1, self._capacity)
+
+    def clear(self) -> None:
+        """Forget every lap, keeping the arrays."""
+        self._count = 0
+        self._next = 0
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        One column, oldest lap first.
+
+        A read-only view while the ring has not wrapped, a copy after.
+        """
+        if name not in self.COLUMNS:
+            raise KeyError(name)
+        data = getattr(self, name)
+        if self._count < self._capacity:
+            ordered = data[: self._count]
+        else:
+            ordered = np.concatenate((data[self._next :], data[: self._next]))
+        ordered.flags.writeable = False
+        return ordered
+
+
+class _Driver:
+    """Per-driver bookkeeping between completed laps."""
+
+    __slots__ = (
+        "ring",
+        "line",
+        "laps",
+        "pit",
+        "stint",
+        "compound",
+        "start_laps",
+        "stint_laps",
+        "last_ms",
+        "previous_ms",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        self.ring = LapRing(capacity)
+        self.line: Optional["DriverTiming"] = None
+        self.laps: Optional[int] = None
+        self.pit = False
+        self.stint = -1
+        self.compound = -1
+        self.start_laps = 0
+        self.stint_laps = 0
+        # Lap times of the latest recorded lap and of the one before it.
+        self.last_ms = math.nan
+        self.previous_ms = math.nan
+
+    def restart(self, line: "DriverTiming") -> None:
+        """Drop the recorded laps and start over from `line`."""
+        self.ring.clear()
+        self.laps = line.number_of_laps
+        self.pit = bool(line.in_pit or line.pit_out)
+        self.stint_laps = 0
+        # The lap time held now belongs to a lap that is not recorded.
+        self.last_ms = _lap_ms(line)
+        self.previous_ms = math.nan
+
+
+# Called with the racing number, the driver's ring and the row of the lap.
+LapListener = Callable[[str, LapRing, int], None]
+
+# Called with the racing number whose laps were dropped, or None for all.
+ResetListener = Callable[[Optional[str]], None]
+
+
+class LapHistory:
+    """
+    Lap-by-lap history of every driver, recorded as the session runs.
+
+    An observer of `TimingData`, `TimingApp` and `SessionInfo`. When a
+    driver's `number_of_laps` goes up, one row is appended to their
+    `LapRing`: the last lap time and sector times from `TimingData`, and the
+    tyre compound, stint and tyre age from the latest `TimingApp` stint.
+
+    The feed may send the lap count before the new lap time, so a lap time
+    equal to the previous lap's is taken as stale and left unknown until a
+    different one arrives; a time that changes later replaces the recorded
+    one. (Two consecutive laps timed to the millisecond stay unknown.)
+
+    The first lap count seen for a driver is taken as the starting point,
+    so history joined mid-session starts with the next completed lap. A new
+    session (a different `SessionInfo`) drops every driver's laps, and a lap
+    count going down drops that driver's laps and restarts from it.
+
+    Listeners added with `subscribe()` are called for every recorded lap,
+    and again when its lap time is filled in or corrected later.
+
+    Example:
+        history = LapHistory()
+        client.attach(
+            history,
+            topics={
+                LiveTimingEvent.TIMING_DATA,
+                LiveTimingEvent.TIMING_APP,
+                LiveTimingEvent.SESSION_INFO,
+            },
+        )
+        ...
+        lap_times = history.laps("44").column("lap_ms")
+    """
+
+    def __init__(self, capacity: int = CAPACITY):
+        self._capacity = capacity
+        self._drivers: Dict[str, _Driver] = {}
+        self._stints: Dict[str, "DriverStints"] = {}
+        self._listeners: List[LapListener] = []
+        self._reset_listeners: List[ResetListener] = []
+        self._session: Optional[tuple] = None
+        self.recorded = 0
+
+    @property
+    def racing_numbers(self) -> List[str]:
+        return list(self._drivers)
+
+    def laps(self, racing_number: str) -> Optional[LapRing]:
+        """The lap history of a driver, or None if none was recorded yet."""
+        driver = self._drivers.get(racing_number)
+        return driver.ring if driver is not None else None
+
+    def subscribe(
+        self, listener: LapListener, reset: Optional[ResetListener] = None
+    ) -> Callable[[], None]:
+        """
+        Call `listener(racing_number, ring, row)` for every recorded lap.
+
+        Args:
+            listener: Called for every recorded, filled in or corrected lap.
+            reset: Called with the racing number whose laps were dropped, or
+                   None when every driver's laps were.
+
+        Returns:
+            A function that removes the listeners again.
+        """
+        self._listeners.append(listener)
+        if reset is not None:
+            self._reset_listeners.append(reset)
+
+        def unsubscribe() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if reset in self._reset_listeners:
+                self._reset_listeners.remove(reset)
+
+        return unsubscribe
+
+    def reset(self, racing_number: Optional[str] = None) -> None:
+        """
+        Drop the laps of one driver, or of every driver.
+
+        A dropped driver starts over from the next lap count seen.
+        """
+        if racing_number is None:
+            self._drivers.clear()
+            self._stints.clear()
+        elif racing_number in self._drivers:
+            del self._drivers[racing_number]
+            self._stints.pop(racing_number, None)
+        self._notify_reset(racing_number)
+
+    # --- Updates ---
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook: record laps from `TimingData` and `TimingApp` events."""
+        if message.data_type == LiveTimingEvent.TIMING_DATA:
+            self.apply_timing(message)
+        elif message.data_type == LiveTimingEvent.TIMING_APP:
+            self.apply_stints(message)
+        elif message.data_type == LiveTimingEvent.SESSION_INFO:
+            self.apply_session(message)
+
+    def apply_session(self, info: "SessionInfo") -> None:
+        """Drop every driver's laps when the session changes."""
+        session = (info.key, info.path)
+        if self._session is not None and session != self._session:
+            self.reset()
+        self._session = session
+
+    def apply_timing(self, timing: "TimingData") -> None:
+        """Record the laps completed since the previous `TimingData`."""
+        for num, line in timing.lines.items():
+            driver = self._drivers.get(num)
+            if driver is None:
+                driver = self._drivers[num] = _Driver(self._capacity)
+            elif driver.line is line:
+                continue
+            driver.line = line
+
+            if line.in_pit or line.pit_out:
+                driver.pit = True
+
+            laps = line.number_of_laps
+            if driver.laps is None:
+                driver.restart(line)
+            elif laps > driver.laps:
+                driver.laps = laps
+                self._record(num, driver, line)
+            elif laps == driver.laps:
+                self._amend(num, driver, line)
+            else:
+                # A new session or a feed reset.
+                driver.restart(line)
+                self._notify_reset(num)
+
+    def apply_stints(self, timing_app: "TimingApp") -> None:
+        """Track the current stint of every driver."""
+        for num, line in timing_app.lines.items():
+            if self._stints.get(num) is line or not line.stints:
+                continue
+            self._stints[num] = line
+
+            driver = self._drivers.get(num)
+            if driver is None:
+                driver = self._drivers[num] = _Driver(self._capacity)
+
+            index = len(line.stints) - 1
+            stint = line.stints.get(str(index))
+            if stint is None:
+                continue
+            if index != driver.stint:
+                driver.stint = index
+                driver.stint_laps = 0
+            driver.compound = _CODES.get(stint.compound, -1)
+            driver.start_laps = stint.start_laps
+
+    def _record(self, num: str, driver: _Driver, line: "DriverTiming") -> None:
+        lap_ms = _lap_ms(line)
+        if lap_ms == driver.last_ms:
+            lap_ms = math.nan  # Still the previous lap's time.
+        driver.previous_ms = driver.last_ms
+        driver.last_ms = lap_ms
+
+        driver.stint_laps += 1
+        driver.ring.append(
+            lap=line.number_of_laps,
+            lap_ms=lap_ms,
+            sectors=[_ms(s.value_ms) for s in line.sectors[:SECTORS]],
+            compound=driver.compound,
+            stint=driver.stint,
+            tyre_age=driver.start_laps + driver.stint_laps if driver.stint >= 0 else 0,
+            pit=driver.pit,
+        )
+        driver.pit = bool(line.in_pit or line.pit_out)
+        self.recorded += 1
+        self._notify(num, driver.ring, driver.ring.last)
+
+    def _amend(self, num: str, driver: _Driver, line: "DriverTiming") -> None:
+        # The lap time and final sector may trail the lap count by a message.
+        ring = driver.ring
+        row = ring.last
+        if row is None or ring.lap[row] != line.number_of_laps:
+            return
+        if math.isnan(ring.sectors[row, -1]) and len(line.sectors) >= SECTORS:
+            ring.sectors[row, -1] = _ms(line.sectors[SECTORS - 1].value_ms)
+
+        lap_ms = _lap_ms(line)
+        if (
+            math.isnan(lap_ms)
+            or lap_ms == driver.previous_ms
+            or lap_ms == driver.last_ms
+        ):
+            return
+        driver.last_ms = lap_ms
+        ring.lap_ms[row] = lap_ms
+        self._notify(num, ring, row)
+
+    def _notify(self, num: str, ring: LapRing, row: int) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(num, ring, row)
+            except Exception:
+                _LOGGER.exception(
+                    "[%s] Failed to notify lap listener: %s", DOMAIN, listener
+                )
+
+    def _notify_reset(self, racing_number: Optional[str]) -> None:
+        for listener in list(self._reset_listeners):
+            try:
+                listener(racing_number)
+            except Exception:
+                _LOGGER.exception(
+                    "[%s] Failed to notify lap listener: %s", DOMAIN, listener
+                )
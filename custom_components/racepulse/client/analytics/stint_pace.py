@@ -0,0 +1,171 @@
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..enums import TyreCompound
+from .lap_history import COMPOUNDS, LapHistory, LapRing
+
+
+class StintStats:
+    """
+    Running least-squares fit of lap time against lap number for one stint.
+
+    Keeps the means and co-moments of Welford's algorithm, so adding a lap
+    is O(1) and numerically stable however long the stint runs.
+
+    Attributes:
+        stint: Index of the stint in the driver's `TimingApp` stints.
+        compound: The tyre compound, or None if unknown.
+        laps: Number of laps in the fit.
+    """
+
+    __slots__ = ("stint", "compound", "laps", "_mean_x", "_mean_y", "_m2_x", "_c_xy")
+
+    def __init__(self, stint: int, compound: Optional[TyreCompound]) -> None:
+        self.stint = stint
+        self.compound = compound
+        self.laps = 0
+        self._mean_x = 0.0
+        self._mean_y = 0.0
+        self._m2_x = 0.0
+        self._c_xy = 0.0
+
+    def add(self, lap: int, lap_ms: float) -> None:
+        """Add one lap to the fit."""
+        self.laps += 1
+        dx = lap - self._mean_x
+        self._mean_x += dx / self.laps
+        self._mean_y += (lap_ms - self._mean_y) / self.laps
+        self._m2_x += dx * (lap - self._mean_x)
+        self._c_xy += dx * (lap_ms - self._mean_y)
+
+    def remove(self, lap: int, lap_ms: float) -> None:
+        """Take a lap added before out of the fit again."""
+        if self.laps <= 1:
+            self.laps = 0
+            self._mean_x = self._mean_y = self._m2_x = self._c_xy = 0.0
+            return
+        mean_x = (self._mean_x * self.laps - lap) / (self.laps - 1)
+        mean_y = (self._mean_y * self.laps - lap_ms) / (self.laps - 1)
+        self._m2_x -= (lap - mean_x) * (lap - self._mean_x)
+        self._c_xy -= (lap - mean_x) * (lap_ms - self._mean_y)
+        self._mean_x, self._mean_y = mean_x, mean_y
+        self.laps -= 1
+
+    @property
+    def mean_pace_ms(self) -> Optional[float]:
+        """Average lap time in milliseconds, or None without laps."""
+        return self._mean_y if self.laps else None
+
+    @property
+    def slope_ms(self) -> Optional[float]:
+        """Lap time lost per lap in milliseconds, or None below two laps."""
+        # Removals leave float residue in the sums, so count laps instead.
+        if self.laps < 2 or self._m2_x <= 0:
+            return None
+        return self._c_xy / self._m2_x
+
+    @property
+    def degradation(self) -> Optional[float]:
+        """Lap time lost per lap in seconds, or None below two laps."""
+        slope = self.slope_ms
+        return None if slope is None else slope / 1000
+
+    def predict_ms(self, lap: int) -> Optional[float]:
+        """Lap time the fit expects on a given lap, or None below two laps."""
+        slope = self.slope_ms
+        if slope is None:
+            return None
+        return self._mean_y + slope * (lap - self._mean_x)
+
+    def __repr__(self) -> str:
+        return (
+            f"StintStats(stint={self.stint}, compound={self.compound}, "
+            f"laps={self.laps}, mean_pace_ms={self.mean_pace_ms}, "
+            f"degradation={self.degradation})"
+        )
+
+
+class StintPace:
+    """
+    Tyre degradation and pace of every stint, updated lap by lap.
+
+    Listens to a `LapHistory` and adds each completed lap to the statistics
+    of the stint it was driven in, in O(1). Laps with a pit flag (in and out
+    laps), without a lap time, or recorded before the driver's stint was
+    known are left out of the fit. A lap time corrected by the history
+    replaces the one in the fit, and laps the history drops (a new session)
+    are dropped here too.
+
+    Example:
+        history = LapHistory()
+        pace = StintPace(history)
+        client.attach(
+            history,
+            topics={
+                LiveTimingEvent.TIMING_DATA,
+                LiveTimingEvent.TIMING_APP,
+                LiveTimingEvent.SESSION_INFO,
+            },
+        )
+        ...
+        pace.current("44").degradation  # e.g. 0.085 s/lap
+    """
+
+    def __init__(self, history: LapHistory) -> None:
+        self._stints: Dict[str, List[StintStats]] = {}
+        # The latest lap in the fit per driver: lap, lap time and its stint.
+        self._counted: Dict[str, Tuple[int, float, StintStats]] = {}
+        self._unsubscribe: Optional[Callable[[], None]] = history.subscribe(
+            self.add, self.reset
+        )
+
+    def close(self) -> None:
+        """Stop listening to the lap history."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    # --- Reading ---
+    def stints(self, racing_number: str) -> Tuple[StintStats, ...]:
+        """The stints of a driver with at least one lap in the fit, in order."""
+        return tuple(self._stints.get(racing_number, ()))
+
+    def current(self, racing_number: str) -> Optional[StintStats]:
+        """The latest stint of a driver, or None if none has laps yet."""
+        stints = self._stints.get(racing_number)
+        return stints[-1] if stints else None
+
+    # --- Updates ---
+    def add(self, racing_number: str, ring: LapRing, row: int) -> None:
+        """Lap listener: add a recorded lap to its stint, or correct it."""
+        lap = int(ring.lap[row])
+        lap_ms = float(ring.lap_ms[row])
+        stint = int(ring.stint[row])
+        if ring.pit[row] or stint < 0 or math.isnan(lap_ms):
+            return
+
+        stints = self._stints.setdefault(racing_number, [])
+        counted = self._counted.get(racing_number)
+        if counted is not None:
+            counted_lap, counted_ms, stats = counted
+            if counted_lap > lap or (counted_lap == lap and counted_ms == lap_ms):
+                return
+            if counted_lap == lap:
+                stats.remove(lap, counted_ms)
+                if not stats.laps and stats is stints[-1]:
+                    stints.pop()
+
+        if not stints or stints[-1].stint != stint:
+            code = int(ring.compound[row])
+            stints.append(StintStats(stint, COMPOUNDS[code] if code >= 0 else None))
+        stints[-1].add(lap, lap_ms)
+        self._counted[racing_number] = (lap, lap_ms, stints[-1])
+
+    def reset(self, racing_number: Optional[str] = None) -> None:
+        """Reset listener: forget the stints of one driver, or of all."""
+        if racing_number is None:
+            self._stints.clear()
+            self._counted.clear()
+        else:
+            self._stints.pop(racing_number, None)
+            self._counted.pop(racing_number, None)
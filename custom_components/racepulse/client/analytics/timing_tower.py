@@ -0,0 +1,287 @@
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..enums import LiveTimingEvent
+from ...helpers import parse_int
+
+if TYPE_CHECKING:
+    from ..interfaces.event import Event
+    from ..interfaces.notifiable import Notifiable
+    from ..models import DriverTiming, TimingData
+
+SECTORS = 3
+
+
+def _ms(value: Optional[int]) -> float:
+    return math.nan if value is None else value
+
+
+class TimingTower:
+    """
+    Columnar mirror of `TimingData` for vectorized leaderboard math.
+
+    Every driver gets a fixed slot on first sight, and each column is a NumPy
+    array indexed by slot. Times are float milliseconds with NaN where the
+    feed has no time (e.g. a lapped car's gap); counts and positions are
+    integers, with position 0 meaning unknown. Only the first `size` slots
+    are in use; the column properties return views of exactly those.
+
+    The tower is an observer of the `TimingData` topic and rewrites, in
+    place, only the slots whose `DriverTiming` changed. Incrementally parsed
+    events share unchanged lines with the previous event, so most updates
+    touch one or two slots. Queries are computed once per change and shared
+    by every sensor asking until the next one.
+
+    Requires NumPy, which Home Assistant ships with.
+
+    Example:
+        tower = TimingTower()
+        client.attach(tower, topics={LiveTimingEvent.TIMING_DATA})
+        ...
+        for ahead, behind, interval_ms in tower.battles(threshold_ms=1000):
+            ...
+    """
+
+    def __init__(self, capacity: int = 24):
+        self._slots: Dict[str, int] = {}
+        self._seen: Dict[str, Any] = {}
+        self._numbers = np.empty(capacity, dtype=object)
+        self._position = np.zeros(capacity, dtype=np.int16)
+        self._gap_to_leader = np.full(capacity, np.nan)
+        self._interval = np.full(capacity, np.nan)
+        self._laps = np.zeros(capacity, dtype=np.int16)
+        self._pit_stops = np.zeros(capacity, dtype=np.int16)
+        self._last_lap = np.full(capacity, np.nan)
+        self._best_lap = np.full(capacity, np.nan)
+        self._sectors = np.full((capacity, SECTORS), np.nan)
+        self._in_pit = np.zeros(capacity, dtype=bool)
+        self._retired = np.zeros(capacity, dtype=bool)
+        self._active = np.zeros(capacity, dtype=bool)
+        self._order: Optional[np.ndarray] = None
+        self._gaps: Optional[np.ndarray] = None
+        self.updates = 0
+
+    # --- Columns ---
+    @property
+    def size(self) -> int:
+        """Number of slots in use."""
+        return len(self._slots)
+
+    @property
+    def racing_numbers(self) -> np.ndarray:
+        return self._numbers[: self.size]
+
+    @property
+    def position(self) -> np.ndarray:
+        return self._position[: self.size]
+
+    @property
+    def gap_to_leader(self) -> np.ndarray:
+        return self._gap_to_leader[: self.size]
+
+    @property
+    def interval(self) -> np.ndarray:
+        return self._interval[: self.size]
+
+    @property
+    def laps(self) -> np.ndarray:
+        return self._laps[: self.size]
+
+    @property
+    def pit_stops(self) -> np.ndarray:
+        return self._pit_stops[: self.size]
+
+    @property
+    def last_lap(self) -> np.ndarray:
+        return self._last_lap[: self.size]
+
+    @property
+    def best_lap(self) -> np.ndarray:
+        return self._best_lap[: self.size]
+
+    @property
+    def sectors(self) -> np.ndarray:
+        """Sector times of the current lap, shape `(size, 3)`."""
+        return self._sectors[: self.size]
+
+    @property
+    def in_pit(self) -> np.ndarray:
+        return self._in_pit[: self.size]
+
+    @property
+    def retired(self) -> np.ndarray:
+        return self._retired[: self.size]
+
+    @property
+    def active(self) -> np.ndarray:
+        """Whether the driver is in the latest `TimingData`."""
+        return self._active[: self.size]
+
+    def slot(self, racing_number: str) -> Optional[int]:
+        """The slot of a driver, or None if the tower has not seen them."""
+        return self._slots.get(racing_number)
+
+    # --- Updates ---
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook: mirror `TimingData` events."""
+        if message.data_type == LiveTimingEvent.TIMING_DATA:
+            self.apply(message)
+
+    def apply(self, timing: "TimingData") -> None:
+        """Write the lines that changed since the previous event into the columns."""
+        lines = timing.lines
+        for num, line in lines.items():
+            if self._seen.get(num) is line:
+                continue
+            self._seen[num] = line
+            self._write(self._slot_for(num), line)
+
+        if len(self._seen) > len(lines):
+            for num in [n for n in self._seen if n not in lines]:
+                del self._seen[num]
+                self._active[self._slots[num]] = False
+                self._order = self._gaps = None
+        self.updates += 1
+
+    def _slot_for(self, racing_number: str) -> int:
+        slot = self._slots.get(racing_number)
+        if slot is None:
+            slot = self._slots[racing_number] = len(self._slots)
+            if slot == len(self._numbers):
+                self._grow()
+            self._numbers[slot] = racing_number
+        return slot
+
+    def _grow(self) -> None:
+        # Double every column, padding with its empty value.
+        for name, empty in (
+            ("_numbers", None),
+            ("_position", 0),
+            ("_gap_to_leader", np.nan),
+            ("_interval", np.nan),
+            ("_laps", 0),
+            ("_pit_stops", 0),
+            ("_last_lap", np.nan),
+            ("_best_lap", np.nan),
+            ("_sectors", np.nan),
+            ("_in_pit", False),
+            ("_retired", False),
+            ("_active", False),
+        ):
+            column = getattr(self, name)
+            grown = np.full((len(column) * 2,) + column.shape[1:], empty, column.dtype)
+            grown[: len(column)] = column
+            setattr(self, name, grown)
+
+    def _write(self, slot: int, line: "DriverTiming") -> None:
+        self._order = self._gaps = None
+        self._active[slot] = True
+        self._position[slot] = parse_int(line.position)
+        self._gap_to_leader[slot] = _ms(
+            line.gap_to_leader_ms
+            if line.gap_to_leader_ms is not None
+            else line.time_diff_to_fastest_ms
+        )
+        self._interval[slot] = _ms(
+            line.interval_to_position_ahead_ms
+            if line.interval_to_position_ahead_ms is not None
+            else line.time_diff_to_position_ahead_ms
+        )
+        self._laps[slot] = line.number_of_laps
+        self._pit_stops[slot] = line.number_of_pit_stops
+        self._in_pit[slot] = line.in_pit
+        self._retired[slot] = line.retired
+        self._last_lap[slot] = _ms(line.last_lap_time and line.last_lap_time.value_ms)
+        self._best_lap[slot] = _ms(line.best_lap_time and line.best_lap_time.value_ms)
+
+        sectors = self._sectors[slot]
+        sectors[:] = np.nan
+        for i, sector in enumerate(line.sectors[:SECTORS]):
+            sectors[i] = _ms(sector.value_ms)
+
+    # --- Vectorized queries ---
+    def order(self) -> np.ndarray:
+        """
+        Slots of the classified drivers, from the leader backwards.
+
+        Computed once per change and shared by every caller until the next
+        one; the returned array is read-only.
+        """
+        if self._order is None:
+            position = self.position
+            slots = np.flatnonzero(self.active & (position > 0))
+            self._order = slots[np.argsort(position[slots], kind="stable")]
+            self._order.flags.writeable = False
+        return self._order
+
+    def gaps(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gaps to the leader, in running order.
+
+        Where the feed sends no gap to the leader, it is derived from the
+        nearest driver ahead that has one, plus the intervals in between.
+        A missing interval on the way (e.g. "1L") leaves the gap unknown.
+
+        Returns:
+            The slots as returned by `order()`, and each one's gap in ms
+            (read-only, cached like `order()`).
+        """
+        slots = self.order()
+        if self._gaps is None:
+            gaps = self._gap_to_leader[slots]
+            if len(slots):
+                known = ~np.isnan(gaps)
+                if not known[0]:
+                    gaps[0], known[0] = 0.0, True
+
+                intervals = self._interval[slots]
+                intervals[0] = 0.0  # The leader's own interval is "LAP n".
+                missing = np.isnan(intervals)
+                summed = np.cumsum(np.where(missing, 0.0, intervals))
+                holes = np.cumsum(missing)
+
+                # Index of the nearest driver at or ahead with a known gap.
+                anchor = np.maximum.accumulate(
+                    np.where(known, np.arange(len(slots)), 0)
+                )
+                derived = gaps[anchor] + summed - summed[anchor]
+                derived[holes != holes[anchor]] = np.nan
+                gaps = np.where(known, gaps, derived)
+            gaps.flags.writeable = False
+            self._gaps = gaps
+        return slots, self._gaps
+
+    def battles(self, threshold_ms: float = 1000.0) -> List[Tuple[str, str, float]]:
+        """
+        Pairs of consecutive drivers within `threshold_ms` of each other.
+
+        Returns:
+            `(ahead, behind, interval_ms)` tuples of racing numbers, in
+            running order.
+        """
+        slots = self.order()
+        intervals = self._interval[slots]
+        close = (np.flatnonzero(intervals[1:] <= threshold_ms) + 1).tolist()
+        if not close:
+            return []
+        numbers = self._numbers[slots].tolist()
+        intervals = intervals.tolist()
+        return [(numbers[i - 1], numbers[i], intervals[i]) for i in close]
+
+    def snapshot(self) -> np.ndarray:
+        """A copy of the position column, to compare against later."""
+        return self.position.copy()
+
+    def rank_changes(self, since: np.ndarray) -> np.ndarray:
+        """
+        Places gained (positive) or lost since a `snapshot()`, per slot.
+
+        Drivers without a known position at either time count as unchanged.
+        """
+        current = self.position
+        previous = np.zeros_like(current)
+        previous[: len(since)] = since[: len(current)]
+        known = (previous > 0) & (current > 0)
+        return np.where(known, previous.astype(np.int32) - current, 0)
@@ -0,0 +1,156 @@
+from datetime import timedelta
+import heapq
+import json
+import logging
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+import zlib
+
+from .decoder import inflate
+from .enums.live_timing_event import LiveTimingEvent
+from .event_factory import EventFactory
+from .interfaces.event import Event
+from .state import TopicStateStore
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STREAM_SUFFIX = ".jsonStream"
+
+# Each stream line starts with the session-relative time, e.g. "00:01:02.345{...}"
+_OFFSET = re.compile(r"(\d+):(\d{2}):(\d{2})\.(\d{1,3})")
+
+# (offset in ms, stream index, topic, payload); the stream index keeps merge stable.
+RawRecord = Tuple[int, int, LiveTimingEvent, Any]
+
+
+class ArchiveImporter:
+    """
+    Streams past sessions from a local mirror of the static live timing archive.
+
+    The archive stores one `<Topic>.jsonStream` file per topic and session,
+    under the session's `Path` (as in `SessionInfo.path` and `Session.path`):
+
+        <root>/2025/2025-10-05_Singapore_Grand_Prix/2025-10-05_Race/TimingData.jsonStream
+
+    Every line holds a session-relative timestamp followed by the topic's
+    partial update, exactly as it was sent on the live feed:
+
+        00:01:02.345{"Lines":{"44":{"Position":"1"}}}
+
+    Files are read line by line and the topics are merged by timestamp with
+    generators, so memory use stays flat regardless of session length. Updates
+    are merged into a `TopicStateStore` and parsed by `EventFactory`, just
+    like live data.
+
+    Example:
+        importer = ArchiveImporter("/data/livetiming/static")
+        for path in importer.sessions("2025"):
+            for offset, event in importer.iter_events(path):
+                store(path, offset, event)
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        topics: Optional[Iterable[LiveTimingEvent]] = None,
+    ):
+        self._root = Path(root)
+        self._topics = list(topics) if topics is not None else list(LiveTimingEvent)
+
+    def sessions(self, prefix: str = "") -> Iterator[str]:
+        """
+        Find the sessions available in the mirror.
+
+        Args:
+            prefix: Only search below this path (e.g. "2025" for one season).
+
+        Yields:
+            Session paths relative to the root, in sorted order.
+        """
+        seen = set()
+        for stream in sorted((self._root / prefix).rglob(f"*{STREAM_SUFFIX}")):
+            session = stream.parent.relative_to(self._root).as_posix() + "/"
+            if session not in seen:
+                seen.add(session)
+                yield session
+
+    def iter_topic(
+        self, session_path: str, topic: LiveTimingEvent, index: int = 0
+    ) -> Iterator[RawRecord]:
+        """
+        Stream the raw updates of one topic, in file order.
+
+        Compressed topics are inflated on the fly. Malformed lines are skipped.
+
+        Args:
+            session_path: The session path relative to the root.
+            topic: The topic to read.
+            index: Tie-breaker stored in each record for stable merging.
+
+        Yields:
+            `(offset_ms, index, topic, payload)` records.
+        """
+        path = self._root / session_path / f"{topic.value}{STREAM_SUFFIX}"
+        if not path.is_file():
+            return
+
+        # utf-8-sig strips the byte order mark the archive puts on the first line
+        with open(path, encoding="utf-8-sig") as f:
+            for line in f:
+                match = _OFFSET.match(line)
+                if not match:
+                    continue
+
+                hours, minutes, seconds, fraction = match.groups()
+                offset = (
+                    int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+                ) * 1000 + int(fraction.ljust(3, "0"))
+
+                try:
+                    payload = json.loads(line[match.end() :])
+                    if topic.compressed:
+                        payload = inflate(payload)
+                except (ValueError, zlib.error):
+                    _LOGGER.debug(
+                        "[%s] Skipping malformed %s line in %s", DOMAIN, topic, path
+                    )
+                    continue
+
+                yield offset, index, topic, payload
+
+    def iter_raw(self, session_path: str) -> Iterator[RawRecord]:
+        """Stream the raw updates of all topics, merged into time order."""
+        streams: List[Iterator[RawRecord]] = [
+            self.iter_topic(session_path, topic, index)
+            for index, topic in enumerate(self._topics)
+        ]
+        return heapq.merge(*streams, key=lambda record: record[:2])
+
+    def iter_events(self, session_path: str) -> Iterator[Tuple[timedelta, Event]]:
+        """
+        Stream the parsed events of a session, in time order.
+
+        Args:
+            session_path: The session path relative to the root.
+
+        Yields:
+            `(offset, event)` tuples, where `offset` is the time since the
+            start of the session's recording.
+        """
+        state = TopicStateStore()
+        previous: Dict[LiveTimingEvent, Event] = {}
+
+        for offset, _, topic, payload in self.iter_raw(session_path):
+            if topic.compressed:
+                parsed = EventFactory.parse(topic, payload)
+            else:
+                merged = state.apply(topic, payload)
+                parsed = EventFactory.parse_incremental(
+                    topic, previous.get(topic), merged, payload
+                )
+
+            if isinstance(parsed, Event):
+                previous[topic] = parsed
+                yield timedelta(milliseconds=offset), parsed
@@ -0,0 +1,145 @@
+import json
+import logging
+from typing import Any, Collection, Dict, Optional
+
+from .enums.live_timing_event import LiveTimingEvent
+from .interfaces.event import Event
+from .event_factory import EventFactory
+from .decoder import CompressedTopicDecoder
+from .state import TopicStateStore, touched_drivers
+from .subject import Subject
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BaseTimingClient(Subject):
+    """
+    Shared event pipeline of all live timing clients.
+
+    Turns raw SignalR frames into parsed events and delivers them to the
+    attached observers: snapshots and partial updates are merged into the
+    topic state store, compressed topics are inflated by the decoder, and the
+    merged state is parsed by `EventFactory`.
+
+    Subclasses decide where frames come from (the live websocket, a recorded
+    capture, ...) and pass each one to `_handle_frame()`.
+
+    In lazy mode, topics with a lazy view (see `client.views`) are delivered
+    as views over the merged state instead of being parsed up front, and the
+    state is kept copy-on-write so every view keeps seeing its own snapshot.
+    """
+
+    def __init__(self, lazy: bool = False) -> None:
+        super().__init__()
+        self._lazy = lazy
+        self._state = TopicStateStore(copy_on_write=lazy)
+        # Last event parsed per topic, the base of incremental parsing.
+        self._parsed: Dict[LiveTimingEvent, Event] = {}
+        self._decoder = CompressedTopicDecoder(self._emit)
+        self.events: int = 0
+
+    # ---------------- Event pipeline ----------------
+    def _reset_state(self) -> None:
+        """Forget the merged state and last parsed event of every topic."""
+        self._state.reset()
+        self._parsed.clear()
+
+    def _handle_frame(self, frame: str) -> Dict[str, Any]:
+        """
+        Process one raw SignalR text frame.
+
+        Args:
+            frame: The frame as received from the websocket.
+
+        Returns:
+            The decoded frame, for transport fields such as `"I"` or `"C"`.
+        """
+        payload = json.loads(frame)
+        if not isinstance(payload, dict):
+            return {}
+
+        # Full snapshots, sent in response to a subscribe.
+        result = payload.get("R")
+        if isinstance(result, dict):
+            for entry, data in result.items():
+                self._handle_topic(entry, data, snapshot=True)
+
+        # Partial updates pushed by the live feed.
+        for message in payload.get("M", []):
+            args = message.get("A", [])
+            if message.get("M") != "feed" or len(args) < 2:
+                continue
+            self._handle_topic(args[0], args[1])
+
+        return payload
+
+    def _handle_topic(self, entry: str, data: Any, snapshot: bool = False) -> None:
+        """
+        Merge a topic payload into the state store and notify observers.
+
+        Args:
+            entry: The topic name as sent by the feed (e.g. "TimingData").
+            data: The topic payload, either a full snapshot or a partial update.
+            snapshot: Whether `data` replaces the stored state instead of
+                      being merged into it.
+        """
+        event_type = LiveTimingEvent.try_from(entry)
+        if not event_type:
+            _LOGGER.debug("[%s] Unknown event type: %s", DOMAIN, entry)
+            return
+
+        # Compressed topics carry complete frames; inflate them off the loop.
+        if event_type.compressed:
+            self._decoder.submit(event_type, data)
+            return
+
+        if snapshot:
+            # Re-sent snapshots are mostly identical; only parse what changed.
+            delta = self._state.sync(event_type, data)
+            if delta is None:
+                _LOGGER.debug("[%s] Unchanged snapshot: %s", DOMAIN, event_type)
+                return
+            if delta is data:
+                delta = drivers = None
+            else:
+                drivers = touched_drivers(event_type, delta)
+            state = self._state.get(event_type)
+        else:
+            delta = data
+            drivers = touched_drivers(event_type, delta)
+            state = self._state.apply(event_type, delta)
+
+        self._emit(event_type, state, drivers, delta)
+
+    def _emit(
+        self,
+        event_type: LiveTimingEvent,
+        payload: Any,
+        drivers: Optional[Collection[str]] = None,
+        delta: Any = None,
+    ) -> None:
+        """
+        Parse a topic payload and notify observers on success.
+
+        Args:
+            event_type: The topic of the payload.
+            payload: The full (merged) state of the topic.
+            drivers: The racing numbers the update touches, if known.
+            delta: The partial update merged into `payload`, if any. Lets the
+                   parser rebuild only what changed since the last event.
+        """
+        if self._lazy:
+            parsed = EventFactory.parse_lazy(event_type, payload)
+        elif delta is None:
+            parsed = EventFactory.parse(event_type, payload)
+        else:
+            parsed = EventFactory.parse_incremental(
+                event_type, self._parsed.get(event_type), payload, delta
+            )
+
+        if isinstance(parsed, Event):
+            _LOGGER.debug("[%s] Parsed event: %s", DOMAIN, event_type)
+            self._parsed[event_type] = parsed
+            self.events += 1
+            self.notify(parsed, drivers)
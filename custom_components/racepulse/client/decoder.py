@@ -0,0 +1,133 @@
+import asyncio
+import base64
+import json
+import logging
+import zlib
+from typing import Any, Callable, List, Tuple
+
+from .enums.live_timing_event import LiveTimingEvent
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# A compressed topic payload waiting to be decoded, or its decoded result.
+Frame = Tuple[LiveTimingEvent, Any]
+
+
+def inflate(data: str) -> Any:
+    """
+    Decode a compressed topic payload (e.g. "CarData.z", "Position.z").
+
+    The feed sends these topics as base64-encoded, raw-deflated JSON.
+
+    Args:
+        data: The base64 string as received from the feed.
+
+    Returns:
+        The decoded JSON payload.
+    """
+    return json.loads(zlib.decompress(base64.b64decode(data), -zlib.MAX_WBITS))
+
+
+def inflate_batch(frames: List[Frame]) -> List[Frame]:
+    """
+    Decode several compressed payloads in one go.
+
+    Intended to run in a worker thread, so a single executor hop covers the
+    whole batch. Frames that fail to decode are logged and dropped.
+
+    Args:
+        frames: The `(event_type, data)` pairs to decode.
+
+    Returns:
+        The `(event_type, payload)` pairs that decoded successfully, in order.
+    """
+    decoded: List[Frame] = []
+    for event_type, data in frames:
+        try:
+            decoded.append((event_type, inflate(data)))
+        except (ValueError, TypeError, zlib.error) as ex:
+            _LOGGER.warning(
+                "[%s] Failed to decode %s payload: %s", DOMAIN, event_type, ex
+            )
+    return decoded
+
+
+class CompressedTopicDecoder:
+    """
+    Decodes compressed topics off the event loop.
+
+    Frames are queued by `submit()` and decoded by `run()` in the default
+    executor. Every frame that is already waiting when the worker becomes free
+    is decoded in the same executor hop, up to `max_batch` frames. Decoded
+    payloads are handed to `callback` on the event loop, in arrival order.
+
+    The queue is bounded; when decoding falls behind, the oldest frame is
+    dropped since newer telemetry supersedes it anyway.
+
+    Example:
+        decoder = CompressedTopicDecoder(client.handle_decoded)
+        task = asyncio.create_task(decoder.run())
+        decoder.submit(LiveTimingEvent.CAR_DATA, "7ZS9bsIwEIDfx...")
+    """
+
+    MAX_BATCH = 16
+    MAX_PENDING = 256
+
+    def __init__(
+        self,
+        callback: Callable[[LiveTimingEvent, Any], None],
+        max_batch: int = MAX_BATCH,
+        max_pending: int = MAX_PENDING,
+    ):
+        self._callback = callback
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[Frame] = asyncio.Queue(maxsize=max_pending)
+        self.dropped: int = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of frames waiting to be decoded."""
+        return self._queue.qsize()
+
+    def submit(self, event_type: LiveTimingEvent, data: str) -> None:
+        """Queue a compressed payload for decoding."""
+        try:
+            self._queue.put_nowait((event_type, data))
+        except asyncio.QueueFull:
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self._queue.put_nowait((event_type, data))
+            self.dropped += 1
+
+    async def join(self) -> None:
+        """Wait until every submitted frame has been decoded and dispatched."""
+        await self._queue.join()
+
+    async def run(self) -> None:
+        """Decode queued frames until cancelled."""
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self._max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+
+                for event_type, payload in await loop.run_in_executor(
+                    None, inflate_batch, batch
+                ):
+                    self._dispatch(event_type, payload)
+
+                for _ in batch:
+                    self._queue.task_done()
+        except asyncio.CancelledError:
+            _LOGGER.debug("[%s] Decoder task cancelled", DOMAIN)
+
+    def _dispatch(self, event_type: LiveTimingEvent, payload: Any) -> None:
+        try:
+            self._callback(event_type, payload)
+        except Exception:
+            _LOGGER.exception(
+                "[%s] Failed to handle decoded %s payload", DOMAIN, event_type
+            )
@@ -2,5 +2,13 @@
 
 from .event import register_event, _EVENT_REGISTRY
 from .parser import register_parser, _PARSER_REGISTRY
+from .view import register_view, _VIEW_REGISTRY
 
-__all__ = ["register_event", "register_parser", "_EVENT_REGISTRY", "_PARSER_REGISTRY"]
+__all__ = [
+    "register_event",
+    "register_parser",
+    "register_view",
+    "_EVENT_REGISTRY",
+    "_PARSER_REGISTRY",
+    "_VIEW_REGISTRY",
+]
@@ -17,8 +17,11 @@ def register_event(
 
     Example:
         @register_event(LiveTimingEvent.WEATHER)
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class WeatherData(Event):
+            data_type: Final[LiveTimingEvent] = field(
+                default=LiveTimingEvent.WEATHER_DATA, init=False
+            )
             ...
 
     Args:
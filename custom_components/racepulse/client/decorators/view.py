@@ -0,0 +1,42 @@
+from typing import Callable, Dict, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..enums import LiveTimingEvent
+    from ..interfaces import Event
+
+# Registry of lazy view classes keyed by their LiveTimingEvent type
+_VIEW_REGISTRY: Dict["LiveTimingEvent", Type["Event"]] = {}
+
+
+def register_view(
+    event_type: "LiveTimingEvent",
+) -> Callable[[Type["Event"]], Type["Event"]]:
+    """
+    Decorator to register a lazy view class for a given LiveTimingEvent type.
+
+    Example:
+        @register_view(LiveTimingEvent.TIMING_DATA)
+        class TimingDataView(LazyView, Event):
+            ...
+
+    Views are used instead of the registered parser when a client runs in
+    lazy mode. Topics without a view are always parsed eagerly.
+
+    Args:
+        event_type: A member of the `LiveTimingEvent` enum representing the event to handle.
+
+    Returns:
+        The same class, after registration.
+    """
+
+    def _wrap(cls: Type["Event"]) -> Type["Event"]:
+        if event_type in _VIEW_REGISTRY:
+            existing = _VIEW_REGISTRY[event_type].__name__
+            print(
+                f"[register_view] Warning: Overwriting existing view for {event_type} (was {existing})"
+            )
+
+        _VIEW_REGISTRY[event_type] = cls
+        return cls
+
+    return _wrap
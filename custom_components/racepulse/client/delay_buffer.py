@@ -0,0 +1,149 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Tuple
+
+from .enums.live_timing_event import LiveTimingEvent
+from .subject import Subject
+
+if TYPE_CHECKING:
+    from .interfaces.event import Event
+    from .interfaces.notifiable import Notifiable
+
+_LOGGER = logging.getLogger(__name__)
+
+# (topic, coalescing slot) of a pending event.
+_Key = Tuple[LiveTimingEvent, int]
+
+
+class DelayBuffer(Subject):
+    """
+    Holds events back for a fixed delay before passing them on.
+
+    Lets sensors follow a TV broadcast that lags behind the live feed. The
+    buffer attaches to a client like any other observer, and observers attach
+    to the buffer exactly as they would to the client. Each event is released
+    `delay` seconds after it arrived.
+
+    Pending events live in one heap ordered by release time, driven by a
+    single `call_at` timer for the earliest one. Since every event carries
+    the full merged state of its topic, an event arriving while an older one
+    of the same topic from the same `coalesce_window` is still waiting simply
+    replaces it. Memory therefore stays bounded by the number of topics times
+    `delay / coalesce_window`, however busy the feed is.
+
+    The drivers each event touches are kept with it, so driver-filtered
+    observers only wake up for their drivers. A coalesced event touches the
+    drivers of every event it replaced.
+
+    Example:
+        buffer = DelayBuffer(delay=30)
+        client.attach(buffer)
+        buffer.attach(sensor, topics={LiveTimingEvent.TIMING_DATA})
+    """
+
+    COALESCE_WINDOW = 1.0  # Seconds of updates per topic collapsed into one
+
+    def __init__(self, delay: float, coalesce_window: float = COALESCE_WINDOW):
+        super().__init__()
+        if delay < 0:
+            raise ValueError("delay must not be negative")
+        if coalesce_window <= 0:
+            raise ValueError("coalesce_window must be positive")
+
+        self._delay = delay
+        self._window = coalesce_window
+        self._heap: List[Tuple[float, int, _Key]] = []
+        # key -> [release time, event, drivers touched]
+        self._pending: Dict[_Key, List] = {}
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._drain: Optional[asyncio.Task] = None
+        self.released = 0
+        self.coalesced = 0
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be released."""
+        return len(self._pending)
+
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook: hold back an event whose drivers are unknown."""
+        self.push(message)
+
+    def push(self, message: "Event", drivers: Optional[Collection[str]] = None) -> None:
+        """
+        Schedule an event for release `delay` seconds from now.
+
+        Must be called from the event loop.
+
+        Args:
+            message: The event.
+            drivers: The racing numbers the event touches, or None if unknown.
+        """
+        if not self._delay:
+            self.notify(message, drivers)
+            return
+
+        loop = asyncio.get_running_loop()
+        due = loop.time() + self._delay
+        key = (message.data_type, int(due // self._window))
+
+        if entry := self._pending.get(key):
+            # The heap keeps the old release time; `_release` re-queues it.
+            entry[0] = due
+            entry[1] = message
+            # An empty set is a topic-level update, delivered to everyone.
+            if entry[2] and drivers:
+                entry[2] = frozenset(entry[2]).union(drivers)
+            else:
+                entry[2] = None
+            self.coalesced += 1
+            return
+
+        self._pending[key] = [due, message, drivers]
+        heapq.heappush(self._heap, (due, next(self._seq), key))
+        self._schedule(loop)
+
+    def close(self) -> None:
+        """Cancel the timer and drop all pending events."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._heap.clear()
+        self._pending.clear()
+        self._stop_queues()
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Arm the timer for the earliest pending event, unless it is armed."""
+        if self._timer is None and self._heap:
+            self._timer = loop.call_at(self._heap[0][0], self._release)
+
+    def _release(self) -> None:
+        """Timer callback: notify observers of every event that is due."""
+        self._timer = None
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+
+        while self._heap and self._heap[0][0] <= now:
+            due, _, key = heapq.heappop(self._heap)
+            entry = self._pending[key]
+            if entry[0] > due:
+                # Replaced by a later event of the same topic.
+                heapq.heappush(self._heap, (entry[0], next(self._seq), key))
+                continue
+
+            del self._pending[key]
+            self.released += 1
+            self.notify(entry[1], entry[2])
+
+        # Apply back-pressure from observers using the BLOCK policy.
+        if self._blocked and (self._drain is None or self._drain.done()):
+            self._drain = loop.create_task(self._drain_blocked())
+
+        self._schedule(loop)
@@ -1,5 +1,19 @@
 """Enum definitions for the RacePulse F1 client."""
 
+from .interned_enum import InternedEnum
 from .live_timing_event import LiveTimingEvent
+from .overflow_policy import OverflowPolicy
+from .race_control import RaceControlCategory, RaceControlFlag, RaceControlScope
+from .session_status import SessionStatus
+from .tyre_compound import TyreCompound
 
-___all__ = ["LiveTimingEvent"]
+__all__ = [
+    "InternedEnum",
+    "LiveTimingEvent",
+    "OverflowPolicy",
+    "RaceControlCategory",
+    "RaceControlFlag",
+    "RaceControlScope",
+    "SessionStatus",
+    "TyreCompound",
+]
@@ -0,0 +1,55 @@
+from enum import Enum
+from typing import Any, Optional, Type, TypeVar
+
+E = TypeVar("E", bound="InternedEnum")
+
+
+class InternedEnum(str, Enum):
+    """
+    A string enum that also accepts values it does not declare.
+
+    Feed values outside the declared members (e.g. a new tyre compound or
+    flag) become pseudo-members on first sight. Pseudo-members are stored in
+    the enum's value table, so every later occurrence of the value returns the
+    same object. Parsed models therefore hold one shared object per distinct
+    value, and comparing them is an identity check.
+
+    Pseudo-members are not listed when iterating over the enum.
+
+    Usage:
+        >>> from custom_components.racepulse.client.enums import TyreCompound
+        >>> TyreCompound("SOFT") is TyreCompound.SOFT
+        True
+        >>> TyreCompound("HYPERSOFT") is TyreCompound("HYPERSOFT")
+        True
+    """
+
+    def __str__(self) -> str:
+        return self.value
+
+    @classmethod
+    def _missing_(cls, value: Any) -> Optional["InternedEnum"]:
+        if not isinstance(value, str):
+            return None
+
+        member = str.__new__(cls, value)
+        member._name_ = value
+        member._value_ = value
+        # Later lookups of the value hit the table before reaching `_missing_`.
+        return cls._value2member_map_.setdefault(value, member)
+
+    @classmethod
+    def parse(cls: Type[E], value: Any) -> Optional[E]:
+        """
+        Return the member for a raw feed value, or None for a missing value.
+
+        Example:
+            >>> from custom_components.racepulse.client.enums import RaceControlFlag
+            >>> RaceControlFlag.parse("YELLOW")
+            <RaceControlFlag.YELLOW: 'YELLOW'>
+            >>> RaceControlFlag.parse(None) is None
+            True
+        """
+        if value is None or value == "":
+            return None
+        return cls(str(value))
@@ -27,9 +27,11 @@ class LiveTimingEvent(str, Enum):
         'WeatherData'
     """
 
+    CAR_DATA = "CarData.z"
     DRIVER_LIST = "DriverList"
     EXTRAPOLATED_CLOCK = "ExtrapolatedClock"
     HEARTBEAT = "Heartbeat"
+    POSITION = "Position.z"
     RACE_CONTROL_MESSAGES = "RaceControlMessages"
     SESSION_INFO = "SessionInfo"
     TEAM_RADIO = "TeamRadio"
@@ -43,6 +45,17 @@ class LiveTimingEvent(str, Enum):
         """Return the raw event string (e.g. 'WeatherData')."""
         return self.value
 
+    @property
+    def compressed(self) -> bool:
+        """
+        Whether the topic is sent as base64-encoded, raw-deflated JSON.
+
+        Example:
+            >>> LiveTimingEvent.CAR_DATA.compressed
+            True
+        """
+        return self.value.endswith(".z")
+
     @classmethod
     def try_from(cls, value: str) -> Optional["LiveTimingEvent"]:
         """
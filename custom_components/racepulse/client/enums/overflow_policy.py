@@ -0,0 +1,21 @@
+from enum import Enum
+
+
+class OverflowPolicy(str, Enum):
+    """
+    What an async observer's queue does when a new event arrives while it is full.
+
+    Usage:
+        >>> OverflowPolicy.COALESCE.value
+        'coalesce'
+    """
+
+    # Discard the oldest queued event to make room for the new one.
+    DROP_OLDEST = "drop_oldest"
+    # Keep only the latest queued event per topic; drop the oldest topic if still full.
+    COALESCE = "coalesce"
+    # Make the producer wait until the observer has caught up.
+    BLOCK = "block"
+
+    def __str__(self) -> str:
+        return self.value
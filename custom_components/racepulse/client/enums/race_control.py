@@ -0,0 +1,52 @@
+from .interned_enum import InternedEnum
+
+
+class RaceControlCategory(InternedEnum):
+    """
+    General category of a race control message.
+
+    Usage:
+        >>> RaceControlCategory("Flag")
+        <RaceControlCategory.FLAG: 'Flag'>
+    """
+
+    FLAG = "Flag"
+    OTHER = "Other"
+    DRS = "Drs"
+    CAR_EVENT = "CarEvent"
+    SAFETY_CAR = "SafetyCar"
+
+
+class RaceControlFlag(InternedEnum):
+    """
+    Flag shown by a race control message of the `Flag` category.
+
+    Usage:
+        >>> RaceControlFlag("DOUBLE YELLOW")
+        <RaceControlFlag.DOUBLE_YELLOW: 'DOUBLE YELLOW'>
+    """
+
+    GREEN = "GREEN"
+    YELLOW = "YELLOW"
+    DOUBLE_YELLOW = "DOUBLE YELLOW"
+    RED = "RED"
+    BLUE = "BLUE"
+    CLEAR = "CLEAR"
+    CHEQUERED = "CHEQUERED"
+    BLACK = "BLACK"
+    BLACK_AND_WHITE = "BLACK AND WHITE"
+    BLACK_AND_ORANGE = "BLACK AND ORANGE"
+
+
+class RaceControlScope(InternedEnum):
+    """
+    Part of the track or field a race control message applies to.
+
+    Usage:
+        >>> RaceControlScope("Sector")
+        <RaceControlScope.SECTOR: 'Sector'>
+    """
+
+    TRACK = "Track"
+    SECTOR = "Sector"
+    DRIVER = "Driver"
@@ -0,0 +1,18 @@
+from .interned_enum import InternedEnum
+
+
+class SessionStatus(InternedEnum):
+    """
+    Status of a session, as sent in `SessionInfo` and `SessionStatus`.
+
+    Usage:
+        >>> SessionStatus("Started")
+        <SessionStatus.STARTED: 'Started'>
+    """
+
+    INACTIVE = "Inactive"
+    STARTED = "Started"
+    ABORTED = "Aborted"
+    FINISHED = "Finished"
+    FINALISED = "Finalised"
+    ENDS = "Ends"
@@ -0,0 +1,20 @@
+from .interned_enum import InternedEnum
+
+
+class TyreCompound(InternedEnum):
+    """
+    Tyre compound of a stint, as sent in `TimingAppData`.
+
+    Usage:
+        >>> TyreCompound("MEDIUM")
+        <TyreCompound.MEDIUM: 'MEDIUM'>
+    """
+
+    SOFT = "SOFT"
+    MEDIUM = "MEDIUM"
+    HARD = "HARD"
+    INTERMEDIATE = "INTERMEDIATE"
+    WET = "WET"
+    # Sent before the compound of a new stint is known.
+    UNKNOWN = "UNKNOWN"
+    TEST_UNKNOWN = "TEST_UNKNOWN"
@@ -1,9 +1,27 @@
-from typing import Any, Dict, Union, Type
+import logging
+from typing import Any, Callable, Dict, Optional, Union
 from datetime import datetime, timezone
 from .enums.live_timing_event import LiveTimingEvent
-from .interfaces.event_parser import _PARSER_REGISTRY
+from .decorators import _PARSER_REGISTRY, _VIEW_REGISTRY
 from .interfaces.event import Event
+from .interfaces.event_parser import EventParser
 from .models.raw_timing_event import RawTimingEvent
+from . import parsers  # noqa: F401 - populates _PARSER_REGISTRY
+from . import views  # noqa: F401 - populates _VIEW_REGISTRY
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Topic string -> bound `parse_payload` of a shared parser instance.
+# `LiveTimingEvent` members hash and compare like their string value.
+_DISPATCH: Dict[str, Callable[[Any], Event]] = {}
+
+# Topic string -> bound `parse_incremental`, for parsers that override it.
+_INCREMENTAL: Dict[str, Callable[[Event, Any, Any], Event]] = {}
+
+# Topic string -> parser class name, for error reports. Generated schema
+# parsers are plain functions, so the name cannot come from the callable.
+_NAMES: Dict[str, str] = {}
 
 
 class EventFactory:
@@ -13,10 +31,30 @@ class EventFactory:
     Each parser should be registered with:
         @register_parser(LiveTimingEvent.<EVENT_TYPE>)
 
+    The registry is compiled once into a dispatch table holding one parser
+    instance per topic, so parsing an event is a single dict lookup and call.
+
     If no parser exists for the event type, or if parsing fails, this factory
     returns a fallback `RawTimingEvent` instance containing the raw payload.
     """
 
+    @staticmethod
+    def compile() -> None:
+        """
+        (Re)build the dispatch table from `_PARSER_REGISTRY`.
+
+        Called on import; call it again after registering parsers later on.
+        """
+        _DISPATCH.clear()
+        _INCREMENTAL.clear()
+        _NAMES.clear()
+        for event_type, parser_cls in _PARSER_REGISTRY.items():
+            parser = parser_cls()
+            _NAMES[event_type.value] = parser_cls.__name__
+            _DISPATCH[event_type.value] = parser.parse_payload
+            if parser_cls.parse_incremental is not EventParser.parse_incremental:
+                _INCREMENTAL[event_type.value] = parser.parse_incremental
+
     @staticmethod
     def parse(
         event_type: LiveTimingEvent, raw: Dict[str, Any]
@@ -32,27 +70,87 @@ class EventFactory:
             A parsed dataclass instance if a parser is registered and succeeds,
             otherwise a fallback `RawTimingEvent`.
         """
-        from .interfaces import EventParser
+        parse_payload = _DISPATCH.get(event_type)
 
-        parser_cls: Type[EventParser] | None = _PARSER_REGISTRY.get(event_type)
+        # Try to use a registered parser
+        if parse_payload is not None:
+            try:
+                return parse_payload(raw)
+            except Exception as ex:
+                _LOGGER.warning(
+                    "[%s] Parser %s failed for %s: %r",
+                    DOMAIN,
+                    _NAMES.get(event_type),
+                    event_type,
+                    ex,
+                )
 
-        # Build a fallback RawTimingEvent immediately
-        raw_event = RawTimingEvent(
+        # Fallback: return the unparsed event wrapper
+        return RawTimingEvent(
             event_type=event_type,
             payload=raw,
             datetime_utc=datetime.now(timezone.utc),
         )
 
-        # Try to use a registered parser
-        if parser_cls:
-            parser = parser_cls()
-            try:
-                return parser.parse(raw_event)
-            except Exception as ex:
-                parser_name = parser_cls.__name__
-                print(
-                    f"[EventFactory] ❌ Parser '{parser_name}' failed for {event_type}: {repr(ex)}"
-                )
+    @staticmethod
+    def parse_incremental(
+        event_type: LiveTimingEvent,
+        previous: Optional[Event],
+        payload: Any,
+        delta: Any,
+    ) -> Union[Event, RawTimingEvent]:
+        """
+        Parse a topic after a partial update, reusing the previous event.
 
-        # Fallback: return the unparsed event wrapper
-        return raw_event
+        Falls back to a full `parse()` when the topic has no incremental
+        parser, or no previous event of the same topic is known.
+
+        Args:
+            event_type: The `LiveTimingEvent` type representing this event.
+            previous: The last event parsed for this topic, if any.
+            payload: The merged state of the topic, after the update.
+            delta: The partial update that was merged into the state.
+
+        Returns:
+            A parsed dataclass instance, or a fallback `RawTimingEvent`.
+        """
+        parse_incremental = _INCREMENTAL.get(event_type)
+        if parse_incremental is None or previous is None:
+            return EventFactory.parse(event_type, payload)
+
+        try:
+            return parse_incremental(previous, payload, delta)
+        except Exception as ex:
+            _LOGGER.warning(
+                "[%s] Incremental parser %s failed for %s: %r",
+                DOMAIN,
+                _NAMES.get(event_type),
+                event_type,
+                ex,
+            )
+        return EventFactory.parse(event_type, payload)
+
+    @staticmethod
+    def parse_lazy(
+        event_type: LiveTimingEvent, payload: Any
+    ) -> Union[Event, RawTimingEvent]:
+        """
+        Wrap a payload in the topic's lazy view, converting nothing up front.
+
+        Topics without a registered view are parsed eagerly. The payload must
+        not be modified afterwards, since the view reads from it on access.
+
+        Args:
+            event_type: The `LiveTimingEvent` type representing this event.
+            payload: The full (merged) state of the topic.
+
+        Returns:
+            A lazy view, or whatever `parse()` returns for the topic.
+        """
+        view = _VIEW_REGISTRY.get(event_type)
+        if view is None:
+            return EventFactory.parse(event_type, payload)
+        return view(payload)
+
+
+EventFactory.compile()
@@ -1,24 +1,24 @@
 import asyncio
 from aiohttp import WSMsgType
-import json
 import logging
+import time
 from typing import TYPE_CHECKING, Optional, Tuple
 
+from .base_client import BaseTimingClient
 from .enums.live_timing_event import LiveTimingEvent
-from .interfaces.event import Event
-from .interfaces.notifiable import Notifiable
-from .interfaces.observable import Observable
-from .event_factory import EventFactory
 from .decorators import _EVENT_REGISTRY
+from .link_monitor import LinkMonitor, LinkStats
+from .message_cursor import CursorStats, MessageCursor
+from .recorder import FrameRecorder
 from ..const import DOMAIN
 
-
 if TYPE_CHECKING:
     from aiohttp import ClientSession, ClientWebSocketResponse
 
 _LOGGER = logging.getLogger(__name__)
 
 HUB_DATA = '[{"name":"Streaming"}]'
+KEEP_ALIVE_FRAME = "{}"
 SUBSCRIBE_MSG = {
     "H": "Streaming",
     "M": "Subscribe",
@@ -29,60 +29,82 @@ SUBSCRIBE_MSG = {
 # TODO: Implement Paid Logic. (Getting credentials from HA)
 
 
-class F1SignalRClient(Notifiable):
+class F1SignalRClient(BaseTimingClient):
     """
     Asynchronous client for connecting to the Formula 1 live timing SignalR service.
     """
 
     NEGOTIATION_URL = "https://livetiming.formula1.com/signalr/negotiate"
     CONNECTION_URL = "wss://livetiming.formula1.com/signalr/connect"
+    RECONNECT_URL = "wss://livetiming.formula1.com/signalr/reconnect"
 
-    HEARTBEAT = 300  # Seconds between keep-alive messages
+    STALL_TIMEOUT = 30  # Seconds without any frame before reconnecting
+    DISCONNECT_TIMEOUT = 30  # Seconds the server keeps a dropped connection
     FAST_RETRY_SEC = 5
     MAX_RETRY_SEC = 60
     BACK_OFF = 2  # Exponential backoff multiplier
 
-    def __init__(self, session: "ClientSession"):
+    def __init__(
+        self,
+        session: "ClientSession",
+        stall_timeout: float = STALL_TIMEOUT,
+        lazy: bool = False,
+    ):
+        super().__init__(lazy=lazy)
         self._session = session
-        self._observers: list[Observable] = []
         self._ws: Optional["ClientWebSocketResponse"] = None
         self._tasks: list[asyncio.Task] = []
         self._reconnect: bool = True
+        self._recorder: Optional[FrameRecorder] = None
+        self._monitor = LinkMonitor(stall_timeout)
+        self.attach(self._monitor, topics={LiveTimingEvent.HEARTBEAT})
+        self._cursor = MessageCursor()
+        self._token: Optional[str] = None
+        self._cookie: Optional[str] = None
+        self._disconnect_timeout: float = self.DISCONNECT_TIMEOUT
 
     @property
     def connected(self) -> bool:
         """Whether the websocket is currently connected."""
         return self._ws is not None and not self._ws.closed
 
-    # ---------------- Observer pattern ----------------
-    def attach(self, observer: Observable) -> None:
-        """Attach an observer that will receive event notifications."""
-        if observer not in self._observers:
-            self._observers.append(observer)
-            _LOGGER.debug("[%s] Attached observer: %s", DOMAIN, observer)
-
-    def detach(self, observer: Observable) -> None:
-        """Detach a previously attached observer."""
-        if observer in self._observers:
-            self._observers.remove(observer)
-            _LOGGER.debug("[%s] Detached observer: %s", DOMAIN, observer)
-
-    def notify(self, message: Event) -> None:
-        """Notify all observers about a new event."""
-        for observer in self._observers:
-            try:
-                observer.update(self, message)
-            except Exception:
-                _LOGGER.exception(
-                    "[%s] Failed to notify observer: %s", DOMAIN, observer
-                )
+    @property
+    def link_stats(self) -> LinkStats:
+        """Liveness, inter-arrival and round-trip statistics of the connection."""
+        return self._monitor.stats
+
+    @property
+    def cursor_stats(self) -> CursorStats:
+        """Resume and message gap statistics of the connection."""
+        return self._cursor.stats
+
+    # ---------------- Frame recording ----------------
+    def attach_recorder(self, recorder: FrameRecorder) -> None:
+        """
+        Record every raw frame received from now on.
+
+        The recorder is also attached as a `SessionInfo` observer so captures
+        are split per session. Must be called from the event loop.
+        """
+        self._recorder = recorder
+        self.attach(recorder, topics={LiveTimingEvent.SESSION_INFO})
+        recorder.start()
+
+    async def detach_recorder(self) -> None:
+        """Stop recording and flush what has been buffered so far."""
+        if recorder := self._recorder:
+            self._recorder = None
+            self.detach(recorder)
+            await recorder.close()
 
     # ---------------- Connection Lifecycle ----------------
     async def connect(self) -> None:
         """
         Establish and maintain a persistent connection to the F1 SignalR endpoint.
 
-        Implements automatic retry with exponential backoff.
+        Implements automatic retry with exponential backoff. Reconnects first
+        try to resume from the last message cursor, so only the messages
+        missed in between are replayed; a full subscribe is the fallback.
         """
         delay = self.FAST_RETRY_SEC
         attempt = 0
@@ -90,31 +112,16 @@ class F1SignalRClient(Notifiable):
         while self._reconnect:
             attempt += 1
             try:
-                # Token negotiation.
-                token, cookie = await self._negotiate()
-                if not token:
-                    raise RuntimeError("Negotiation failed — missing connection token")
-
-                headers = {"User-Agent": "BestHTTP", "Accept-Encoding": "gzip,identity"}
-                if cookie:
-                    headers["Cookie"] = cookie
-
-                # Open a new connection to the F1 socket.
-                self._ws = await self._session.ws_connect(
-                    self.CONNECTION_URL,
-                    params={
-                        "transport": "webSockets",
-                        "clientProtocol": "1.5",
-                        "connectionToken": token,
-                        "connectionData": HUB_DATA,
-                    },
-                    headers=headers,
-                )
-
-                # Subscribe to the events defined in the EVENT_REGISTRY.
-                await self._ws.send_json(SUBSCRIBE_MSG)
+                if not await self._resume():
+                    await self._subscribe()
                 _LOGGER.info("[%s] Connected to F1 live timing stream", DOMAIN)
 
+                self._tasks = [
+                    asyncio.create_task(self._listen()),
+                    asyncio.create_task(self._watchdog()),
+                    asyncio.create_task(self._decoder.run()),
+                ]
+
                 # Reset backoff after successful connection
                 delay = self.FAST_RETRY_SEC
 
@@ -155,6 +162,9 @@ class F1SignalRClient(Notifiable):
         self._reconnect = False
         _LOGGER.info("[%s] Disconnecting SignalR client", DOMAIN)
         await self._cleanup()
+
+        self._stop_queues()
+        await self.detach_recorder()
         _LOGGER.info("[%s] Disconnected cleanly", DOMAIN)
 
     async def _cleanup(self) -> None:
@@ -167,6 +177,73 @@ class F1SignalRClient(Notifiable):
             await self._ws.close()
             self._ws = None
 
+    async def _open(self, url: str, **params: str) -> "ClientWebSocketResponse":
+        """Internal: open a websocket with the current connection token."""
+        headers = {"User-Agent": "BestHTTP", "Accept-Encoding": "gzip,identity"}
+        if self._cookie:
+            headers["Cookie"] = self._cookie
+
+        return await self._session.ws_connect(
+            url,
+            params={
+                "transport": "webSockets",
+                "clientProtocol": "1.5",
+                "connectionToken": self._token,
+                "connectionData": HUB_DATA,
+                **params,
+            },
+            headers=headers,
+        )
+
+    async def _subscribe(self) -> None:
+        """Internal: negotiate a new connection and subscribe to every topic."""
+        self._cursor.reset()
+
+        # Token negotiation.
+        self._token, self._cookie = await self._negotiate()
+        if not self._token:
+            raise RuntimeError("Negotiation failed — missing connection token")
+
+        # Open a new connection to the F1 socket.
+        self._ws = await self._open(self.CONNECTION_URL)
+        self._monitor.reset()
+
+        # Subscribe to the events defined in the EVENT_REGISTRY.
+        # The subscribe response carries a snapshot of every topic,
+        # which is diffed against the state kept from before.
+        await self._ws.send_json(SUBSCRIBE_MSG)
+        self._monitor.request_sent(SUBSCRIBE_MSG["I"])
+        self._cursor.full_subscribes += 1
+
+    async def _resume(self) -> bool:
+        """
+        Internal: reconnect to the previous connection from the last cursor.
+
+        The server keeps the subscription and replays the messages sent since
+        the cursor, so no new snapshot is needed.
+
+        Returns:
+            Whether the connection was resumed.
+        """
+        if not self._token or not self._cursor.resumable(self._disconnect_timeout):
+            return False
+
+        params = {"messageId": self._cursor.message_id}
+        if self._cursor.groups_token:
+            params["groupsToken"] = self._cursor.groups_token
+
+        try:
+            self._ws = await self._open(self.RECONNECT_URL, **params)
+        except Exception as e:
+            self._cursor.resume_failures += 1
+            _LOGGER.info("[%s] Resume failed: %s — subscribing again", DOMAIN, e)
+            return False
+
+        self._monitor.reset()
+        self._cursor.resumes += 1
+        _LOGGER.debug("[%s] Resumed from %s", DOMAIN, self._cursor.message_id)
+        return True
+
     async def _negotiate(self) -> Tuple[Optional[str], Optional[str]]:
         """Perform the SignalR negotiation step to retrieve a connection token."""
         try:
@@ -177,24 +254,37 @@ class F1SignalRClient(Notifiable):
             ) as r:
                 r.raise_for_status()
                 data = await r.json()
+                self._disconnect_timeout = float(
+                    data.get("DisconnectTimeout", self.DISCONNECT_TIMEOUT)
+                )
                 return data["ConnectionToken"], r.headers.get("Set-Cookie")
 
         except Exception as e:
             _LOGGER.error("[%s] Negotiation failed: %s", DOMAIN, e)
             return None, None
 
-    async def _heartbeat(self) -> None:
-        """Send periodic keep-alive messages to maintain connection."""
+    async def _watchdog(self) -> None:
+        """
+        Return once the connection has stalled.
+
+        The server sends a keep-alive frame when it has nothing else to send,
+        so a half-dead socket shows up as silence long before TCP notices.
+        Returning ends `connect()`'s wait, which then reconnects.
+        """
+        interval = min(self._monitor.stall_timeout / 4, 5.0)
         try:
             while self.connected:
-                await asyncio.sleep(self.HEARTBEAT)
-                await self._ws.send_json(SUBSCRIBE_MSG)
-
-                _LOGGER.debug("[%s] Sent heartbeat", DOMAIN)
+                await asyncio.sleep(interval)
+                if self._monitor.stalled():
+                    self._monitor.stalls += 1
+                    _LOGGER.warning(
+                        "[%s] No data for %.0f s — connection stalled",
+                        DOMAIN,
+                        self._monitor.silence(),
+                    )
+                    return
         except asyncio.CancelledError:
-            _LOGGER.debug("[%s] Heartbeat task cancelled", DOMAIN)
-        except Exception:
-            _LOGGER.exception("[%s] Heartbeat loop failed", DOMAIN)
+            _LOGGER.debug("[%s] Watchdog task cancelled", DOMAIN)
 
     async def _listen(self) -> None:
         """Continuously listen for incoming websocket messages."""
@@ -205,18 +295,31 @@ class F1SignalRClient(Notifiable):
         try:
             async for msg in self._ws:
                 if msg.type == WSMsgType.TEXT:
-                    payload = json.loads(msg.data)
-
-                    for entry, data in payload.get("R", {}).items():
-                        event_type = LiveTimingEvent.try_from(entry)
-                        if not event_type:
-                            _LOGGER.debug("[%s] Unknown event type: %s", DOMAIN, entry)
-                            continue
-
-                        parsed = EventFactory.parse(event_type, data)
-                        if isinstance(parsed, Event):
-                            _LOGGER.debug("[%s] Parsed event: %s", DOMAIN, event_type)
-                            self.notify(parsed)
+                    received = time.monotonic()
+                    # Recorded before parsing, so keep-alives and reconnect
+                    # requests end up in the capture too.
+                    if self._recorder:
+                        self._recorder.record(msg.data, received)
+
+                    if msg.data == KEEP_ALIVE_FRAME:
+                        self._monitor.frame_received(received, keep_alive=True)
+                        continue
+
+                    self._monitor.frame_received(received)
+                    payload = self._handle_frame(msg.data)
+                    if "I" in payload:
+                        self._monitor.response_received(payload["I"], received)
+                    self._cursor.update(payload)
+
+                    # The server asks for a fresh connection; resuming would fail.
+                    if payload.get("D"):
+                        _LOGGER.info("[%s] Server requested a reconnect", DOMAIN)
+                        self._cursor.reset()
+                        break
+
+                    # Apply back-pressure from observers using the BLOCK policy.
+                    if self._blocked:
+                        await self._drain_blocked()
 
                 elif msg.type in (WSMsgType.CLOSED, WSMsgType.ERROR):
                     _LOGGER.error(
@@ -1,8 +1,17 @@
 """Interface definitions for the RacePulse F1 client."""
 
+from .async_observable import AsyncObservable
 from .event import Event
 from .event_parser import EventParser
 from .notifiable import Notifiable
 from .observable import Observable
+from .schema_parser import SchemaParser
 
-__all__ = ["Event", "EventParser", "Notifiable", "Observable"]
+__all__ = [
+    "AsyncObservable",
+    "Event",
+    "EventParser",
+    "Notifiable",
+    "Observable",
+    "SchemaParser",
+]
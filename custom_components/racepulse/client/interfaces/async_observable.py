@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from .notifiable import Notifiable
+    from .event import Event
+
+
+@runtime_checkable
+class AsyncObservable(Protocol):
+    """
+    Asynchronous observer interface for receiving updates from subjects.
+
+    Unlike `Observable`, updates are delivered from a dedicated consumer task
+    through a bounded per-observer queue, so a slow observer never delays the
+    subject or other observers.
+
+    Example:
+        class RecorderEntity(AsyncObservable):
+            async def async_receive(self, subject: Notifiable, message: Event) -> None:
+                await self.async_write_ha_state()
+    """
+
+    async def async_receive(self, subject: "Notifiable", message: "Event") -> None:
+        """
+        Called from the observer's consumer task for every queued event.
+
+        Args:
+            subject: The subject sending the update.
+            message: The event or telemetry payload being sent.
+        """
+        pass
@@ -11,8 +11,13 @@ class Event(ABC):
 
     Every event must declare its corresponding `LiveTimingEvent` type
     via the `data_type` attribute and encapsulate structured, parsed data.
+
+    Events are slotted dataclasses; the empty `__slots__` keeps this base
+    from adding a `__dict__` to every instance.
     """
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def data_type(self) -> LiveTimingEvent:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import Any, TypeVar, Generic
 from ..models import RawTimingEvent
 
 T = TypeVar("T")
@@ -9,14 +9,13 @@ class EventParser(ABC, Generic[T]):
     """
     Abstract base class for all event parsers.
 
-    Each parser converts a `RawTimingEvent` into a typed dataclass
+    Each parser converts a topic payload into a typed dataclass
     (such as `DriverList`, `TimingData`, or `WeatherData`).
 
     Parsers are registered automatically via the `@register_parser` decorator,
     which associates them with a specific `LiveTimingEvent` type.
     """
 
-    @abstractmethod
     def parse(self, raw: RawTimingEvent) -> T:
         """
         Convert a raw timing event into its typed dataclass form.
@@ -25,7 +24,40 @@ class EventParser(ABC, Generic[T]):
             raw: A `RawTimingEvent` containing the event type, UTC timestamp,
                  and raw JSON payload.
 
+        Returns:
+            A parsed dataclass instance representing this event type.
+        """
+        return self.parse_payload(raw.payload)
+
+    @abstractmethod
+    def parse_payload(self, payload: Any) -> T:
+        """
+        Convert a topic payload into its typed dataclass form.
+
+        This is the hot path used by `EventFactory`; no `RawTimingEvent`
+        is built around the payload.
+
+        Args:
+            payload: The merged JSON payload of the topic.
+
         Returns:
             A parsed dataclass instance representing this event type.
         """
         raise NotImplementedError
+
+    def parse_incremental(self, previous: T, payload: Any, delta: Any) -> T:
+        """
+        Parse a topic after a partial update, reusing the previous result.
+
+        Parsers of large, mostly unchanged topics override this to rebuild
+        only what `delta` touches. The default parses `payload` in full.
+
+        Args:
+            previous: The event parsed from the state before the update.
+            payload: The merged JSON payload of the topic, after the update.
+            delta: The partial update that was merged into the payload.
+
+        Returns:
+            A parsed dataclass instance representing this event type.
+        """
+        return self.parse_payload(payload)
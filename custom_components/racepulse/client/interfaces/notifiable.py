@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Collection, Optional
 
 if TYPE_CHECKING:
     from .observable import Observable
     from .event import Event
+    from ..enums import LiveTimingEvent
 
 
 class Notifiable(ABC):
@@ -35,16 +36,38 @@ class Notifiable(ABC):
     """
 
     @abstractmethod
-    def attach(self, observer: Observable) -> None:
-        """Register an observer to receive updates."""
+    def attach(
+        self,
+        observer: "Observable",
+        topics: Optional[Collection["LiveTimingEvent"]] = None,
+        drivers: Optional[Collection[str]] = None,
+    ) -> None:
+        """
+        Register an observer to receive updates.
+
+        Args:
+            observer: The observer to register.
+            topics: Only deliver events of these topics. None means all topics.
+            drivers: Only deliver per-driver updates touching these racing
+                     numbers. None means all drivers.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    def detach(self, observer: Observable) -> None:
+    def detach(self, observer: "Observable") -> None:
         """Unregister an observer so it no longer receives updates."""
         raise NotImplementedError
 
     @abstractmethod
-    def notify(self, message: Event) -> None:
-        """Notify all registered observers with a message."""
+    def notify(
+        self, message: "Event", drivers: Optional[Collection[str]] = None
+    ) -> None:
+        """
+        Notify the interested observers with a message.
+
+        Args:
+            message: The event to deliver.
+            drivers: The racing numbers the event touches, or None if the
+                     event is not driver-specific or the drivers are unknown.
+        """
         raise NotImplementedError
@@ -20,7 +20,7 @@ class Observable(Protocol):
                 print(f"Dashboard received: {message}")
     """
 
-    def update(self, subject: Notifiable, message: Event) -> None:
+    def update(self, subject: "Notifiable", message: "Event") -> None:
         """
         Called by the subject when notifying observers.
 
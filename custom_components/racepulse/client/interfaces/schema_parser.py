@@ -0,0 +1,28 @@
+from typing import Type, TypeVar
+
+from .event_parser import EventParser
+from ..schema import compile_parser
+
+T = TypeVar("T")
+
+
+class SchemaParser(EventParser[T]):
+    """
+    Base class for parsers generated from model field metadata.
+
+    Subclasses only name their `model`. Its `parse_payload` is the function
+    `compile_parser()` generates from the model's `feed()` fields, compiled
+    once when the subclass is defined.
+
+    Example:
+        @register_parser(LiveTimingEvent.WEATHER_DATA)
+        class WeatherDataParser(SchemaParser[WeatherData]):
+            model = WeatherData
+    """
+
+    model: Type[T]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "model" in cls.__dict__:
+            cls.parse_payload = staticmethod(compile_parser(cls.model))
@@ -0,0 +1,184 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import math
+import time
+from typing import TYPE_CHECKING, Dict, Optional
+
+from .models.heartbeat import Heartbeat
+
+if TYPE_CHECKING:
+    from .interfaces.event import Event
+    from .interfaces.notifiable import Notifiable
+
+
+class RunningStats:
+    """
+    Count, mean, standard deviation and extremes of a stream of samples.
+
+    Uses Welford's algorithm, so no samples are kept.
+    """
+
+    __slots__ = ("count", "mean", "minimum", "maximum", "last", "_m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.minimum = math.inf
+        self.maximum = 0.0
+        self.last = 0.0
+        self._m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+        self.last = value
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+@dataclass(frozen=True)
+class LinkStats:
+    """
+    Point-in-time health statistics of the live timing connection.
+
+    All durations are in seconds.
+
+    Attributes:
+        frames: Frames received on the current connection.
+        keep_alives: Empty `{}` keep-alive frames among them.
+        heartbeats: `Heartbeat` topic updates among them.
+        stalls: Connections dropped by the watchdog so far.
+        silence: Time since the last frame arrived.
+        interarrival_mean: Mean time between two frames.
+        interarrival_stdev: Standard deviation of the time between frames.
+        interarrival_max: Longest time between two frames.
+        rtt_last: Round-trip time of the last answered hub invocation.
+        rtt_mean: Mean round-trip time of hub invocations.
+        heartbeat_lag: Local receive time minus the server time of the last
+                       `Heartbeat`, including any clock offset between both.
+    """
+
+    frames: int
+    keep_alives: int
+    heartbeats: int
+    stalls: int
+    silence: Optional[float]
+    interarrival_mean: float
+    interarrival_stdev: float
+    interarrival_max: float
+    rtt_last: Optional[float]
+    rtt_mean: Optional[float]
+    heartbeat_lag: Optional[float]
+
+
+class LinkMonitor:
+    """
+    Tracks the liveness of the live timing connection.
+
+    The SignalR server sends an empty `{}` frame whenever nothing else was
+    sent for a while, and the feed publishes a `Heartbeat` topic update every
+    few seconds while a session is live. Any frame proves the socket is alive,
+    so a connection that delivers nothing for `stall_timeout` seconds is
+    considered stalled and should be re-established.
+
+    The monitor is also an observer of the `Heartbeat` topic, which it uses
+    to estimate how far behind the server's clock the feed arrives.
+
+    Example:
+        monitor = LinkMonitor(stall_timeout=30)
+        monitor.frame_received()
+        if monitor.stalled():
+            await reconnect()
+    """
+
+    def __init__(self, stall_timeout: float) -> None:
+        if stall_timeout <= 0:
+            raise ValueError("stall_timeout must be positive")
+
+        self.stall_timeout = stall_timeout
+        self.stalls = 0
+        self._pending: Dict[str, float] = {}
+        self._rtt = RunningStats()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start tracking a new connection. Round-trip times are kept."""
+        self._interarrival = RunningStats()
+        self._pending.clear()
+        self._last_frame: Optional[float] = None
+        self._connected = time.monotonic()
+        self._keep_alives = 0
+        self._heartbeats = 0
+        self._heartbeat_lag: Optional[float] = None
+
+    def frame_received(
+        self, received: Optional[float] = None, keep_alive: bool = False
+    ) -> None:
+        """
+        Record the arrival of a frame.
+
+        Args:
+            received: `time.monotonic()` when the frame arrived. Defaults to now.
+            keep_alive: Whether the frame was an empty keep-alive.
+        """
+        now = time.monotonic() if received is None else received
+        if self._last_frame is not None:
+            self._interarrival.add(now - self._last_frame)
+        self._last_frame = now
+        if keep_alive:
+            self._keep_alives += 1
+
+    def request_sent(self, invocation: object) -> None:
+        """Record a hub invocation, identified by its `"I"` field, being sent."""
+        self._pending[str(invocation)] = time.monotonic()
+
+    def response_received(
+        self, invocation: object, received: Optional[float] = None
+    ) -> None:
+        """Record the response to a hub invocation and measure its round trip."""
+        sent = self._pending.pop(str(invocation), None)
+        if sent is not None:
+            now = time.monotonic() if received is None else received
+            self._rtt.add(now - sent)
+
+    def silence(self, now: Optional[float] = None) -> float:
+        """Seconds since the last frame, or since connecting if none arrived."""
+        now = time.monotonic() if now is None else now
+        last = self._connected if self._last_frame is None else self._last_frame
+        return now - last
+
+    def stalled(self, now: Optional[float] = None) -> bool:
+        """Whether nothing has arrived for longer than `stall_timeout`."""
+        return self.silence(now) > self.stall_timeout
+
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook: track the server time carried by `Heartbeat`."""
+        if isinstance(message, Heartbeat):
+            self._heartbeats += 1
+            sent = message.datetime_utc
+            if sent.tzinfo is None:
+                sent = sent.replace(tzinfo=timezone.utc)
+            self._heartbeat_lag = (datetime.now(timezone.utc) - sent).total_seconds()
+
+    @property
+    def stats(self) -> LinkStats:
+        """Current statistics of the connection."""
+        return LinkStats(
+            frames=self._interarrival.count + (self._last_frame is not None),
+            keep_alives=self._keep_alives,
+            heartbeats=self._heartbeats,
+            stalls=self.stalls,
+            silence=self.silence() if self._last_frame is not None else None,
+            interarrival_mean=self._interarrival.mean,
+            interarrival_stdev=self._interarrival.stdev,
+            interarrival_max=self._interarrival.maximum,
+            rtt_last=self._rtt.last if self._rtt.count else None,
+            rtt_mean=self._rtt.mean if self._rtt.count else None,
+            heartbeat_lag=self._heartbeat_lag,
+        )
@@ -0,0 +1,133 @@
+from dataclasses import dataclass
+import time
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True)
+class CursorStats:
+    """
+    Resume and sequence statistics of the live timing connection.
+
+    Attributes:
+        resumes: Reconnects that resumed from the last message cursor.
+        resume_failures: Resume attempts that fell back to a full subscribe.
+        full_subscribes: Connections that started from a fresh snapshot.
+        gaps: Times the message sequence skipped ahead.
+        missed: Total number of messages skipped over by those gaps.
+    """
+
+    resumes: int
+    resume_failures: int
+    full_subscribes: int
+    gaps: int
+    missed: int
+
+
+class MessageCursor:
+    """
+    Remembers where the client is in the SignalR message stream.
+
+    Every persistent-connection frame carries a message cursor (`"C"`), and
+    frames that change the connection's groups carry a groups token (`"G"`).
+    Passing both to the `/signalr/reconnect` endpoint makes the server replay
+    what was sent while the client was away, instead of a full snapshot.
+
+    Cursors look like `"d-1A2B3C4D-B,1|C,0|D,2"`: one comma-separated sequence
+    number per server-side stream. Parsing them is best effort and only used
+    to count gaps; the cursor itself is always passed back verbatim.
+
+    Example:
+        cursor = MessageCursor()
+        cursor.update({"C": "d-1-B,41|C,0", "M": [...]})
+        if cursor.resumable(disconnect_timeout=30):
+            params["messageId"] = cursor.message_id
+    """
+
+    def __init__(self) -> None:
+        self.message_id: Optional[str] = None
+        self.groups_token: Optional[str] = None
+        self.resumes = 0
+        self.resume_failures = 0
+        self.full_subscribes = 0
+        self.gaps = 0
+        self.missed = 0
+        self._sequence: Optional[Dict[str, int]] = None
+        self._last_seen: Optional[float] = None
+
+    def update(self, payload: Dict[str, Any]) -> None:
+        """Track the cursor and groups token of a decoded frame."""
+        if token := payload.get("G"):
+            self.groups_token = token
+
+        cursor = payload.get("C")
+        if not isinstance(cursor, str):
+            return
+
+        sequence = parse_cursor(cursor)
+        if sequence and self._sequence:
+            # Each message in the frame advances the cursor by one.
+            advance = sum(
+                max(number - self._sequence.get(stream, number), 0)
+                for stream, number in sequence.items()
+            )
+            skipped = advance - len(payload.get("M") or ())
+            if skipped > 0:
+                self.gaps += 1
+                self.missed += skipped
+
+        self.message_id = cursor
+        self._sequence = sequence or self._sequence
+        self._last_seen = time.monotonic()
+
+    def resumable(self, disconnect_timeout: float) -> bool:
+        """
+        Whether resuming from the cursor can still succeed.
+
+        Args:
+            disconnect_timeout: Seconds the server keeps an absent client's
+                                connection, as announced during negotiation.
+        """
+        return (
+            self.message_id is not None
+            and self._last_seen is not None
+            and time.monotonic() - self._last_seen < disconnect_timeout
+        )
+
+    def reset(self) -> None:
+        """Forget the position, e.g. before a full subscribe. Stats are kept."""
+        self.message_id = None
+        self.groups_token = None
+        self._sequence = None
+        self._last_seen = None
+
+    @property
+    def stats(self) -> CursorStats:
+        return CursorStats(
+            resumes=self.resumes,
+            resume_failures=self.resume_failures,
+            full_subscribes=self.full_subscribes,
+            gaps=self.gaps,
+            missed=self.missed,
+        )
+
+
+def parse_cursor(cursor: str) -> Optional[Dict[str, int]]:
+    """
+    Split a SignalR message cursor into per-stream sequence numbers.
+
+    Example:
+        >>> parse_cursor("d-1A2B3C4D-B,41|C,0")
+        {'B': 41, 'C': 0}
+
+    Returns:
+        The sequence number of every stream, or None if the cursor has an
+        unexpected format.
+    """
+    sequence = {}
+    for part in cursor.split("|"):
+        stream, _, number = part.rpartition(",")
+        if not stream or not number.isdigit():
+            return None
+        # The first stream carries the cursor's "d-<id>-" prefix.
+        sequence[stream.rpartition("-")[2]] = int(number)
+    return sequence
@@ -1,9 +1,11 @@
 """Model definitions for the RacePulse F1 client."""
 
+from .car_data import CarData, CarDataEntry, CarChannels
 from .driver_list import DriverList, Driver
 from .extrapolated_clock import ExtrapolatedClock
 from .heartbeat import Heartbeat
 from .meeting import Meeting, Country, Circuit, Session
+from .position import Position, PositionFrame, CarPosition
 from .race_control_messages import RaceControlMessages, RaceControlMessage
 from .raw_timing_event import RawTimingEvent
 from .session_info import SessionInfo, ArchiveStatus
@@ -24,6 +26,9 @@ from .track_status import TrackStatus
 from .weather_data import WeatherData
 
 __all__ = [
+    "CarData",
+    "CarDataEntry",
+    "CarChannels",
     "DriverList",
     "Driver",
     "ExtrapolatedClock",
@@ -32,6 +37,9 @@ __all__ = [
     "Country",
     "Circuit",
     "Session",
+    "Position",
+    "PositionFrame",
+    "CarPosition",
     "RaceControlMessages",
     "RaceControlMessage",
     "RawTimingEvent",
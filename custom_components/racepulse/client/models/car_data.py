@@ -0,0 +1,98 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Final
+from ..enums import LiveTimingEvent
+from ..interfaces import Event
+from ..decorators import register_event
+from ..schema import dict_of, feed, list_of, model
+from ...helpers import parse_datetime, parse_int
+
+
+@dataclass(frozen=True, slots=True)
+class CarChannels:
+    """
+    Represents a single telemetry sample for one car.
+
+    The feed identifies each channel by a numeric key rather than a name.
+
+    Example of raw JSON payload:
+        {
+            "Channels": {
+                "0": 10823,
+                "2": 287,
+                "3": 7,
+                "4": 100,
+                "5": 0,
+                "45": 12
+            }
+        }
+
+    Attributes:
+        rpm: Engine speed in revolutions per minute (channel "0").
+        speed: Car speed in km/h (channel "2").
+        gear: The selected gear, 0 for neutral (channel "3").
+        throttle: Throttle application in percent (channel "4").
+        brake: Brake application, 0 or 100 (channel "5").
+        drs: The raw DRS state code (channel "45").
+    """
+
+    rpm: int = feed(("Channels", "0"), parse_int)
+    speed: int = feed(("Channels", "2"), parse_int)
+    gear: int = feed(("Channels", "3"), parse_int)
+    throttle: int = feed(("Channels", "4"), parse_int)
+    brake: int = feed(("Channels", "5"), parse_int)
+    drs: int = feed(("Channels", "45"), parse_int)
+
+
+@dataclass(frozen=True, slots=True)
+class CarDataEntry:
+    """
+    Represents the telemetry of all cars at a single point in time.
+
+    Example of raw JSON payload:
+        {
+            "Utc": "2025-10-05T12:31:02.4523713Z",
+            "Cars": {
+                "1": { "Channels": { ... } },
+                "4": { "Channels": { ... } }
+            }
+        }
+
+    Attributes:
+        datetime_utc: The UTC timestamp of the sample.
+        cars: A mapping of racing numbers (as strings) to their `CarChannels`.
+    """
+
+    datetime_utc: Optional[datetime] = feed("Utc", parse_datetime)
+    cars: Dict[str, CarChannels] = feed("Cars", dict_of(model(CarChannels)))
+
+
+@register_event(LiveTimingEvent.CAR_DATA)
+@dataclass(frozen=True, slots=True)
+class CarData(Event):
+    """
+    Represents a batch of high-rate car telemetry samples.
+
+    The feed sends this topic compressed (base64 + raw deflate) under the name
+    "CarData.z". The payload below is shown after decoding.
+
+    Example of decoded event payload:
+        {
+            "Entries": [
+                { "Utc": "2025-10-05T12:31:02.4523713Z", "Cars": { ... } },
+                { "Utc": "2025-10-05T12:31:02.7143861Z", "Cars": { ... } }
+            ]
+        }
+
+    Attributes:
+        data_type: A constant identifying this event as a `CAR_DATA` event.
+        entries: A list of `CarDataEntry` samples in chronological order.
+
+    Source:
+        SignalR event: "CarData.z"
+    """
+
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.CAR_DATA, init=False
+    )
+    entries: List[CarDataEntry] = feed("Entries", list_of(model(CarDataEntry)))
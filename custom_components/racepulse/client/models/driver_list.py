@@ -1,11 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict
 from ..interfaces import Event
 from ..enums import LiveTimingEvent
 from ..decorators import register_event
+from ..schema import dict_of, feed, model
+from ...helpers import parse_int, parse_interned
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Driver:
     """
     Represents metadata about a Formula 1 driver as provided by the F1 Live Timing API.
@@ -45,22 +47,23 @@ class Driver:
         public_id_right: A path reference for media assets related to the driver.
     """
 
-    racing_number: int
-    broadcast_name: str
-    full_name: str
-    tla: str
-    line: int
-    team_name: str
-    team_colour: str
-    first_name: str
-    last_name: str
-    reference: str
-    headshot_url: str
-    public_id_right: str
+    racing_number: int = feed("RacingNumber", parse_int)
+    broadcast_name: str = feed("BroadcastName", default="")
+    full_name: str = feed("FullName", default="")
+    tla: str = feed("Tla", default="")
+    line: int = feed("Line", parse_int)
+    # Shared by both drivers of a team, and by every update.
+    team_name: str = feed("TeamName", parse_interned)
+    team_colour: str = feed("TeamColour", parse_interned)
+    first_name: str = feed("FirstName", default="")
+    last_name: str = feed("LastName", default="")
+    reference: str = feed("Reference", default="")
+    headshot_url: str = feed("HeadshotUrl", default="")
+    public_id_right: str = feed("PublicIdRight", default="")
 
 
 @register_event(LiveTimingEvent.DRIVER_LIST.value)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DriverList(Event):
     """
     Represents the list of all drivers participating in a Formula 1 session.
@@ -87,5 +90,5 @@ class DriverList(Event):
         SignalR event: "DriverList"
     """
 
-    data_type: LiveTimingEvent = LiveTimingEvent.DRIVER_LIST
-    drivers: Dict[str, "Driver"]
+    data_type: LiveTimingEvent = field(default=LiveTimingEvent.DRIVER_LIST, init=False)
+    drivers: Dict[str, "Driver"] = feed(None, dict_of(model(Driver)))
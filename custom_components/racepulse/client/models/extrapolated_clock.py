@@ -1,13 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Final
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed
+from ...helpers import parse_bool, parse_datetime, parse_timedelta
 
 
 @register_event(LiveTimingEvent.EXTRAPOLATED_CLOCK)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtrapolatedClock(Event):
     """
     Represents the extrapolated session clock used in Formula 1 live timing data.
@@ -34,7 +36,9 @@ class ExtrapolatedClock(Event):
         SignalR event: "ExtrapolatedClock"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.EXTRAPOLATED_CLOCK
-    datetime_utc: datetime
-    remaining_time: timedelta
-    extrapolating: bool
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.EXTRAPOLATED_CLOCK, init=False
+    )
+    datetime_utc: datetime = feed("Utc", parse_datetime)
+    remaining_time: timedelta = feed("Remaining", parse_timedelta, default="00:00:00")
+    extrapolating: bool = feed("Extrapolating", parse_bool, default=False)
@@ -1,13 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Final
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed
+from ...helpers import parse_datetime
 
 
 @register_event(LiveTimingEvent.HEARTBEAT)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Heartbeat(Event):
     """
     Represents a heartbeat signal emitted by the Formula 1 Live Timing service.
@@ -30,5 +32,7 @@ class Heartbeat(Event):
         SignalR event: "Heartbeat"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.HEARTBEAT
-    datetime_utc: datetime
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.HEARTBEAT, init=False
+    )
+    datetime_utc: datetime = feed("Utc", parse_datetime)
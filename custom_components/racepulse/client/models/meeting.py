@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Optional, Final
+from ..schema import feed, list_of, model
+from ...helpers import parse_datetime, parse_int, parse_timedelta
 
 
 # https://livetiming.formula1.com/static/2025/Index.json
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Session:
     """
     Represents a single Formula 1 session (e.g., Practice, Qualifying, or Race)
@@ -33,17 +35,17 @@ class Session:
         path: Relative path to the session data within the Live Timing API.
     """
 
-    key: int
-    type: str
-    number: int
-    name: str
-    start_date: datetime
-    end_date: datetime
-    gmt_offset: timedelta
-    path: str
+    key: int = feed("Key", parse_int)
+    type: str = feed("Type", default="")
+    number: int = feed("Number", parse_int)
+    name: str = feed("Name", default="")
+    start_date: datetime = feed("StartDate", parse_datetime)
+    end_date: datetime = feed("EndDate", parse_datetime)
+    gmt_offset: timedelta = feed("GmtOffset", parse_timedelta)
+    path: str = feed("Path", default="")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Country:
     """
     Represents a country in which a Formula 1 event takes place.
@@ -61,12 +63,12 @@ class Country:
         name: Full display name of the country.
     """
 
-    key: int
-    code: str
-    name: str
+    key: int = feed("Key", parse_int)
+    code: str = feed("Code", default="")
+    name: str = feed("Name", default="")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Circuit:
     """
     Represents a Formula 1 racing circuit.
@@ -82,11 +84,11 @@ class Circuit:
         short_name: The circuit’s short name or display label.
     """
 
-    key: int
-    short_name: str
+    key: int = feed("Key", parse_int)
+    short_name: str = feed("ShortName", default="")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Meeting:
     """
     Represents a Formula 1 meeting (Grand Prix event) containing multiple sessions.
@@ -118,12 +120,12 @@ class Meeting:
         circuit: The `Circuit` object representing the race circuit.
     """
 
-    sessions: List[Session]
-    key: int
-    code: Optional[str]
-    number: Optional[int]
-    location: str
-    official_name: str
-    name: str
-    country: Country
-    circuit: Circuit
+    sessions: List[Session] = feed("Sessions", list_of(model(Session)))
+    key: int = feed("Key", parse_int)
+    code: Optional[str] = feed("Code")
+    number: Optional[int] = feed("Number")
+    location: str = feed("Location", default="")
+    official_name: str = feed("OfficialName", default="")
+    name: str = feed("Name", default="")
+    country: Country = feed("Country", model(Country))
+    circuit: Circuit = feed("Circuit", model(Circuit))
@@ -0,0 +1,88 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Final
+from ..enums import LiveTimingEvent
+from ..interfaces import Event
+from ..decorators import register_event
+from ..schema import dict_of, feed, list_of, model
+from ...helpers import parse_datetime, parse_int, parse_string
+
+
+@dataclass(frozen=True, slots=True)
+class CarPosition:
+    """
+    Represents the location of a single car on the circuit map.
+
+    Example of raw JSON payload:
+        {
+            "Status": "OnTrack",
+            "X": -1589,
+            "Y": 2349,
+            "Z": 7283
+        }
+
+    Attributes:
+        status: The car's track status (e.g., "OnTrack", "OffTrack").
+        x: The X coordinate in the circuit's local coordinate system.
+        y: The Y coordinate in the circuit's local coordinate system.
+        z: The Z (height) coordinate in the circuit's local coordinate system.
+    """
+
+    status: str = feed("Status", parse_string)
+    x: int = feed("X", parse_int)
+    y: int = feed("Y", parse_int)
+    z: int = feed("Z", parse_int)
+
+
+@dataclass(frozen=True, slots=True)
+class PositionFrame:
+    """
+    Represents the location of all cars at a single point in time.
+
+    Example of raw JSON payload:
+        {
+            "Timestamp": "2025-10-05T12:31:02.3921873Z",
+            "Entries": {
+                "1": { "Status": "OnTrack", "X": -1589, "Y": 2349, "Z": 7283 },
+                ...
+            }
+        }
+
+    Attributes:
+        datetime_utc: The UTC timestamp of the frame.
+        entries: A mapping of racing numbers (as strings) to their `CarPosition`.
+    """
+
+    datetime_utc: Optional[datetime] = feed("Timestamp", parse_datetime)
+    entries: Dict[str, CarPosition] = feed("Entries", dict_of(model(CarPosition)))
+
+
+@register_event(LiveTimingEvent.POSITION)
+@dataclass(frozen=True, slots=True)
+class Position(Event):
+    """
+    Represents a batch of car location frames.
+
+    The feed sends this topic compressed (base64 + raw deflate) under the name
+    "Position.z". The payload below is shown after decoding.
+
+    Example of decoded event payload:
+        {
+            "Position": [
+                { "Timestamp": "2025-10-05T12:31:02.3921873Z", "Entries": { ... } },
+                ...
+            ]
+        }
+
+    Attributes:
+        data_type: A constant identifying this event as a `POSITION` event.
+        frames: A list of `PositionFrame` objects in chronological order.
+
+    Source:
+        SignalR event: "Position.z"
+    """
+
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.POSITION, init=False
+    )
+    frames: List[PositionFrame] = feed("Position", list_of(model(PositionFrame)))
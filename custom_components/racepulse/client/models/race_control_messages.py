@@ -1,12 +1,19 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Optional, Final
-from ..enums import LiveTimingEvent
+from ..enums import (
+    LiveTimingEvent,
+    RaceControlCategory,
+    RaceControlFlag,
+    RaceControlScope,
+)
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed, list_of, model
+from ...helpers import parse_datetime, parse_int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RaceControlMessage:
     """
     Represents a single race control message issued by the FIA during a Formula 1 session.
@@ -38,23 +45,25 @@ class RaceControlMessage:
 
     Attributes:
         datetime_utc: The UTC timestamp when the message was issued.
-        category: The general category of the message (e.g., "Flag", "Other").
+        category: The general category of the message (e.g., "Flag", "Other"). May be None.
         flag: The flag type, if applicable (e.g., "GREEN", "YELLOW"). May be None.
         scope: The scope or affected area of the message (e.g., "Track", "Sector"). May be None.
         sector: The sector number affected, if applicable. May be None.
         message: The human-readable message text as displayed in timing feeds.
     """
 
-    datetime_utc: datetime
-    category: str  # TODO: Convert to Enum (e.g. RaceControlCategory)
-    flag: Optional[str]  # TODO: Convert to Enum (e.g. RaceControlFlag)
-    scope: Optional[str]  # TODO: Convert to Enum (e.g. RaceControlScope)
-    sector: Optional[int]
-    message: str
+    datetime_utc: datetime = feed("Utc", parse_datetime)
+    category: Optional[RaceControlCategory] = feed(
+        "Category", RaceControlCategory.parse
+    )
+    flag: Optional[RaceControlFlag] = feed("Flag", RaceControlFlag.parse)
+    scope: Optional[RaceControlScope] = feed("Scope", RaceControlScope.parse)
+    sector: Optional[int] = feed("Sector", parse_int)
+    message: str = feed("Message", default="")
 
 
 @register_event(LiveTimingEvent.RACE_CONTROL_MESSAGES)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RaceControlMessages(Event):
     """
     Represents a collection of all race control messages broadcast during a Formula 1 session.
@@ -80,5 +89,9 @@ class RaceControlMessages(Event):
         SignalR event: "RaceControlMessages"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.RACE_CONTROL_MESSAGES
-    messages: List[RaceControlMessage]
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.RACE_CONTROL_MESSAGES, init=False
+    )
+    messages: List[RaceControlMessage] = feed(
+        "Messages", list_of(model(RaceControlMessage))
+    )
@@ -4,7 +4,7 @@ from typing import Any, Final
 from ..enums import LiveTimingEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RawTimingEvent:
     """
     Represents a raw live timing event as received directly from the Formula 1 Live Timing feed.
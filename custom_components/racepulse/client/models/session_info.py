@@ -1,13 +1,15 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Final
+from typing import Final, Optional
 from . import Meeting
-from ..enums import LiveTimingEvent
+from ..enums import LiveTimingEvent, SessionStatus
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed, model
+from ...helpers import parse_datetime, parse_int, parse_timedelta
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchiveStatus:
     """
     Represents the archive status of a Formula 1 session.
@@ -22,11 +24,11 @@ class ArchiveStatus:
                 TODO: Convert to enum (e.g., ArchiveStatusType).
     """
 
-    status: str  # TODO: Make enum
+    status: str = feed("Status", default="")  # TODO: Make enum
 
 
 @register_event(LiveTimingEvent.SESSION_INFO)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionInfo(Event):
     """
     Represents metadata about a Formula 1 session, including its schedule,
@@ -54,8 +56,8 @@ class SessionInfo(Event):
     Attributes:
         data_type: A constant identifying this event as a `SESSION_INFO` event.
         meeting: A `Meeting` object representing the associated Grand Prix.
-        session_status: The current session status (e.g., "Scheduled", "InProgress", "Finalised").
-                        TODO: Convert to enum (e.g., SessionStatusType).
+        session_status: The current session status (e.g., "Started", "Finalised"),
+                        or None if not sent.
         archive_status: The current archive status of the session.
         key: Unique numeric identifier for the session.
         type: The session type (e.g., "Practice", "Qualifying", "Race").
@@ -70,15 +72,17 @@ class SessionInfo(Event):
         SignalR event: "SessionInfo"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.SESSION_INFO
-    meeting: Meeting
-    session_status: str  # TODO: Make enum -> Scheduled / InProgress / Finalised
-    archive_status: ArchiveStatus
-    key: int
-    type: str
-    number: int
-    name: str
-    start_date: datetime
-    end_date: datetime
-    gmt_offset: timedelta
-    path: str
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.SESSION_INFO, init=False
+    )
+    meeting: Meeting = feed("Meeting", model(Meeting))
+    session_status: Optional[SessionStatus] = feed("SessionStatus", SessionStatus.parse)
+    archive_status: ArchiveStatus = feed("ArchiveStatus", model(ArchiveStatus))
+    key: int = feed("Key", parse_int)
+    type: str = feed("Type", default="")
+    number: int = feed("Number", parse_int)
+    name: str = feed("Name", default="")
+    start_date: datetime = feed("StartDate", parse_datetime)
+    end_date: datetime = feed("EndDate", parse_datetime)
+    gmt_offset: timedelta = feed("GmtOffset", parse_timedelta)
+    path: str = feed("Path", default="")
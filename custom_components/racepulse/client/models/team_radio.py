@@ -1,12 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Final
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed, list_of, model
+from ...helpers import parse_datetime, parse_int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamRadioCapture:
     """
     Represents a single captured piece of team radio communication.
@@ -27,13 +29,13 @@ class TeamRadioCapture:
         path: The relative API or storage path to the radio audio file.
     """
 
-    datetime_utc: datetime
-    racing_number: int
-    path: str
+    datetime_utc: datetime = feed("Utc", parse_datetime)
+    racing_number: int = feed("RacingNumber", parse_int)
+    path: str = feed("Path", default="")
 
 
 @register_event(LiveTimingEvent.TEAM_RADIO)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamRadio(Event):
     """
     Represents a collection of all team radio captures for a Formula 1 session.
@@ -63,5 +65,9 @@ class TeamRadio(Event):
         SignalR event: "TeamRadio"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.TEAM_RADIO
-    captures: List[TeamRadioCapture]
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.TEAM_RADIO, init=False
+    )
+    captures: List[TeamRadioCapture] = feed(
+        "Captures", list_of(model(TeamRadioCapture))
+    )
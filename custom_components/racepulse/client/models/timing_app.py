@@ -1,11 +1,18 @@
-from dataclasses import dataclass
-from typing import Dict, Final
-from ..enums import LiveTimingEvent
+from dataclasses import dataclass, field
+from typing import Any, Dict, Final, Optional
+from ..enums import LiveTimingEvent, TyreCompound
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import dict_of, feed, indexed, model
+from ...helpers import parse_bool, parse_int, parse_time_ms
 
 
-@dataclass(frozen=True)
+def _compound(value: Any) -> TyreCompound:
+    # The feed itself sends "UNKNOWN" until the compound of a stint is known.
+    return TyreCompound(value or TyreCompound.UNKNOWN.value)
+
+
+@dataclass(frozen=True, slots=True)
 class Stint:
     """
     Represents a single tyre stint completed by a driver.
@@ -28,26 +35,27 @@ class Stint:
     Attributes:
         lap_flags: Numeric flags describing the stint's state (purpose TBD).
         compound: The tyre compound used (e.g., "SOFT", "MEDIUM", "HARD").
-                  TODO: Convert to enum (e.g., TyreCompoundType).
         new: Whether the tyres were new (`true`) or previously used.
         tyres_not_changed: Indicates if tyres were reused (`1`) or changed (`0`).
         total_laps: Total laps completed on this set of tyres.
         start_laps: Lap number where the stint began.
         lap_time: Best lap time within the stint, formatted as "M:SS.mmm".
+        lap_time_ms: `lap_time` in milliseconds, or None if not set.
         lap_number: The last lap number of the stint.
     """
 
-    lap_flags: int
-    compound: str
-    new: bool
-    tyres_not_changed: int
-    total_laps: int
-    start_laps: int
-    lap_time: str
-    lap_number: int
+    lap_flags: int = feed("LapFlags", parse_int)
+    compound: TyreCompound = feed("Compound", _compound)
+    new: bool = feed("New", parse_bool)
+    tyres_not_changed: int = feed("TyresNotChanged", parse_int)
+    total_laps: int = feed("TotalLaps", parse_int)
+    start_laps: int = feed("StartLaps", parse_int)
+    lap_time: str = feed("LapTime", default="")
+    lap_time_ms: Optional[int] = feed("LapTime", parse_time_ms)
+    lap_number: int = feed("LapNumber", parse_int)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DriverStints:
     """
     Represents tyre stint and strategy information for a single driver.
@@ -67,13 +75,13 @@ class DriverStints:
         stints: A mapping of stint indices (or identifiers) to `Stint` objects.
     """
 
-    racing_number: int
-    line: int
-    stints: Dict[str, Stint]
+    racing_number: int = feed("RacingNumber", parse_int)
+    line: int = feed("Line", parse_int)
+    stints: Dict[str, Stint] = feed("Stints", indexed(model(Stint)))
 
 
 @register_event(LiveTimingEvent.TIMING_APP)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimingApp(Event):
     """
     Represents strategy and tyre data for all drivers in a Formula 1 session.
@@ -106,5 +114,7 @@ class TimingApp(Event):
         SignalR event: "TimingApp"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.TIMING_APP
-    lines: Dict[str, DriverStints]
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.TIMING_APP, init=False
+    )
+    lines: Dict[str, DriverStints] = feed("Lines", dict_of(model(DriverStints)))
@@ -1,11 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Final
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Segment:
     """
     Represents an individual micro-sector within a driver's lap sector.
@@ -22,7 +22,7 @@ class Segment:
     status: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sector:
     """
     Represents a single sector's timing information for a driver.
@@ -41,6 +41,7 @@ class Sector:
     Attributes:
         stopped: Whether the driver stopped during this sector.
         value: The recorded sector time as a string (e.g., "62.836").
+        value_ms: The sector time in milliseconds, or None if not set.
         status: The numeric status flag for the sector.
         overall_fastest: Whether this sector is the fastest overall.
         personal_fastest: Whether this sector is the driver's personal best.
@@ -50,6 +51,7 @@ class Sector:
 
     stopped: bool
     value: str
+    value_ms: Optional[int]
     status: int
     overall_fastest: bool
     personal_fastest: bool
@@ -57,7 +59,7 @@ class Sector:
     previous_value: Optional[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpeedData:
     """
     Represents a single speed measurement point within a lap.
@@ -83,7 +85,7 @@ class SpeedData:
     personal_fastest: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Speed:
     """
     Represents a collection of key speed measurements for a driver.
@@ -109,7 +111,7 @@ class Speed:
     st: SpeedData
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BestLapTime:
     """
     Represents a driver's best lap time and the lap number it occurred on.
@@ -122,14 +124,16 @@ class BestLapTime:
 
     Attributes:
         value: The best lap time in "M:SS.mmm" format.
+        value_ms: The best lap time in milliseconds, or None if not set.
         lap: The lap number on which the best time was set.
     """
 
     value: str
+    value_ms: Optional[int]
     lap: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LastLapTime:
     """
     Represents a driver's most recently completed lap time.
@@ -144,18 +148,20 @@ class LastLapTime:
 
     Attributes:
         value: The lap time as a string (e.g., "2:31.237").
+        value_ms: The lap time in milliseconds, or None if not set.
         status: The numeric status flag for the lap.
         overall_fastest: Whether this lap is the fastest overall.
         personal_fastest: Whether this lap is the driver’s personal best.
     """
 
     value: str
+    value_ms: Optional[int]
     status: int
     overall_fastest: bool
     personal_fastest: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DriverTiming:
     """
     Represents full timing data for a single driver, including position, sectors, and lap statistics.
@@ -183,7 +189,19 @@ class DriverTiming:
 
     Attributes:
         time_diff_to_fastest: Time difference to the fastest driver (e.g., "+0.143").
+        time_diff_to_fastest_ms: `time_diff_to_fastest` in milliseconds, or None
+                                 if it is not a time (e.g., "LAP 57" or "1L").
         time_diff_to_position_ahead: Time difference to the driver ahead (e.g., "+0.011").
+        time_diff_to_position_ahead_ms: `time_diff_to_position_ahead` in milliseconds,
+                                        or None if it is not a time.
+        gap_to_leader: Gap to the leader sent in race sessions (e.g., "+1.234").
+        gap_to_leader_ms: `gap_to_leader` in milliseconds, or None if it is not
+                          a time.
+        interval_to_position_ahead: Interval to the car ahead sent in race
+                                    sessions (e.g., "+0.456").
+        interval_to_position_ahead_ms: `interval_to_position_ahead` in
+                                       milliseconds, or None if it is not a time.
+        catching: Whether the driver is catching the car ahead.
         line: The driver's line index in the timing display.
         position: The driver's current position as a string.
         show_position: Whether the position should be displayed.
@@ -202,7 +220,14 @@ class DriverTiming:
     """
 
     time_diff_to_fastest: str
+    time_diff_to_fastest_ms: Optional[int]
     time_diff_to_position_ahead: str
+    time_diff_to_position_ahead_ms: Optional[int]
+    gap_to_leader: str
+    gap_to_leader_ms: Optional[int]
+    interval_to_position_ahead: str
+    interval_to_position_ahead_ms: Optional[int]
+    catching: bool
     line: int
     position: str
     show_position: bool
@@ -221,7 +246,7 @@ class DriverTiming:
 
 
 @register_event(LiveTimingEvent.TIMING_DATA)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimingData(Event):
     """
     Represents the full live timing dataset for all drivers.
@@ -249,6 +274,8 @@ class TimingData(Event):
         SignalR event: "TimingData"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.TIMING_DATA
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.TIMING_DATA, init=False
+    )
     lines: Dict[str, DriverTiming]
     withheld: bool
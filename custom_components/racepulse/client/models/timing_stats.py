@@ -1,11 +1,13 @@
-from dataclasses import dataclass
-from typing import Dict, List, Final
+from dataclasses import dataclass, field
+from typing import Dict, List, Final, Optional
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import dict_of, feed, list_of, model, optional
+from ...helpers import parse_int, parse_time_ms
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Stat:
     """
     Represents a single performance statistic such as a sector or speed value.
@@ -21,11 +23,11 @@ class Stat:
         position: The driver's ranking position for this value (e.g., 1 for fastest).
     """
 
-    value: str
-    position: int
+    value: str = feed("Value", default="")
+    position: int = feed("Position", parse_int)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PersonalBestLapTime(Stat):
     """
     Represents a driver's personal best lap time.
@@ -41,12 +43,14 @@ class PersonalBestLapTime(Stat):
         value: The personal best lap time in "M:SS.mmm" format.
         position: The driver's rank for this lap time (e.g., 1 for fastest overall).
         lap: The lap number on which the personal best was achieved.
+        value_ms: The personal best lap time in milliseconds, or None if not set.
     """
 
-    lap: int
+    lap: int = feed("Lap", parse_int)
+    value_ms: Optional[int] = feed("Value", parse_time_ms)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BestSpeed:
     """
     Represents a driver’s best recorded speeds at key track locations.
@@ -66,13 +70,13 @@ class BestSpeed:
         st: Best speed at the speed trap.
     """
 
-    i1: Stat
-    i2: Stat
-    fl: Stat
-    st: Stat
+    i1: Stat = feed("I1", model(Stat))
+    i2: Stat = feed("I2", model(Stat))
+    fl: Stat = feed("FL", model(Stat))
+    st: Stat = feed("ST", model(Stat))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DriverStat:
     """
     Represents timing and performance statistics for an individual driver.
@@ -107,15 +111,17 @@ class DriverStat:
         best_speeds: The driver’s best recorded speeds across track sections.
     """
 
-    line: int
-    racing_number: int
-    personal_best_lap_time: PersonalBestLapTime
-    best_sectors: List[Stat]
-    best_speeds: BestSpeed
+    line: int = feed("Line", parse_int)
+    racing_number: int = feed("RacingNumber", parse_int)
+    personal_best_lap_time: PersonalBestLapTime = feed(
+        "PersonalBestLapTime", optional(model(PersonalBestLapTime))
+    )
+    best_sectors: List[Stat] = feed("BestSectors", list_of(model(Stat)))
+    best_speeds: BestSpeed = feed("BestSpeeds", optional(model(BestSpeed)))
 
 
 @register_event(LiveTimingEvent.TIMING_STATS)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TimingStats(Event):
     """
     Represents detailed timing statistics for all drivers in a Formula 1 session.
@@ -143,5 +149,7 @@ class TimingStats(Event):
         SignalR event: "TimingStats"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.TIMING_STATS
-    lines: Dict[str, DriverStat]
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.TIMING_STATS, init=False
+    )
+    lines: Dict[str, DriverStat] = feed("Lines", dict_of(model(DriverStat)))
@@ -1,12 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed
+from ...helpers import parse_string
 
 
 @register_event(LiveTimingEvent.TRACK_STATUS)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrackStatus(Event):
     """
     Represents the current track status during a Formula 1 session.
@@ -31,6 +33,10 @@ class TrackStatus(Event):
         SignalR event: "TrackStatus"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.TRACK_STATUS
-    status: str  # TODO: Make this into an Enum (TrackStatusType)
-    message: str
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.TRACK_STATUS, init=False
+    )
+    status: str = feed(  # TODO: Make this into an Enum (TrackStatusType)
+        "Status", parse_string, default="unknown"
+    )
+    message: str = feed("Message", parse_string, default="")
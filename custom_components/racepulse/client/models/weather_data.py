@@ -1,12 +1,14 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Final
 from ..enums import LiveTimingEvent
 from ..interfaces import Event
 from ..decorators import register_event
+from ..schema import feed
+from ...helpers import parse_float
 
 
 @register_event(LiveTimingEvent.WEATHER_DATA)
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeatherData(Event):
     """
     Represents current weather and track conditions during a Formula 1 session.
@@ -40,11 +42,13 @@ class WeatherData(Event):
         SignalR event: "WeatherData"
     """
 
-    data_type: Final[LiveTimingEvent] = LiveTimingEvent.WEATHER_DATA
-    air_temperature: float
-    humidity: float
-    air_pressure: float
-    rainfall: float
-    track_temperature: float
-    wind_direction: float
-    wind_speed: float
+    data_type: Final[LiveTimingEvent] = field(
+        default=LiveTimingEvent.WEATHER_DATA, init=False
+    )
+    air_temperature: float = feed("AirTemp", parse_float)
+    humidity: float = feed("Humidity", parse_float)
+    air_pressure: float = feed("Pressure", parse_float)
+    rainfall: float = feed("Rainfall", parse_float)
+    track_temperature: float = feed("TrackTemp", parse_float)
+    wind_direction: float = feed("WindDirection", parse_float)
+    wind_speed: float = feed("WindSpeed", parse_float)
@@ -0,0 +1,181 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Hashable, Optional
+
+from .enums.overflow_policy import OverflowPolicy
+from ..const import DOMAIN
+
+if TYPE_CHECKING:
+    from .interfaces.async_observable import AsyncObservable
+    from .interfaces.event import Event
+    from .interfaces.notifiable import Notifiable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QueueMetrics:
+    """
+    Point-in-time statistics of an async observer's queue.
+
+    Attributes:
+        depth: Number of events currently waiting.
+        max_depth: Highest number of events that were waiting at once.
+        capacity: Maximum number of events the queue holds.
+        delivered: Events the observer received without raising.
+        failed: Events the observer raised an exception for.
+        dropped: Events discarded because the queue was full.
+        coalesced: Events replaced by a newer event of the same topic.
+        blocked: Times the producer had to wait for free space.
+    """
+
+    depth: int
+    max_depth: int
+    capacity: int
+    delivered: int
+    failed: int
+    dropped: int
+    coalesced: int
+    blocked: int
+
+
+class ObserverQueue:
+    """
+    Bounded event queue with its own consumer task for one async observer.
+
+    `offer()` never blocks. With `OverflowPolicy.BLOCK`, it returns False when
+    the queue is full and the producer is expected to `await put()` instead.
+
+    Example:
+        queue = ObserverQueue(client, entity, maxsize=50, policy=OverflowPolicy.COALESCE)
+        queue.start()
+        queue.offer(event)
+    """
+
+    DEFAULT_MAXSIZE = 100
+
+    def __init__(
+        self,
+        subject: "Notifiable",
+        observer: "AsyncObservable",
+        maxsize: int = DEFAULT_MAXSIZE,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self._subject = subject
+        self._observer = observer
+        self._maxsize = maxsize
+        self._policy = policy
+        # Keyed by topic when coalescing, by a running sequence number otherwise.
+        self._items: "OrderedDict[Hashable, Event]" = OrderedDict()
+        self._seq = 0
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._task: Optional[asyncio.Task] = None
+
+        self._max_depth = 0
+        self._delivered = 0
+        self._failed = 0
+        self._dropped = 0
+        self._coalesced = 0
+        self._blocked = 0
+
+    @property
+    def policy(self) -> OverflowPolicy:
+        return self._policy
+
+    @property
+    def metrics(self) -> QueueMetrics:
+        """Current queue statistics."""
+        return QueueMetrics(
+            depth=len(self._items),
+            max_depth=self._max_depth,
+            capacity=self._maxsize,
+            delivered=self._delivered,
+            failed=self._failed,
+            dropped=self._dropped,
+            coalesced=self._coalesced,
+            blocked=self._blocked,
+        )
+
+    # ---------------- Producer side ----------------
+    def offer(self, message: "Event") -> bool:
+        """
+        Queue an event without waiting.
+
+        Returns:
+            False only if the policy is `BLOCK` and the queue is full.
+        """
+        if self._policy is OverflowPolicy.COALESCE:
+            key = message.data_type
+            if key in self._items:
+                self._items[key] = message
+                self._coalesced += 1
+                return True
+        else:
+            key = self._seq
+            self._seq += 1
+
+        if len(self._items) >= self._maxsize:
+            if self._policy is OverflowPolicy.BLOCK:
+                self._not_full.clear()
+                return False
+            self._items.popitem(last=False)
+            self._dropped += 1
+
+        self._items[key] = message
+        self._max_depth = max(self._max_depth, len(self._items))
+        self._not_empty.set()
+        return True
+
+    async def put(self, message: "Event") -> None:
+        """Queue an event, waiting for free space if the policy is `BLOCK`."""
+        if self.offer(message):
+            return
+        self._blocked += 1
+        while True:
+            await self._not_full.wait()
+            if self.offer(message):
+                return
+
+    # ---------------- Consumer side ----------------
+    def start(self) -> None:
+        """Start the consumer task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self) -> None:
+        """Cancel the consumer task. Queued events are discarded."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._items.clear()
+        self._not_full.set()
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                await self._not_empty.wait()
+                _, message = self._items.popitem(last=False)
+                if not self._items:
+                    self._not_empty.clear()
+                self._not_full.set()
+
+                try:
+                    await self._observer.async_receive(self._subject, message)
+                except Exception:
+                    self._failed += 1
+                    _LOGGER.exception(
+                        "[%s] Failed to notify async observer: %s",
+                        DOMAIN,
+                        self._observer,
+                    )
+                else:
+                    self._delivered += 1
+        except asyncio.CancelledError:
+            _LOGGER.debug("[%s] Observer queue task cancelled", DOMAIN)
@@ -0,0 +1,163 @@
+from dataclasses import dataclass, field
+from typing import Collection, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .enums.live_timing_event import LiveTimingEvent
+from .interfaces.observable import Observable
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """
+    Describes which events an observer wants to receive.
+
+    Attributes:
+        observer: The attached observer.
+        topics: The topics to deliver, or None for every topic.
+        drivers: The racing numbers (as strings) to deliver updates for,
+                 or None for every driver.
+    """
+
+    observer: Observable
+    topics: Optional[FrozenSet[LiveTimingEvent]] = None
+    drivers: Optional[FrozenSet[str]] = None
+
+
+@dataclass(frozen=True)
+class _TopicIndex:
+    """Prebuilt observer lookup for a single topic."""
+
+    # Observers without a driver filter.
+    everyone: Tuple[Observable, ...] = ()
+    # Observers with a driver filter, keyed by each driver they follow.
+    by_driver: Dict[str, Tuple[Observable, ...]] = field(default_factory=dict)
+    # All observers with a driver filter, used when the drivers are unknown.
+    filtered: Tuple[Observable, ...] = ()
+
+
+class ObserverRegistry:
+    """
+    Keeps track of attached observers and what they are interested in.
+
+    Observers can subscribe to a set of topics and/or a set of drivers. A
+    topic → observers index is rebuilt whenever the subscriptions change, so
+    looking up the recipients of an event only touches interested observers.
+
+    Example:
+        registry = ObserverRegistry()
+        registry.add(sensor, topics={LiveTimingEvent.TIMING_DATA}, drivers={"44"})
+        for observer in registry.observers_for(LiveTimingEvent.TIMING_DATA, {"44"}):
+            observer.update(client, event)
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: Dict[Observable, Subscription] = {}
+        self._index: Dict[LiveTimingEvent, _TopicIndex] = {}
+
+    def __contains__(self, observer: Observable) -> bool:
+        return observer in self._subscriptions
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+    @property
+    def subscriptions(self) -> List[Subscription]:
+        """All current subscriptions, in attach order."""
+        return list(self._subscriptions.values())
+
+    def add(
+        self,
+        observer: Observable,
+        topics: Optional[Collection[LiveTimingEvent]] = None,
+        drivers: Optional[Collection[str]] = None,
+    ) -> Subscription:
+        """
+        Subscribe an observer, replacing any previous subscription it had.
+
+        Args:
+            observer: The observer to subscribe.
+            topics: The topics to deliver, or None for every topic.
+            drivers: The racing numbers to deliver updates for, or None
+                     for every driver.
+
+        Returns:
+            The stored `Subscription`.
+        """
+        subscription = Subscription(
+            observer=observer,
+            topics=frozenset(topics) if topics is not None else None,
+            drivers=frozenset(str(d) for d in drivers) if drivers is not None else None,
+        )
+        self._subscriptions[observer] = subscription
+        self._rebuild()
+        return subscription
+
+    def remove(self, observer: Observable) -> bool:
+        """Unsubscribe an observer. Returns whether it was subscribed."""
+        if self._subscriptions.pop(observer, None) is None:
+            return False
+        self._rebuild()
+        return True
+
+    def observers_for(
+        self,
+        topic: LiveTimingEvent,
+        drivers: Optional[Collection[str]] = None,
+    ) -> Iterable[Observable]:
+        """
+        Return the observers interested in an event.
+
+        Args:
+            topic: The topic of the event.
+            drivers: The racing numbers the event touches, or None if unknown.
+                     Driver-filtered observers are included when the drivers
+                     are unknown, and when the event touches no driver at all
+                     (a topic-level update such as `Withheld`).
+
+        Returns:
+            The interested observers, each at most once.
+        """
+        index = self._index.get(topic)
+        if index is None:
+            return ()
+
+        if not drivers:
+            return index.everyone + index.filtered
+        if not index.by_driver:
+            return index.everyone
+
+        matched = [
+            observer
+            for driver in drivers
+            for observer in index.by_driver.get(driver, ())
+        ]
+        if not matched:
+            return index.everyone
+        return index.everyone + tuple(dict.fromkeys(matched))
+
+    def _rebuild(self) -> None:
+        """Recompute the topic → observers index from the subscriptions."""
+        index: Dict[LiveTimingEvent, _TopicIndex] = {}
+
+        for topic in LiveTimingEvent:
+            everyone: List[Observable] = []
+            filtered: List[Observable] = []
+            by_driver: Dict[str, List[Observable]] = {}
+
+            for sub in self._subscriptions.values():
+                if sub.topics is not None and topic not in sub.topics:
+                    continue
+                if sub.drivers is None:
+                    everyone.append(sub.observer)
+                    continue
+                filtered.append(sub.observer)
+                for driver in sub.drivers:
+                    by_driver.setdefault(driver, []).append(sub.observer)
+
+            if everyone or filtered:
+                index[topic] = _TopicIndex(
+                    everyone=tuple(everyone),
+                    by_driver={d: tuple(obs) for d, obs in by_driver.items()},
+                    filtered=tuple(filtered),
+                )
+
+        self._index = index
@@ -1,8 +1,10 @@
 """Parser definitions for the RacePulse F1 client."""
 
+from .car_data import CarDataParser
 from .driver_list import DriverListParser
 from .extrapolated_clock import ExtrapolatedClockParser
 from .heartbeat import HeartbeatParser
+from .position import PositionParser
 from .race_control_messages import RaceControlMessagesParser
 from .session_info import SessionInfoParser
 from .team_radio import TeamRadioParser
@@ -13,9 +15,11 @@ from .track_status import TrackStatusParser
 from .weather_data import WeatherDataParser
 
 __all__ = [
+    "CarDataParser",
     "DriverListParser",
     "ExtrapolatedClockParser",
     "HeartbeatParser",
+    "PositionParser",
     "RaceControlMessagesParser",
     "SessionInfoParser",
     "TeamRadioParser",
@@ -0,0 +1,15 @@
+from ..interfaces import SchemaParser
+from ..models import CarData
+from ..enums import LiveTimingEvent
+from ..decorators import register_parser
+
+
+@register_parser(LiveTimingEvent.CAR_DATA)
+class CarDataParser(SchemaParser[CarData]):
+    """
+    Parses decoded 'CarData.z' payloads into a `CarData` dataclass.
+
+    The payload must already be inflated by the client; see `decoder.inflate`.
+    """
+
+    model = CarData
@@ -0,0 +1,15 @@
+from ..interfaces import SchemaParser
+from ..models import Position
+from ..enums import LiveTimingEvent
+from ..decorators import register_parser
+
+
+@register_parser(LiveTimingEvent.POSITION)
+class PositionParser(SchemaParser[Position]):
+    """
+    Parses decoded 'Position.z' payloads into a `Position` dataclass.
+
+    The payload must already be inflated by the client; see `decoder.inflate`.
+    """
+
+    model = Position
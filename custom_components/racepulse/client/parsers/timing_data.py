@@ -1,6 +1,7 @@
+from dataclasses import replace
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from ..interfaces import EventParser
 from ..models import (
-    RawTimingEvent,
     TimingData,
     DriverTiming,
     LastLapTime,
@@ -12,92 +13,299 @@ from ..models import (
 )
 from ..enums import LiveTimingEvent
 from ..decorators import register_parser
-from ...helpers import parse_int, parse_bool
+from ..state.topic_store import DELETED_KEY
+from ...helpers import parse_int, parse_bool, parse_time_ms
+
+
+def _text(value: Any) -> Any:
+    return "" if value is None else value
+
+
+def _raw(value: Any) -> Any:
+    return value
+
+
+# Race sessions nest the interval: {"Value": "+0.456", "Catching": true}.
+def _interval_text(raw: Any) -> Any:
+    return _text(raw.get("Value") if isinstance(raw, dict) else raw)
+
+
+def _interval_ms(raw: Any) -> Optional[int]:
+    return parse_time_ms(raw.get("Value") if isinstance(raw, dict) else raw)
+
+
+def _catching(raw: Any) -> bool:
+    return isinstance(raw, dict) and parse_bool(raw.get("Catching"))
+
+
+# Scalar fields: (JSON key, dataclass field, converter of the raw value).
+# Time strings feed two fields: the display string and its milliseconds.
+_Fields = Tuple[Tuple[str, str, Callable[[Any], Any]], ...]
+
+_LINE_FIELDS: _Fields = (
+    ("TimeDiffToFastest", "time_diff_to_fastest", _text),
+    ("TimeDiffToFastest", "time_diff_to_fastest_ms", parse_time_ms),
+    ("TimeDiffToPositionAhead", "time_diff_to_position_ahead", _text),
+    ("TimeDiffToPositionAhead", "time_diff_to_position_ahead_ms", parse_time_ms),
+    ("GapToLeader", "gap_to_leader", _text),
+    ("GapToLeader", "gap_to_leader_ms", parse_time_ms),
+    ("IntervalToPositionAhead", "interval_to_position_ahead", _interval_text),
+    ("IntervalToPositionAhead", "interval_to_position_ahead_ms", _interval_ms),
+    ("IntervalToPositionAhead", "catching", _catching),
+    ("Line", "line", parse_int),
+    ("Position", "position", _text),
+    ("ShowPosition", "show_position", parse_bool),
+    ("RacingNumber", "racing_number", parse_int),
+    ("Retired", "retired", parse_bool),
+    ("InPit", "in_pit", parse_bool),
+    ("PitOut", "pit_out", parse_bool),
+    ("Stopped", "stopped", parse_bool),
+    ("Status", "status", parse_int),
+    ("NumberOfLaps", "number_of_laps", parse_int),
+    ("NumberOfPitStops", "number_of_pit_stops", parse_int),
+)
+
+_SECTOR_FIELDS: _Fields = (
+    ("Stopped", "stopped", parse_bool),
+    ("Value", "value", _text),
+    ("Value", "value_ms", parse_time_ms),
+    ("Status", "status", parse_int),
+    ("OverallFastest", "overall_fastest", parse_bool),
+    ("PersonalFastest", "personal_fastest", parse_bool),
+    ("PreviousValue", "previous_value", _raw),
+)
+
+_SPEED_FIELDS = {"I1": "i1", "I2": "i2", "FL": "fl", "ST": "st"}
+
+
+def _touched(delta: Dict[str, Any]) -> Set[str]:
+    """Keys a partial update sets or removes through `_deleted`."""
+    keys = set(delta)
+    keys.update(str(key) for key in delta.get(DELETED_KEY) or ())
+    return keys
 
 
 @register_parser(LiveTimingEvent.TIMING_DATA)
 class TimingDataParser(EventParser[TimingData]):
-    """Parses 'TimingData' events into a fully structured `TimingData` dataclass."""
-
-    def parse(self, raw: RawTimingEvent) -> TimingData:
-        payload = raw.payload
-        lines_data = payload.get("Lines", {})
-        lines = {}
-
-        for num, data in lines_data.items():
-            # --- Parse nested segments ---
-            sectors = []
-            for s in data.get("Sectors", []):
-                segments = [
-                    Segment(status=parse_int(seg.get("Status")))
-                    for seg in s.get("Segments", [])
-                ]
-                sectors.append(
-                    Sector(
-                        stopped=parse_bool(s.get("Stopped")),
-                        value=s.get("Value", ""),
-                        status=parse_int(s.get("Status")),
-                        overall_fastest=parse_bool(s.get("OverallFastest")),
-                        personal_fastest=parse_bool(s.get("PersonalFastest")),
-                        segments=segments,
-                        previous_value=s.get("PreviousValue"),
-                    )
-                )
+    """
+    Parses 'TimingData' events into a fully structured `TimingData` dataclass.
 
-            # --- Parse speeds ---
-            speeds = None
-            if "Speeds" in data:
-                sp = data["Speeds"]
-                speeds = Speed(
-                    i1=self._parse_speed_data(sp.get("I1")),
-                    i2=self._parse_speed_data(sp.get("I2")),
-                    fl=self._parse_speed_data(sp.get("FL")),
-                    st=self._parse_speed_data(sp.get("ST")),
-                )
+    Besides full parsing, `parse_incremental()` applies a partial update to
+    the previous `TimingData`: only the lines, sectors, segments and speeds
+    named in the update are rebuilt, everything else is shared with the
+    previous event.
+    """
 
-            # --- Parse best and last lap times ---
-            best_lap = None
-            if "BestLapTime" in data:
-                b = data["BestLapTime"]
-                best_lap = BestLapTime(
-                    value=b.get("Value", ""), lap=parse_int(b.get("Lap"))
-                )
+    def parse_payload(self, payload: Any) -> TimingData:
+        lines = {
+            num: self._parse_line(data)
+            for num, data in payload.get("Lines", {}).items()
+        }
 
-            last_lap = None
-            if "LastLapTime" in data:
-                l = data["LastLapTime"]
-                last_lap = LastLapTime(
-                    value=l.get("Value", ""),
-                    status=parse_int(l.get("Status")),
-                    overall_fastest=parse_bool(l.get("OverallFastest")),
-                    personal_fastest=parse_bool(l.get("PersonalFastest")),
-                )
+        return TimingData(
+            lines=lines, withheld=parse_bool(payload.get("Withheld", False))
+        )
 
-            # --- Build driver timing entry ---
-            lines[num] = DriverTiming(
-                time_diff_to_fastest=data.get("TimeDiffToFastest", ""),
-                time_diff_to_position_ahead=data.get("TimeDiffToPositionAhead", ""),
-                line=parse_int(data.get("Line")),
-                position=data.get("Position", ""),
-                show_position=parse_bool(data.get("ShowPosition")),
-                racing_number=parse_int(data.get("RacingNumber")),
-                retired=parse_bool(data.get("Retired")),
-                in_pit=parse_bool(data.get("InPit")),
-                pit_out=parse_bool(data.get("PitOut")),
-                stopped=parse_bool(data.get("Stopped")),
-                status=parse_int(data.get("Status")),
-                sectors=sectors,
-                speeds=speeds,
-                best_lap_time=best_lap,
-                last_lap_time=last_lap,
-                number_of_laps=parse_int(data.get("NumberOfLaps")),
-                number_of_pit_stops=parse_int(data.get("NumberOfPitStops")),
-            )
+    def parse_incremental(
+        self, previous: TimingData, payload: Any, delta: Any
+    ) -> TimingData:
+        """
+        Apply a partial update to the previous `TimingData`.
+
+        Args:
+            previous: The event parsed from the state before the update.
+            payload: The merged state of the topic, after the update.
+            delta: The partial update, as merged into the state.
+
+        Returns:
+            A new `TimingData` sharing every unchanged object with `previous`.
+        """
+        if not isinstance(delta, dict):
+            return self.parse_payload(payload)
+
+        lines_delta = delta.get("Lines")
+        if lines_delta is None:
+            lines = previous.lines
+        elif not isinstance(lines_delta, dict):
+            return self.parse_payload(payload)
+        else:
+            merged = payload.get("Lines", {})
+            lines = dict(previous.lines)
+
+            for num, line_delta in lines_delta.items():
+                if num == DELETED_KEY:
+                    continue
+                data = merged.get(num)
+                old = lines.get(num)
+                if data is None:
+                    lines.pop(num, None)
+                elif old is None or not isinstance(line_delta, dict):
+                    lines[num] = self._parse_line(data)
+                else:
+                    lines[num] = self._update_line(old, data, line_delta)
+
+            for num in lines_delta.get(DELETED_KEY) or ():
+                lines.pop(str(num), None)
 
         return TimingData(
             lines=lines, withheld=parse_bool(payload.get("Withheld", False))
         )
 
+    # --- Full parsing ---
+    def _parse_line(self, data: Dict[str, Any]) -> DriverTiming:
+        fields = {name: convert(data.get(key)) for key, name, convert in _LINE_FIELDS}
+
+        return DriverTiming(
+            **fields,
+            sectors=[self._parse_sector(s) for s in data.get("Sectors", [])],
+            speeds=self._parse_speed(data["Speeds"]) if "Speeds" in data else None,
+            best_lap_time=(
+                self._parse_best_lap(data["BestLapTime"])
+                if "BestLapTime" in data
+                else None
+            ),
+            last_lap_time=(
+                self._parse_last_lap(data["LastLapTime"])
+                if "LastLapTime" in data
+                else None
+            ),
+        )
+
+    @staticmethod
+    def _parse_sector(s: Dict[str, Any]) -> Sector:
+        return Sector(
+            **{name: convert(s.get(key)) for key, name, convert in _SECTOR_FIELDS},
+            segments=[
+                Segment(status=parse_int(seg.get("Status")))
+                for seg in s.get("Segments", [])
+            ],
+        )
+
+    def _parse_speed(self, sp: Dict[str, Any]) -> Speed:
+        return Speed(
+            **{
+                name: self._parse_speed_data(sp.get(key))
+                for key, name in _SPEED_FIELDS.items()
+            }
+        )
+
+    @staticmethod
+    def _parse_best_lap(b: Dict[str, Any]) -> BestLapTime:
+        return BestLapTime(
+            value=b.get("Value", ""),
+            value_ms=parse_time_ms(b.get("Value")),
+            lap=parse_int(b.get("Lap")),
+        )
+
+    @staticmethod
+    def _parse_last_lap(l: Dict[str, Any]) -> LastLapTime:
+        return LastLapTime(
+            value=l.get("Value", ""),
+            value_ms=parse_time_ms(l.get("Value")),
+            status=parse_int(l.get("Status")),
+            overall_fastest=parse_bool(l.get("OverallFastest")),
+            personal_fastest=parse_bool(l.get("PersonalFastest")),
+        )
+
+    # --- Incremental parsing ---
+    def _update_line(
+        self, old: DriverTiming, data: Dict[str, Any], delta: Dict[str, Any]
+    ) -> DriverTiming:
+        # Removed keys are converted from the merged data like changed ones,
+        # which yields the same value as a full parse without them.
+        keys = _touched(delta)
+        changes = {
+            name: convert(data.get(key))
+            for key, name, convert in _LINE_FIELDS
+            if key in keys
+        }
+
+        if "Sectors" in keys:
+            changes["sectors"] = self._update_sectors(
+                old.sectors, data.get("Sectors", []), delta.get("Sectors")
+            )
+        if "Speeds" in keys:
+            changes["speeds"] = (
+                self._update_speed(old.speeds, data["Speeds"], delta.get("Speeds"))
+                if "Speeds" in data
+                else None
+            )
+        if "BestLapTime" in keys:
+            changes["best_lap_time"] = (
+                self._parse_best_lap(data["BestLapTime"])
+                if "BestLapTime" in data
+                else None
+            )
+        if "LastLapTime" in keys:
+            changes["last_lap_time"] = (
+                self._parse_last_lap(data["LastLapTime"])
+                if "LastLapTime" in data
+                else None
+            )
+
+        return replace(old, **changes) if changes else old
+
+    def _update_sectors(
+        self, old: List[Sector], data: List[Dict[str, Any]], delta: Any
+    ) -> List[Sector]:
+        # Full lists, or items added or removed, are cheaper to rebuild whole.
+        if not isinstance(delta, dict) or len(old) != len(data):
+            return [self._parse_sector(s) for s in data]
+
+        sectors = list(old)
+        for key, sector_delta in delta.items():
+            if not key.isdigit() or int(key) >= len(data):
+                continue
+            index = int(key)
+            if isinstance(sector_delta, dict):
+                sectors[index] = self._update_sector(
+                    sectors[index], data[index], sector_delta
+                )
+            else:
+                sectors[index] = self._parse_sector(data[index])
+        return sectors
+
+    def _update_sector(
+        self, old: Sector, data: Dict[str, Any], delta: Dict[str, Any]
+    ) -> Sector:
+        keys = _touched(delta)
+        changes = {
+            name: convert(data.get(key))
+            for key, name, convert in _SECTOR_FIELDS
+            if key in keys
+        }
+
+        if "Segments" in keys:
+            segments = data.get("Segments", [])
+            segments_delta = delta.get("Segments")
+            if isinstance(segments_delta, dict) and len(old.segments) == len(segments):
+                changes["segments"] = list(old.segments)
+                for key in segments_delta:
+                    if key.isdigit() and int(key) < len(segments):
+                        changes["segments"][int(key)] = Segment(
+                            status=parse_int(segments[int(key)].get("Status"))
+                        )
+            else:
+                changes["segments"] = [
+                    Segment(status=parse_int(seg.get("Status"))) for seg in segments
+                ]
+
+        return replace(old, **changes) if changes else old
+
+    def _update_speed(
+        self, old: Optional[Speed], data: Dict[str, Any], delta: Any
+    ) -> Speed:
+        if old is None or not isinstance(delta, dict):
+            return self._parse_speed(data)
+
+        keys = _touched(delta)
+        changes = {
+            name: self._parse_speed_data(data.get(key))
+            for key, name in _SPEED_FIELDS.items()
+            if key in keys
+        }
+        return replace(old, **changes) if changes else old
+
     # --- Helper methods ---
     @staticmethod
     def _parse_speed_data(data) -> SpeedData:
@@ -1,13 +1,11 @@
-from ..enums.live_timing_event import LiveTimingEvent
-from ..models.raw_timing_event import RawTimingEvent
-from ..models.weather_data import WeatherData
-from ..interfaces.event_parser import EventParser
-from ..decorators.parser import register_parser
-from ...helpers import parse_float
+from ..interfaces import SchemaParser
+from ..models import WeatherData
+from ..enums import LiveTimingEvent
+from ..decorators import register_parser
 
 
-@register_parser(LiveTimingEvent.WEATHER)
-class WeatherDataParser(EventParser[WeatherData]):
+@register_parser(LiveTimingEvent.WEATHER_DATA)
+class WeatherDataParser(SchemaParser[WeatherData]):
     """
     Parses a 'WeatherData' event payload into a `WeatherData` dataclass.
 
@@ -26,15 +24,4 @@ class WeatherDataParser(EventParser[WeatherData]):
         }
     """
 
-    def parse(self, raw: RawTimingEvent) -> WeatherData:
-        payload = raw.payload or {}
-
-        return WeatherData(
-            air_temperature=parse_float(payload.get("AirTemp")),
-            humidity=parse_float(payload.get("Humidity")),
-            air_pressure=parse_float(payload.get("Pressure")),
-            rainfall=parse_float(payload.get("Rainfall")),
-            track_temperature=parse_float(payload.get("TrackTemp")),
-            wind_direction=parse_float(payload.get("WindDirection")),
-            wind_speed=parse_float(payload.get("WindSpeed")),
-        )
+    model = WeatherData
@@ -0,0 +1,224 @@
+import asyncio
+import gzip
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union
+
+from .enums.live_timing_event import LiveTimingEvent
+from ..const import DOMAIN
+
+if TYPE_CHECKING:
+    from .interfaces.event import Event
+    from .interfaces.notifiable import Notifiable
+
+_LOGGER = logging.getLogger(__name__)
+
+UNKNOWN_SESSION = "unknown"
+CAPTURE_PATTERN = "frames-*.txt.gz"
+
+
+class FrameRecorder:
+    """
+    Records every raw websocket frame to compressed, append-only capture files.
+
+    Frames are stored per session, in a directory named after
+    `SessionInfo.path` (e.g. `2025/2025-10-05_Singapore_Grand_Prix/2025-10-05_Race/`).
+    Each line holds the monotonic receive time and the raw frame, separated by
+    a tab. Files are gzip streams that are only ever appended to, and a new
+    file is started once the current one exceeds `max_file_bytes`.
+
+    `record()` only appends to an in-memory buffer. The buffer is written by a
+    background task in the default executor, so the listen loop never waits
+    on disk I/O.
+
+    Attach the recorder to the client, which feeds it frames and keeps it
+    informed about the current session:
+
+        recorder = FrameRecorder(hass.config.path("racepulse_captures"))
+        client.attach_recorder(recorder)
+    """
+
+    FLUSH_INTERVAL = 5.0  # Seconds between background flushes
+    MAX_BUFFERED = 5000  # Frames buffered before an early flush
+    MAX_FILE_BYTES = 32 * 1024 * 1024  # Compressed size before rotating
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        flush_interval: float = FLUSH_INTERVAL,
+        max_file_bytes: int = MAX_FILE_BYTES,
+    ):
+        self._directory = Path(directory)
+        self._flush_interval = flush_interval
+        self._max_file_bytes = max_file_bytes
+        self._session: Optional[str] = None
+        self._buffer: List[str] = []
+        # Lines of sessions that ended before their buffer was flushed.
+        self._pending: List[Tuple[str, List[str]]] = []
+        self._files: Dict[str, Path] = {}
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # Serializes flushes, so two writes never touch the same file at once.
+        self._lock = asyncio.Lock()
+        self._writing: Optional[asyncio.Future] = None
+        self.frames: int = 0
+
+    @property
+    def session(self) -> Optional[str]:
+        """The session path frames are currently recorded under."""
+        return self._session
+
+    def session_directory(self, session: Optional[str]) -> Path:
+        """Return the capture directory of a session path."""
+        parts = [
+            part
+            for part in (session or "").replace("\\", "/").split("/")
+            if part not in ("", ".", "..")
+        ]
+        return self._directory.joinpath(*(parts or [UNKNOWN_SESSION]))
+
+    # ---------------- Recording ----------------
+    def record(self, frame: str, received: Optional[float] = None) -> None:
+        """
+        Buffer a raw frame for writing.
+
+        Args:
+            frame: The raw websocket text frame.
+            received: The `time.monotonic()` receive time. Defaults to now.
+        """
+        if received is None:
+            received = time.monotonic()
+
+        # JSON never needs a literal newline, so one frame always stays one line.
+        frame = frame.replace("\n", " ")
+        self._buffer.append(f"{received:.6f}\t{frame}\n")
+        self.frames += 1
+
+        if len(self._buffer) >= self.MAX_BUFFERED:
+            self._wakeup.set()
+
+    def set_session(self, path: Optional[str]) -> None:
+        """Switch the session that subsequent frames are recorded under."""
+        path = path or None
+        if path == self._session:
+            return
+
+        # Frames recorded before any session was known belong to the first one.
+        if self._session is not None and self._buffer:
+            self._pending.append((self._session, self._buffer))
+            self._buffer = []
+            self._wakeup.set()
+
+        _LOGGER.debug("[%s] Recording session: %s", DOMAIN, path)
+        self._session = path
+
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook; follows `SessionInfo` events to pick the session."""
+        if message.data_type != LiveTimingEvent.SESSION_INFO:
+            return
+        if (message.path or None) == self._session:
+            return
+
+        # The client records each frame before parsing it, so the frame that
+        # announced the new session is the last one buffered; it belongs to
+        # the new session.
+        frame = None
+        if self._session is not None and self._buffer:
+            frame = self._buffer.pop()
+        self.set_session(message.path)
+        if frame is not None:
+            self._buffer.append(frame)
+
+    # ---------------- Background flushing ----------------
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the background task and write everything still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write all buffered frames in the default executor."""
+        async with self._lock:
+            # A flush cancelled while writing releases the lock, but its
+            # write keeps running in the executor.
+            if self._writing is not None and not self._writing.done():
+                await asyncio.shield(self._writing)
+
+            batches = self._pending
+            if self._buffer:
+                batches.append((self._session or UNKNOWN_SESSION, self._buffer))
+            self._pending = []
+            self._buffer = []
+            self._wakeup.clear()
+
+            if batches:
+                loop = asyncio.get_running_loop()
+                self._writing = loop.run_in_executor(None, self._write, batches)
+                await asyncio.shield(self._writing)
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self._flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+                try:
+                    await self.flush()
+                except OSError:
+                    _LOGGER.exception("[%s] Failed to write frame capture", DOMAIN)
+        except asyncio.CancelledError:
+            _LOGGER.debug("[%s] Recorder task cancelled", DOMAIN)
+
+    def _write(self, batches: List[Tuple[str, List[str]]]) -> None:
+        """Append batches to their session files. Runs in a worker thread."""
+        for session, lines in batches:
+            path = self._current_file(session)
+            with gzip.open(path, "at", encoding="utf-8") as f:
+                f.writelines(lines)
+
+            if path.stat().st_size >= self._max_file_bytes:
+                self._files[session] = self._next_file(path)
+
+    def _current_file(self, session: str) -> Path:
+        path = self._files.get(session)
+        if path is None:
+            directory = self.session_directory(session)
+            directory.mkdir(parents=True, exist_ok=True)
+            existing = sorted(directory.glob(CAPTURE_PATTERN))
+            path = existing[-1] if existing else directory / "frames-0000.txt.gz"
+            if path.exists() and path.stat().st_size >= self._max_file_bytes:
+                path = self._next_file(path)
+            self._files[session] = path
+        return path
+
+    @staticmethod
+    def _next_file(path: Path) -> Path:
+        index = int(path.name.split("-")[1].split(".")[0]) + 1
+        return path.with_name(f"frames-{index:04d}.txt.gz")
+
+
+def read_capture(directory: Union[str, Path]) -> Iterator[Tuple[float, str]]:
+    """
+    Stream the frames of a recorded session, oldest first.
+
+    Args:
+        directory: A session capture directory written by `FrameRecorder`.
+
+    Yields:
+        `(received, frame)` tuples, where `received` is the monotonic receive
+        time in seconds and `frame` the raw websocket text frame.
+    """
+    for path in sorted(Path(directory).glob(CAPTURE_PATTERN)):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                received, _, frame = line.rstrip("\n").partition("\t")
+                if frame:
+                    yield float(received), frame
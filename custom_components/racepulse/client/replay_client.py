@@ -0,0 +1,167 @@
+import asyncio
+from dataclasses import dataclass
+import logging
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+from .base_client import BaseTimingClient
+from .decoder import CompressedTopicDecoder
+from .recorder import read_capture
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ReplayStats:
+    """
+    Summary of a finished replay.
+
+    Attributes:
+        frames: Number of raw frames replayed.
+        events: Number of parsed events delivered to observers.
+        elapsed: Wall-clock duration of the replay in seconds.
+        recorded: Duration of the recorded traffic in seconds.
+    """
+
+    frames: int
+    events: int
+    elapsed: float
+    recorded: float
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ReplayClient(BaseTimingClient):
+    """
+    Feeds recorded frames through the same pipeline as `F1SignalRClient`.
+
+    Frames are read from a capture written by `FrameRecorder` (or any iterable
+    of `(received, frame)` tuples) and released according to their recorded
+    receive times, divided by `speed`:
+
+        - `speed=1.0` replays in real time.
+        - `speed=10.0` replays ten times faster.
+        - `speed=None` replays as fast as possible, which makes the returned
+          `ReplayStats` a throughput benchmark of the whole pipeline.
+
+    Observers attach exactly as they would to the live client, and `lazy`
+    selects lazy views just like on `F1SignalRClient`.
+
+    Example:
+        client = ReplayClient("captures/2025/2025-10-05_Singapore_Grand_Prix/2025-10-05_Race", speed=None)
+        client.attach(sensor, topics={LiveTimingEvent.TIMING_DATA})
+        stats = await client.replay()
+        print(f"{stats.events_per_second:.0f} events/s")
+    """
+
+    # Yield to other tasks at least this often when replaying at max speed.
+    YIELD_EVERY = 100
+
+    def __init__(
+        self,
+        source: Union[str, Path, Iterable[Tuple[float, str]]],
+        speed: Optional[float] = 1.0,
+        lazy: bool = False,
+    ):
+        super().__init__(lazy=lazy)
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive, or None for max speed")
+
+        self._source = source
+        self._speed = speed
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Whether a replay is in progress."""
+        return self._running
+
+    async def connect(self) -> None:
+        """Replay the source; mirrors `F1SignalRClient.connect()`."""
+        await self.replay()
+
+    async def disconnect(self) -> None:
+        """Stop the replay and the async observers' consumer tasks."""
+        self._running = False
+        self._stop_queues()
+
+    async def replay(self) -> ReplayStats:
+        """
+        Replay every frame of the source.
+
+        Returns:
+            Statistics about the replay.
+        """
+        if isinstance(self._source, (str, Path)):
+            frames: Iterable[Tuple[float, str]] = read_capture(self._source)
+        else:
+            frames = self._source
+
+        loop = asyncio.get_running_loop()
+        decoder_task = loop.create_task(self._decoder.run())
+        self._running = True
+        self._reset_state()
+
+        events_before = self.events
+        started = loop.time()
+        recorded = 0.0
+        previous: Optional[float] = None
+        count = 0
+
+        _LOGGER.info("[%s] Starting replay at %sx", DOMAIN, self._speed or "max")
+        try:
+            for received, frame in frames:
+                if not self._running:
+                    break
+
+                # Monotonic clocks restart with the host; never go backwards.
+                if previous is not None and received > previous:
+                    recorded += received - previous
+                previous = received
+
+                if self._speed is not None:
+                    delay = started + recorded / self._speed - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                elif count % self.YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+
+                try:
+                    self._handle_frame(frame)
+                except ValueError:
+                    _LOGGER.warning("[%s] Skipping malformed frame", DOMAIN)
+                count += 1
+
+                if self._blocked:
+                    await self._drain_blocked()
+                # Keep the decoder from dropping frames when replaying fast.
+                if self._decoder.pending >= CompressedTopicDecoder.MAX_BATCH:
+                    await self._decoder.join()
+
+            await self._decoder.join()
+        finally:
+            decoder_task.cancel()
+            self._running = False
+
+        stats = ReplayStats(
+            frames=count,
+            events=self.events - events_before,
+            elapsed=loop.time() - started,
+            recorded=recorded,
+        )
+        _LOGGER.info(
+            "[%s] Replay finished: %d frames, %d events in %.1f s (%.0f events/s)",
+            DOMAIN,
+            stats.frames,
+            stats.events,
+            stats.elapsed,
+            stats.events_per_second,
+        )
+        return stats
@@ -0,0 +1,191 @@
+import dataclasses
+from dataclasses import dataclass
+import linecache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar, Union
+
+T = TypeVar("T")
+
+# Key of the `FeedField` in a dataclass field's metadata.
+FEED = "feed"
+
+Converter = Callable[[Any], Any]
+Key = Union[str, Tuple[str, ...], None]
+
+_EMPTY: Dict[str, Any] = {}
+_COMPILED: Dict[type, Callable[[Any], Any]] = {}
+_LITERALS = (type(None), bool, int, float, str)
+
+
+@dataclass(frozen=True)
+class FeedField:
+    """
+    Where a model field comes from in the topic payload.
+
+    Attributes:
+        key: The JSON key of the raw value. A tuple is a path into nested
+             objects; None stands for the payload itself.
+        convert: Turns the raw value (or `default`) into the field value.
+                 None keeps the raw value.
+        default: Raw value used when the key is missing from the payload.
+    """
+
+    key: Key
+    convert: Optional[Converter] = None
+    default: Any = None
+
+
+def feed(key: Key, convert: Optional[Converter] = None, default: Any = None) -> Any:
+    """
+    Declare a model field read from the topic payload.
+
+    Use in place of `dataclasses.field()` on model dataclasses. A missing key
+    is handled like any other value: `convert(default)` is stored, so partial
+    payloads never raise.
+
+    Example:
+        @dataclass(frozen=True, slots=True)
+        class TrackStatus(Event):
+            status: str = feed("Status", parse_string, default="unknown")
+
+    Args:
+        key: The JSON key of the raw value; see `FeedField.key`.
+        convert: Turns the raw value into the field value.
+        default: Raw value used when the key is missing.
+    """
+    return dataclasses.field(metadata={FEED: FeedField(key, convert, default)})
+
+
+# --- Converters for nested values ---
+def model(cls: Type[T]) -> Callable[[Any], T]:
+    """Converter parsing a nested object into the model `cls`."""
+    return compile_parser(cls)
+
+
+def optional(convert: Converter) -> Converter:
+    """Converter keeping a missing (None) value as None."""
+    return lambda raw: None if raw is None else convert(raw)
+
+
+def list_of(convert: Converter) -> Callable[[Any], List[Any]]:
+    """Converter applying `convert` to every item of a JSON array."""
+    return lambda raw: [convert(item) for item in raw or ()]
+
+
+def dict_of(convert: Converter) -> Callable[[Any], Dict[str, Any]]:
+    """
+    Converter applying `convert` to every value of a JSON object.
+
+    Keys starting with an underscore are feed metadata (e.g. `_kf`) and
+    are skipped.
+    """
+    return lambda raw: {
+        key: convert(value)
+        for key, value in (raw or _EMPTY).items()
+        if not key.startswith("_")
+    }
+
+
+def indexed(convert: Converter) -> Callable[[Any], Dict[str, Any]]:
+    """Converter turning a JSON array into a dict keyed by the item index."""
+    return lambda raw: {str(i): convert(item) for i, item in enumerate(raw or ())}
+
+
+# --- Compiler ---
+def compile_parser(cls: Type[T]) -> Callable[[Any], T]:
+    """
+    Return the parse function generated for a model dataclass.
+
+    The function is generated once per model from the `feed()` metadata of
+    its fields, as straight-line code: one `get` per key and one converter
+    call per field, with every converter and default bound in a closure.
+    Fields without metadata (e.g. `data_type`) keep their dataclass default.
+
+    Example:
+        >>> from custom_components.racepulse.client.models import WeatherData
+        >>> parse = compile_parser(WeatherData)
+        >>> parse({"AirTemp": "28.5"}).air_temperature
+        28.5
+
+    Args:
+        cls: A dataclass whose init fields all carry `feed()` metadata.
+
+    Returns:
+        A function turning a payload (a dict, or None) into a `cls`.
+    """
+    parse = _COMPILED.get(cls)
+    if parse is None:
+        parse = _COMPILED[cls] = _generate(cls)
+    return parse
+
+
+def _generate(cls: type) -> Callable[[Any], Any]:
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} is not a dataclass")
+
+    bindings: Dict[str, Any] = {"_cls": cls, "_EMPTY": _EMPTY}
+    getters: Dict[Tuple[str, ...], str] = {(): "get"}
+    prologue = ["    get = (payload or _EMPTY).get"]
+    arguments = []
+
+    def bind(prefix: str, value: Any) -> str:
+        name = f"_{prefix}{len(bindings)}"
+        bindings[name] = value
+        return name
+
+    def getter(path: Tuple[str, ...]) -> str:
+        # Hoist `(get("A") or _EMPTY).get` once per nested object.
+        if path not in getters:
+            parent = getter(path[:-1])
+            getters[path] = name = f"get{len(getters)}"
+            prologue.append(f"    {name} = ({parent}({path[-1]!r}) or _EMPTY).get")
+        return getters[path]
+
+    for f in dataclasses.fields(cls):
+        if not f.init:
+            continue
+        spec = f.metadata.get(FEED)
+        if spec is None:
+            raise TypeError(f"{cls.__name__}.{f.name} has no feed() metadata")
+
+        default = spec.default
+        if type(default) not in _LITERALS:
+            default = bind("d", default)
+        else:
+            default = repr(default)
+
+        if spec.key is None:
+            value = f"payload if payload is not None else {default}"
+        else:
+            path = (spec.key,) if isinstance(spec.key, str) else tuple(spec.key)
+            value = f"{getter(path[:-1])}({path[-1]!r}, {default})"
+
+        if spec.convert is not None:
+            value = f"{bind('c', spec.convert)}({value})"
+        arguments.append(f"        {f.name}={value},")
+
+    # Converters and defaults are closure variables of the parse function,
+    # which it reads as fast as locals.
+    name = f"parse_{cls.__name__}"
+    source = "\n".join(
+        [
+            f"def _make({', '.join(bindings)}):",
+            f"  def {name}(payload):",
+            *("  " + line for line in prologue),
+            "      return _cls(",
+            *("  " + line for line in arguments),
+            "      )",
+            f"  return {name}",
+            "",
+        ]
+    )
+
+    # Register the source so tracebacks through the function show it.
+    filename = f"<feed parser {cls.__module__}.{cls.__qualname__}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, filename, "exec"), namespace)
+    parse = namespace["_make"](**bindings)
+    parse.__qualname__ = name
+    parse.__doc__ = f"Parse a payload into `{cls.__name__}` (generated)."
+    return parse
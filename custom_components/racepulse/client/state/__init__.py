@@ -0,0 +1,7 @@
+"""State handling for the RacePulse F1 client."""
+
+from .drivers import touched_drivers
+from .session_state import SessionState
+from .topic_store import TopicStateStore, diff, merge
+
+__all__ = ["SessionState", "TopicStateStore", "diff", "merge", "touched_drivers"]
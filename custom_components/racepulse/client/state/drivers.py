@@ -0,0 +1,72 @@
+from typing import Any, FrozenSet, Optional
+
+from .topic_store import DELETED_KEY
+from ..enums import LiveTimingEvent
+
+# Topics whose per-driver data lives under a "Lines" mapping keyed by racing number.
+_LINES_TOPICS = frozenset(
+    {
+        LiveTimingEvent.TIMING_DATA,
+        LiveTimingEvent.TIMING_APP,
+        LiveTimingEvent.TIMING_STATS,
+    }
+)
+
+
+def touched_drivers(
+    event_type: LiveTimingEvent, delta: Any
+) -> Optional[FrozenSet[str]]:
+    """
+    Return the racing numbers a partial update refers to.
+
+    Example:
+        >>> sorted(touched_drivers(
+        ...     LiveTimingEvent.TIMING_DATA, {"Lines": {"44": {"Position": "1"}}}
+        ... ))
+        ['44']
+        >>> sorted(touched_drivers(LiveTimingEvent.DRIVER_LIST, {"_deleted": ["5"]}))
+        ['5']
+
+    Args:
+        event_type: The topic the update belongs to.
+        delta: The partial payload as received from the feed.
+
+    Returns:
+        The racing numbers (as strings) the update changes or deletes, an
+        empty set if the update touches no driver, or None if the topic is not
+        per-driver or the drivers cannot be determined (treat as "all drivers").
+    """
+    if not isinstance(delta, dict):
+        return None
+
+    if event_type in _LINES_TOPICS:
+        lines = delta.get("Lines")
+        if not isinstance(lines, dict):
+            return frozenset()
+        return _keys(lines)
+
+    if event_type == LiveTimingEvent.DRIVER_LIST:
+        return _keys(delta)
+
+    if event_type == LiveTimingEvent.TEAM_RADIO:
+        captures = delta.get("Captures")
+        if isinstance(captures, dict):
+            captures = captures.values()
+        if not captures:
+            return frozenset()
+        return frozenset(
+            str(c.get("RacingNumber"))
+            for c in captures
+            if isinstance(c, dict) and c.get("RacingNumber") is not None
+        )
+
+    return None
+
+
+def _keys(mapping: dict) -> FrozenSet[str]:
+    """Racing numbers keying a mapping, including those it deletes."""
+    keys = {key for key in mapping if not key.startswith("_")}
+    deleted = mapping.get(DELETED_KEY)
+    if isinstance(deleted, list):
+        keys.update(str(key) for key in deleted)
+    return frozenset(keys)
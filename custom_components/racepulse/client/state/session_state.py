@@ -0,0 +1,196 @@
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ..enums import LiveTimingEvent
+from ...const import DOMAIN
+
+if TYPE_CHECKING:
+    from ..interfaces.event import Event
+    from ..interfaces.notifiable import Notifiable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Called with the subscribed path and the new value.
+Callback = Callable[[str, Any], None]
+
+# Attribute holding the per-driver mapping of the topics that have one.
+_DRIVER_MAPPINGS = {
+    LiveTimingEvent.TIMING_DATA: "lines",
+    LiveTimingEvent.TIMING_APP: "lines",
+    LiveTimingEvent.TIMING_STATS: "lines",
+    LiveTimingEvent.DRIVER_LIST: "drivers",
+}
+
+_TOPICS_BY_LENGTH = sorted(LiveTimingEvent, key=lambda e: -len(e.value))
+
+_MISSING = object()
+
+
+def resolve(node: Any, segment: str) -> Any:
+    """
+    Step from a value to one of its parts, by attribute, key or list index.
+
+    Returns None if the part does not exist.
+    """
+    if node is None:
+        return None
+    if isinstance(node, Mapping):
+        return node.get(segment)
+    if isinstance(node, (list, tuple)):
+        if segment.isdigit() and int(segment) < len(node):
+            return node[int(segment)]
+        return None
+    return getattr(node, segment, None)
+
+
+class _PathNode:
+    """One segment of the subscription trie."""
+
+    __slots__ = ("children", "callbacks")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_PathNode"] = {}
+        self.callbacks: List[Tuple[str, Callback]] = []
+
+
+class SessionState:
+    """
+    The latest parsed event of every topic, with change notifications.
+
+    Entities read current values from one shared state instead of each
+    caching the events they saw, and subscribe to the paths they display.
+    A path starts with the topic, followed by attributes, mapping keys or
+    list indices, e.g. `"TimingData.lines.44.position"`.
+
+    When an event arrives, subscribed paths are resolved on the previous and
+    the new event side by side. A branch whose value is the very same object
+    in both (as incremental parsing leaves every untouched line, sector or
+    lap) is skipped without looking further, and callbacks only run when
+    their value differs.
+
+    Versions count the events of each topic, and per driver the events that
+    changed that driver's entry, so consumers can cheaply tell whether to
+    recompute.
+
+    Example:
+        state = SessionState()
+        client.attach(state)
+        unsubscribe = state.subscribe(
+            "TimingData.lines.44.position", lambda path, value: ...
+        )
+    """
+
+    def __init__(self) -> None:
+        self._events: Dict[LiveTimingEvent, "Event"] = {}
+        self._versions: Dict[LiveTimingEvent, int] = {}
+        self._driver_versions: Dict[LiveTimingEvent, Dict[str, int]] = {}
+        self._trie: Dict[LiveTimingEvent, _PathNode] = {}
+
+    # --- Reading ---
+    def get(self, topic: LiveTimingEvent) -> Optional["Event"]:
+        """The latest event of a topic, or None if none arrived yet."""
+        return self._events.get(topic)
+
+    def value(self, path: str) -> Any:
+        """
+        The current value at a path, or None if it does not exist.
+
+        Example:
+            >>> from custom_components.racepulse.client.models import TrackStatus
+            >>> state = SessionState()
+            >>> state.update(None, TrackStatus(status="1", message="AllClear"))
+            >>> state.value("TrackStatus.message")
+            'AllClear'
+        """
+        topic, segments = self._split(path)
+        node: Any = self._events.get(topic)
+        for segment in segments:
+            node = resolve(node, segment)
+        return node
+
+    def version(self, topic: LiveTimingEvent) -> int:
+        """Number of events received for a topic."""
+        return self._versions.get(topic, 0)
+
+    def driver_version(self, topic: LiveTimingEvent, racing_number: str) -> int:
+        """Number of events of a topic that changed one driver's entry."""
+        return self._driver_versions.get(topic, {}).get(racing_number, 0)
+
+    # --- Subscriptions ---
+    def subscribe(self, path: str, callback: Callback) -> Callable[[], None]:
+        """
+        Call `callback(path, value)` whenever the value at `path` changes.
+
+        Args:
+            path: The topic followed by attributes, keys or list indices,
+                  separated by dots.
+            callback: Receives the path and its new value (None if the value
+                      no longer exists).
+
+        Returns:
+            A function that removes the subscription again.
+        """
+        topic, segments = self._split(path)
+        node = self._trie.setdefault(topic, _PathNode())
+        for segment in segments:
+            node = node.children.setdefault(segment, _PathNode())
+
+        entry = (path, callback)
+        node.callbacks.append(entry)
+
+        def unsubscribe() -> None:
+            if entry in node.callbacks:
+                node.callbacks.remove(entry)
+
+        return unsubscribe
+
+    # --- Updates ---
+    def update(self, subject: "Notifiable", message: "Event") -> None:
+        """Observer hook: store an event and notify changed paths."""
+        topic = message.data_type
+        previous = self._events.get(topic)
+        self._events[topic] = message
+        self._versions[topic] = self._versions.get(topic, 0) + 1
+
+        if attribute := _DRIVER_MAPPINGS.get(topic):
+            self._count_drivers(topic, previous, message, attribute)
+
+        if node := self._trie.get(topic):
+            self._walk(node, previous, message)
+
+    def _count_drivers(
+        self, topic: LiveTimingEvent, previous: Any, current: Any, attribute: str
+    ) -> None:
+        versions = self._driver_versions.setdefault(topic, {})
+        before = getattr(previous, attribute, None) or {}
+        for num, entry in getattr(current, attribute).items():
+            old = before.get(num, _MISSING)
+            if old is not entry and old != entry:
+                versions[num] = versions.get(num, 0) + 1
+
+    def _walk(self, node: _PathNode, old: Any, new: Any) -> None:
+        if old is new:
+            return
+
+        if node.callbacks and old != new:
+            for path, callback in list(node.callbacks):
+                try:
+                    callback(path, new)
+                except Exception:
+                    _LOGGER.exception(
+                        "[%s] Failed to notify subscriber of %s", DOMAIN, path
+                    )
+
+        for segment, child in node.children.items():
+            self._walk(child, resolve(old, segment), resolve(new, segment))
+
+    @staticmethod
+    def _split(path: str) -> Tuple[LiveTimingEvent, List[str]]:
+        # Topic names may contain dots themselves (e.g. "CarData.z").
+        for event_type in _TOPICS_BY_LENGTH:
+            topic = event_type.value
+            if path == topic:
+                return event_type, []
+            if path.startswith(topic) and path[len(topic)] == ".":
+                return event_type, path[len(topic) + 1 :].split(".")
+        raise ValueError(f"Unknown topic in path: {path!r}")
@@ -0,0 +1,259 @@
+import hashlib
+import json
+from typing import Any, Dict, Optional, Union
+
+from ..enums import LiveTimingEvent
+
+# Marker key used by the live feed to remove entries from a dict or list.
+DELETED_KEY = "_deleted"
+
+# Returned by `_diff` when two values are equal.
+_UNCHANGED = object()
+
+
+class TopicStateStore:
+    """
+    Keeps the last known state of every live timing topic.
+
+    The F1 feed sends one full snapshot per topic in the subscribe response
+    (`"R"`) and afterwards only partial updates in the `"M"` array. This store
+    deep-merges each partial update into the stored snapshot in place, so the
+    merged result always reflects the complete current state of the topic.
+
+    Merge rules follow the feed's conventions:
+        - Dicts are merged key by key, recursively.
+        - Lists are updated through dicts keyed by the list index as a string
+          (e.g. `{"Sectors": {"1": {"Value": "28.111"}}}`). An index equal to
+          the current length appends a new item.
+        - A `_deleted` key lists the keys (or indices) to remove.
+        - Any other value, including a full list, replaces the stored value.
+
+    With `copy_on_write`, updates never modify stored containers. Only the
+    dicts and lists on the path to a changed value are copied, so every state
+    returned earlier stays a valid, unchanging snapshot that shares all
+    untouched parts with the current state.
+
+    Example:
+        >>> store = TopicStateStore()
+        >>> _ = store.replace("TimingData", {"Lines": {"1": {"Position": "3"}}})
+        >>> store.apply("TimingData", {"Lines": {"1": {"Position": "2"}}})
+        {'Lines': {'1': {'Position': '2'}}}
+    """
+
+    def __init__(self, copy_on_write: bool = False) -> None:
+        self._copy_on_write = copy_on_write
+        self._topics: Dict[Union[LiveTimingEvent, str], Any] = {}
+        # Content hash of a topic's state; dropped whenever a delta is merged.
+        self._digests: Dict[Union[LiveTimingEvent, str], bytes] = {}
+
+    def __contains__(self, topic: Union[LiveTimingEvent, str]) -> bool:
+        return topic in self._topics
+
+    def get(self, topic: Union[LiveTimingEvent, str]) -> Optional[Any]:
+        """Return the current merged state of a topic, or None if unknown."""
+        return self._topics.get(topic)
+
+    def replace(self, topic: Union[LiveTimingEvent, str], snapshot: Any) -> Any:
+        """
+        Store a full snapshot for a topic, discarding any previous state.
+
+        Args:
+            topic: The topic the snapshot belongs to.
+            snapshot: The full topic payload as received in `"R"`.
+
+        Returns:
+            The stored snapshot.
+        """
+        self._topics[topic] = snapshot
+        self._digests.pop(topic, None)
+        return snapshot
+
+    def sync(self, topic: Union[LiveTimingEvent, str], snapshot: Any) -> Optional[Any]:
+        """
+        Store a full snapshot for a topic, reporting only what changed.
+
+        The snapshot's content hash is compared with the stored state first,
+        so an identical snapshot (e.g. after a re-subscribe) costs one hash
+        and nothing else.
+
+        Args:
+            topic: The topic the snapshot belongs to.
+            snapshot: The full topic payload as received in `"R"`.
+
+        Returns:
+            None if the snapshot matches the stored state. Otherwise a partial
+            update that turns the previous state into the snapshot, or the
+            snapshot itself if no state was known.
+        """
+        digest = _digest(snapshot)
+        current = self._topics.get(topic)
+
+        if current is not None:
+            known = self._digests.get(topic)
+            if known is None:
+                known = self._digests[topic] = _digest(current)
+            if known == digest:
+                return None
+
+        delta = snapshot if current is None else diff(current, snapshot)
+        self._topics[topic] = snapshot
+        self._digests[topic] = digest
+        return delta
+
+    def apply(self, topic: Union[LiveTimingEvent, str], delta: Any) -> Any:
+        """
+        Merge a partial update into the stored state of a topic.
+
+        If no snapshot is known yet, the update itself becomes the state.
+
+        Args:
+            topic: The topic the update belongs to.
+            delta: The partial payload as received in an `"M"` feed message.
+
+        Returns:
+            The merged state of the topic.
+        """
+        current = self._topics.get(topic)
+        merged = (
+            delta
+            if current is None
+            else merge(current, delta, copy=self._copy_on_write)
+        )
+        self._topics[topic] = merged
+        self._digests.pop(topic, None)
+        return merged
+
+    def reset(self, topic: Optional[Union[LiveTimingEvent, str]] = None) -> None:
+        """Forget the state of one topic, or of all topics if none is given."""
+        if topic is None:
+            self._topics.clear()
+            self._digests.clear()
+        else:
+            self._topics.pop(topic, None)
+            self._digests.pop(topic, None)
+
+
+def merge(target: Any, update: Any, copy: bool = False) -> Any:
+    """
+    Deep-merge a partial live timing update into `target` in place.
+
+    Args:
+        target: The previously known value.
+        update: The partial value received from the feed.
+        copy: Copy every dict or list that is modified instead of changing
+              it in place; untouched parts are shared with `target`.
+
+    Returns:
+        The merged value. Unless `copy` is set, this is `target` itself
+        whenever it could be updated in place, otherwise `update`.
+    """
+    if not isinstance(update, dict):
+        return update
+
+    if isinstance(target, dict):
+        if copy:
+            target = dict(target)
+        for key, value in update.items():
+            if key == DELETED_KEY:
+                continue
+            current = target.get(key)
+            if isinstance(value, dict) and isinstance(current, (dict, list)):
+                target[key] = merge(current, value, copy)
+            else:
+                target[key] = value
+
+        for key in update.get(DELETED_KEY) or ():
+            target.pop(str(key), None)
+        return target
+
+    if isinstance(target, list):
+        if copy:
+            target = list(target)
+        for key, value in update.items():
+            if key == DELETED_KEY or not key.isdigit():
+                continue
+            index = int(key)
+            if index < len(target):
+                current = target[index]
+                if isinstance(value, dict) and isinstance(current, (dict, list)):
+                    target[index] = merge(current, value, copy)
+                else:
+                    target[index] = value
+            else:
+                # Pad gaps so the item lands on the index the feed refers to
+                target.extend([None] * (index - len(target)))
+                target.append(value)
+
+        deleted = sorted(
+            (int(k) for k in update.get(DELETED_KEY) or () if str(k).isdigit()),
+            reverse=True,
+        )
+        for index in deleted:
+            if index < len(target):
+                del target[index]
+        return target
+
+    return update
+
+
+def diff(old: Any, new: Any) -> Optional[Any]:
+    """
+    Compute a partial update that turns `old` into `new`.
+
+    The result uses the same conventions the feed uses for its updates, so
+    `merge(old, diff(old, new))` is equal to `new`.
+
+    Example:
+        >>> diff({"A": 1, "B": [1, 2]}, {"A": 1, "B": [1, 3], "C": 4})
+        {'B': {'1': 3}, 'C': 4}
+
+    Args:
+        old: The previously known value.
+        new: The new value.
+
+    Returns:
+        The partial update, or None if both values are equal.
+    """
+    delta = _diff(old, new)
+    return None if delta is _UNCHANGED else delta
+
+
+def _diff(old: Any, new: Any) -> Any:
+    if isinstance(old, dict) and isinstance(new, dict):
+        delta = {}
+        for key, value in new.items():
+            if key not in old:
+                delta[key] = value
+                continue
+            sub = _diff(old[key], value)
+            if sub is not _UNCHANGED:
+                delta[key] = sub
+
+        deleted = [key for key in old if key not in new]
+        if deleted:
+            delta[DELETED_KEY] = deleted
+        return delta if delta else _UNCHANGED
+
+    if isinstance(old, list) and isinstance(new, list):
+        # Removing list items by index is ambiguous; send shrunk lists whole.
+        if len(new) < len(old):
+            return new
+        delta = {}
+        for index, value in enumerate(new):
+            if index >= len(old):
+                delta[str(index)] = value
+                continue
+            sub = _diff(old[index], value)
+            if sub is not _UNCHANGED:
+                delta[str(index)] = sub
+        return delta if delta else _UNCHANGED
+
+    if type(old) is type(new) and old == new:
+        return _UNCHANGED
+    return new
+
+
+def _digest(value: Any) -> bytes:
+    """Return a content hash of a JSON-compatible value."""
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":")).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
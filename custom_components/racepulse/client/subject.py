@@ -0,0 +1,122 @@
+import logging
+from typing import Collection, Dict, Optional, Tuple, Union
+
+from .enums.live_timing_event import LiveTimingEvent
+from .enums.overflow_policy import OverflowPolicy
+from .interfaces.async_observable import AsyncObservable
+from .interfaces.event import Event
+from .interfaces.notifiable import Notifiable
+from .interfaces.observable import Observable
+from .observer_queue import ObserverQueue, QueueMetrics
+from .observer_registry import ObserverRegistry
+from ..const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Subject(Notifiable):
+    """
+    Observer bookkeeping shared by everything that delivers events.
+
+    Keeps the topic/driver index of attached observers, and a bounded
+    `ObserverQueue` with its own consumer task for every `AsyncObservable`.
+
+    A `Subject` attached to another one (e.g. a `DelayBuffer`) relays events:
+    it receives them through `push()` along with the drivers they touch, so
+    its own driver-filtered observers are matched like the source's.
+    """
+
+    def __init__(self) -> None:
+        self._observers = ObserverRegistry()
+        self._queues: Dict[AsyncObservable, ObserverQueue] = {}
+        self._blocked: list[Tuple[ObserverQueue, Event]] = []
+
+    def attach(
+        self,
+        observer: Union[Observable, AsyncObservable],
+        topics: Optional[Collection[LiveTimingEvent]] = None,
+        drivers: Optional[Collection[str]] = None,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        maxsize: int = ObserverQueue.DEFAULT_MAXSIZE,
+    ) -> None:
+        """
+        Attach an observer that will receive event notifications.
+
+        Observers implementing `AsyncObservable` get a bounded queue and their
+        own consumer task, so they never delay the listen loop. This must be
+        called from the event loop for such observers.
+
+        Args:
+            observer: The observer to attach. Attaching it again replaces
+                      its previous filters.
+            topics: Only deliver events of these topics. None means all topics.
+            drivers: Only deliver per-driver updates touching these racing
+                     numbers. None means all drivers.
+            policy: What an async observer's queue does when it is full.
+            maxsize: Capacity of an async observer's queue.
+        """
+        self._observers.add(observer, topics, drivers)
+
+        if isinstance(observer, AsyncObservable):
+            if queue := self._queues.pop(observer, None):
+                queue.stop()
+            queue = ObserverQueue(self, observer, maxsize=maxsize, policy=policy)
+            queue.start()
+            self._queues[observer] = queue
+
+        _LOGGER.debug("[%s] Attached observer: %s", DOMAIN, observer)
+
+    def detach(self, observer: Union[Observable, AsyncObservable]) -> None:
+        """Detach a previously attached observer."""
+        if queue := self._queues.pop(observer, None):
+            queue.stop()
+        if self._observers.remove(observer):
+            _LOGGER.debug("[%s] Detached observer: %s", DOMAIN, observer)
+
+    def notify(self, message: Event, drivers: Optional[Collection[str]] = None) -> None:
+        """Notify the observers interested in this event's topic and drivers."""
+        for observer in self._observers.observers_for(message.data_type, drivers):
+            if queue := self._queues.get(observer):
+                if not queue.offer(message):
+                    self._blocked.append((queue, message))
+                continue
+
+            try:
+                if isinstance(observer, Subject):
+                    observer.push(message, drivers)
+                else:
+                    observer.update(self, message)
+            except Exception:
+                _LOGGER.exception(
+                    "[%s] Failed to notify observer: %s", DOMAIN, observer
+                )
+
+    def push(self, message: Event, drivers: Optional[Collection[str]] = None) -> None:
+        """
+        Receive an event from the subject this one is attached to.
+
+        Relays it to this subject's observers unchanged; subclasses override
+        this to hold events back or transform them.
+
+        Args:
+            message: The event.
+            drivers: The racing numbers the event touches, or None if unknown.
+        """
+        self.notify(message, drivers)
+
+    @property
+    def queue_metrics(self) -> Dict[AsyncObservable, QueueMetrics]:
+        """Queue statistics for every attached async observer."""
+        return {observer: queue.metrics for observer, queue in self._queues.items()}
+
+    def _stop_queues(self) -> None:
+        """Stop the consumer tasks of all async observers."""
+        for queue in self._queues.values():
+            queue.stop()
+        self._blocked.clear()
+
+    async def _drain_blocked(self) -> None:
+        """Wait until every event held back by a full `BLOCK` queue is queued."""
+        while self._blocked:
+            queue, message = self._blocked.pop(0)
+            await queue.put(message)
@@ -0,0 +1,17 @@
+"""Lazily decoded event views for the RacePulse F1 client."""
+
+from .base import LazyView, ViewMapping, lazy_field
+from .timing_app import DriverStintsView, TimingAppView
+from .timing_data import DriverTimingView, SectorView, SpeedView, TimingDataView
+
+__all__ = [
+    "DriverStintsView",
+    "DriverTimingView",
+    "LazyView",
+    "SectorView",
+    "SpeedView",
+    "TimingAppView",
+    "TimingDataView",
+    "ViewMapping",
+    "lazy_field",
+]
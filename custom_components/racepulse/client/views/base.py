@@ -0,0 +1,108 @@
+from typing import Any, Callable, Dict, Iterator, Mapping, TypeVar
+
+V = TypeVar("V")
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class lazy_field:
+    """
+    A view attribute converted from the raw payload on first access.
+
+    The converted value is stored in the instance's `__dict__` under the same
+    name, which takes precedence over this (non-data) descriptor, so later
+    reads are plain attribute lookups.
+
+    Args:
+        key: The JSON key of the value in the raw payload.
+        convert: Turns the raw value (or `default`) into the attribute value.
+        default: Raw value used when the key is missing.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        convert: Callable[[Any], Any] = _identity,
+        default: Any = None,
+    ):
+        self.key = key
+        self.convert = convert
+        self.default = default
+        self.name = key
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        value = self.convert(instance._raw.get(self.key, self.default))
+        instance.__dict__[self.name] = value
+        return value
+
+
+class LazyView:
+    """
+    Read-only wrapper around a raw payload with lazily converted attributes.
+
+    Subclasses declare `lazy_field`s named like the attributes of the
+    matching dataclass model, so code reading a view cannot tell it apart
+    from the eagerly parsed event. Conversion errors surface on access.
+
+    The wrapped payload must not change afterwards; clients in lazy mode
+    keep their topic state copy-on-write for that reason.
+    """
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.__dict__["_raw"] = raw if raw is not None else {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._raw == other._raw
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(lazy)>"
+
+
+class ViewMapping(Mapping[str, V]):
+    """
+    A read-only mapping whose values are views built on first access.
+
+    Args:
+        raw: The raw mapping, e.g. the `"Lines"` of a payload.
+        factory: Builds the value for one raw item.
+    """
+
+    __slots__ = ("_raw", "_factory", "_cache")
+
+    def __init__(self, raw: Dict[str, Any], factory: Callable[[Any], V]):
+        self._raw = raw if raw is not None else {}
+        self._factory = factory
+        self._cache: Dict[str, V] = {}
+
+    def __getitem__(self, key: str) -> V:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._factory(self._raw[key])
+            return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}({list(self._raw)})>"
@@ -0,0 +1,32 @@
+from typing import Any, Dict, List, Optional
+
+from ..decorators import register_view
+from ..enums import LiveTimingEvent
+from ..interfaces import Event
+from ..models import Stint
+from ..schema import compile_parser
+from ...helpers import parse_int
+from .base import LazyView, ViewMapping, lazy_field
+
+_stint = compile_parser(Stint)
+
+
+def _stints(raw: Optional[List[Dict[str, Any]]]) -> ViewMapping[Stint]:
+    # Keyed by the stint index as a string, like `DriverStints.stints`.
+    return ViewMapping({str(i): s for i, s in enumerate(raw or [])}, _stint)
+
+
+class DriverStintsView(LazyView):
+    """Lazy counterpart of `DriverStints`."""
+
+    racing_number = lazy_field("RacingNumber", parse_int)
+    line = lazy_field("Line", parse_int)
+    stints = lazy_field("Stints", _stints)
+
+
+@register_view(LiveTimingEvent.TIMING_APP)
+class TimingAppView(LazyView, Event):
+    """Lazy counterpart of `TimingApp`."""
+
+    data_type = LiveTimingEvent.TIMING_APP
+    lines = lazy_field("Lines", lambda raw: ViewMapping(raw, DriverStintsView))
@@ -0,0 +1,106 @@
+from typing import Any, Dict, List, Optional
+
+from ..decorators import register_view
+from ..enums import LiveTimingEvent
+from ..interfaces import Event
+from ..models import Segment, SpeedData
+from ..parsers.timing_data import (
+    TimingDataParser,
+    _catching,
+    _interval_ms,
+    _interval_text,
+    _text,
+)
+from ...helpers import parse_bool, parse_int, parse_time_ms
+from .base import LazyView, ViewMapping, lazy_field
+
+
+def _segments(raw: Optional[List[Dict[str, Any]]]) -> List[Segment]:
+    return [Segment(status=parse_int(seg.get("Status"))) for seg in raw or []]
+
+
+def _speed_data(raw: Optional[Dict[str, Any]]) -> SpeedData:
+    return TimingDataParser._parse_speed_data(raw)
+
+
+class SectorView(LazyView):
+    """Lazy counterpart of `Sector`."""
+
+    stopped = lazy_field("Stopped", parse_bool)
+    value = lazy_field("Value", _text)
+    value_ms = lazy_field("Value", parse_time_ms)
+    status = lazy_field("Status", parse_int)
+    overall_fastest = lazy_field("OverallFastest", parse_bool)
+    personal_fastest = lazy_field("PersonalFastest", parse_bool)
+    segments = lazy_field("Segments", _segments)
+    previous_value = lazy_field("PreviousValue")
+
+
+class SpeedView(LazyView):
+    """Lazy counterpart of `Speed`."""
+
+    i1 = lazy_field("I1", _speed_data)
+    i2 = lazy_field("I2", _speed_data)
+    fl = lazy_field("FL", _speed_data)
+    st = lazy_field("ST", _speed_data)
+
+
+def _sectors(raw: Optional[List[Dict[str, Any]]]) -> List[SectorView]:
+    return [SectorView(s) for s in raw or []]
+
+
+def _optional(factory):
+    return lambda raw: None if raw is None else factory(raw)
+
+
+class DriverTimingView(LazyView):
+    """Lazy counterpart of `DriverTiming`."""
+
+    time_diff_to_fastest = lazy_field("TimeDiffToFastest", _text)
+    time_diff_to_fastest_ms = lazy_field("TimeDiffToFastest", parse_time_ms)
+    time_diff_to_position_ahead = lazy_field("TimeDiffToPositionAhead", _text)
+    time_diff_to_position_ahead_ms = lazy_field(
+        "TimeDiffToPositionAhead", parse_time_ms
+    )
+    gap_to_leader = lazy_field("GapToLeader", _text)
+    gap_to_leader_ms = lazy_field("GapToLeader", parse_time_ms)
+    interval_to_position_ahead = lazy_field("IntervalToPositionAhead", _interval_text)
+    interval_to_position_ahead_ms = lazy_field("IntervalToPositionAhead", _interval_ms)
+    catching = lazy_field("IntervalToPositionAhead", _catching)
+    line = lazy_field("Line", parse_int)
+    position = lazy_field("Position", _text)
+    show_position = lazy_field("ShowPosition", parse_bool)
+    racing_number = lazy_field("RacingNumber", parse_int)
+    retired = lazy_field("Retired", parse_bool)
+    in_pit = lazy_field("InPit", parse_bool)
+    pit_out = lazy_field("PitOut", parse_bool)
+    stopped = lazy_field("Stopped", parse_bool)
+    status = lazy_field("Status", parse_int)
+    sectors = lazy_field("Sectors", _sectors)
+    speeds = lazy_field("Speeds", _optional(SpeedView))
+    best_lap_time = lazy_field(
+        "BestLapTime", _optional(TimingDataParser._parse_best_lap)
+    )
+    last_lap_time = lazy_field(
+        "LastLapTime", _optional(TimingDataParser._parse_last_lap)
+    )
+    number_of_laps = lazy_field("NumberOfLaps", parse_int)
+    number_of_pit_stops = lazy_field("NumberOfPitStops", parse_int)
+
+
+@register_view(LiveTimingEvent.TIMING_DATA)
+class TimingDataView(LazyView, Event):
+    """
+    Lazy counterpart of `TimingData`.
+
+    Building the view is constant-time; a line is wrapped when it is first
+    looked up, and each of its fields is converted when first read.
+
+    Example:
+        view = TimingDataView(payload)
+        view.lines["44"].position  # converts only this one field
+    """
+
+    data_type = LiveTimingEvent.TIMING_DATA
+    lines = lazy_field("Lines", lambda raw: ViewMapping(raw, DriverTimingView))
+    withheld = lazy_field("Withheld", parse_bool, default=False)
@@ -1,6 +1,7 @@
 """Helper functions for parsing F1 Live Timing data."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import sys
 from typing import Any, Optional
 
 
@@ -28,6 +29,15 @@ def parse_bool(value: Any) -> bool:
         return value.strip().lower() in {"true", "1", "yes"}
     return bool(value)
 
+def parse_interned(value: Any) -> str:
+    """
+    Convert a value to an interned string, returning '' for None.
+
+    For open-ended values that repeat across drivers and updates (e.g. team
+    names), so that every occurrence shares one string object.
+    """
+    return sys.intern(value if isinstance(value, str) else parse_string(value))
+
 def parse_float(value: Any) -> float:
     """Convert a value to float, returning 0.0 on error."""
     try:
@@ -39,15 +49,74 @@ def parse_datetime(value: Optional[str]) -> Optional[datetime]:
     """
     Parse an ISO 8601 datetime string (e.g., '2025-10-03T15:37:14.4783763Z').
 
+    Feed timestamps go through `parse_timestamp`; anything it rejects falls
+    back to `datetime.fromisoformat` after replacing "Z".
+
     Returns None on invalid or missing input.
     """
-    if not value:
+    if not value or not isinstance(value, str):
         return None
+    try:
+        return parse_timestamp(value)
+    except (ValueError, TypeError):
+        pass
     try:
         return datetime.fromisoformat(value.replace("Z", "+00:00"))
     except (ValueError, TypeError):
         return None
 
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse a feed timestamp of the form 'YYYY-MM-DDTHH:MM:SS[.f*][Z|±HH:MM]'.
+
+    `datetime.fromisoformat` handles the common case; fractions and suffixes
+    it rejects (the feed's 7 digits and "Z" before Python 3.11) are sliced
+    by hand and the fraction truncated to microseconds.
+
+    Example:
+        >>> parse_timestamp("2025-10-03T15:37:14.4783763Z")
+        datetime.datetime(2025, 10, 3, 15, 37, 14, 478376, tzinfo=datetime.timezone.utc)
+
+    Raises:
+        ValueError: If the string does not have this form.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return _parse_fixed_timestamp(value)
+
+def _parse_fixed_timestamp(value: str) -> datetime:
+    if len(value) < 19 or value[4] != "-" or value[13] != ":":
+        raise ValueError(f"Invalid timestamp: {value!r}")
+
+    end = len(value)
+    tzinfo = None
+    if value[-1] in "Zz":
+        tzinfo = timezone.utc
+        end -= 1
+    elif end >= 25 and value[-6] in "+-" and value[-3] == ":":
+        offset = timedelta(hours=int(value[-5:-3]), minutes=int(value[-2:]))
+        tzinfo = timezone(-offset if value[-6] == "-" else offset)
+        end -= 6
+
+    microsecond = 0
+    if end > 19:
+        fraction = value[20:end]
+        if value[19] != "." or not fraction.isdigit():
+            raise ValueError(f"Invalid timestamp: {value!r}")
+        microsecond = int(fraction[:6].ljust(6, "0"))
+
+    return datetime(
+        int(value[0:4]),
+        int(value[5:7]),
+        int(value[8:10]),
+        int(value[11:13]),
+        int(value[14:16]),
+        int(value[17:19]),
+        microsecond,
+        tzinfo,
+    )
+
 @staticmethod
 def parse_timedelta(value: Optional[str]) -> timedelta:
     """
@@ -62,3 +131,42 @@ def parse_timedelta(value: Optional[str]) -> timedelta:
         return timedelta(hours=hours, minutes=minutes, seconds=seconds)
     except (ValueError, TypeError):
         return timedelta()
+
+def parse_time_ms(value: Any) -> Optional[int]:
+    """
+    Convert a lap, sector or gap time string to integer milliseconds.
+
+    Accepts 'M:SS.mmm' (and 'H:MM:SS.mmm'), 'SS.mmm' and signed gaps like
+    '+0.143'. Fractions are read to millisecond precision. Lap markers carry
+    no time and give None: 'LAP 57' (the leader's gap) and '1L' (lapped).
+
+    Example:
+        >>> parse_time_ms("1:30.857")
+        90857
+        >>> parse_time_ms("+0.143")
+        143
+        >>> parse_time_ms("LAP 57")
+
+    Returns None on invalid or missing input.
+    """
+    if not value or not isinstance(value, str):
+        return None
+
+    sign = 1
+    if value[0] in "+-":
+        sign = -1 if value[0] == "-" else 1
+        value = value[1:]
+
+    seconds, _, fraction = value.partition(".")
+    if fraction:
+        if not fraction.isdigit():
+            return None
+        fraction = (fraction + "00")[:3]
+
+    total = 0
+    for part in seconds.split(":"):
+        if not part.isdigit():
+            return None
+        total = total * 60 + int(part)
+
+    return sign * (total * 1000 + int(fraction or 0))
@@ -0,0 +1,130 @@
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .client import F1SignalRClient
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from homeassistant.core import HomeAssistant
+
+_LOGGER: logging.Logger = logging.getLogger(__package__)
+
+DATA_HUB = "hub"
+
+
+class RacePulseHub:
+    """
+    Owns the single upstream live timing connection shared by all entries.
+
+    Every config entry acquires the hub on setup and releases it on unload.
+    The first entry opens the connection, the last one closes it, so any
+    number of entries costs one websocket and one parsing pipeline. Entries
+    attach their observers through the hub, which detaches them again when
+    the entry is released.
+
+    Example:
+        hub = RacePulseHub.async_get(hass)
+        client = hub.acquire(entry.entry_id)
+        hub.attach(entry.entry_id, sensor, topics={LiveTimingEvent.TIMING_DATA})
+        ...
+        await hub.release(entry.entry_id)
+    """
+
+    def __init__(self, hass: "HomeAssistant") -> None:
+        self._hass = hass
+        self._client: Optional[F1SignalRClient] = None
+        self._connect_task: Optional["asyncio.Task"] = None
+        self._observers: Dict[str, List[Any]] = {}
+
+    @classmethod
+    def async_get(cls, hass: "HomeAssistant") -> "RacePulseHub":
+        """Return the hub stored in `hass.data[DOMAIN]`, creating it if needed."""
+        data = hass.data.setdefault(DOMAIN, {})
+        if DATA_HUB not in data:
+            data[DATA_HUB] = cls(hass)
+        return data[DATA_HUB]
+
+    @property
+    def client(self) -> Optional[F1SignalRClient]:
+        """The shared client, or None while no entry holds the hub."""
+        return self._client
+
+    @property
+    def entries(self) -> int:
+        """Number of config entries currently holding the hub."""
+        return len(self._observers)
+
+    def acquire(self, entry_id: str) -> F1SignalRClient:
+        """
+        Register a config entry, connecting upstream if it is the first one.
+
+        Args:
+            entry_id: The config entry's ID.
+
+        Returns:
+            The shared client.
+        """
+        self._observers.setdefault(entry_id, [])
+
+        if self._client is None:
+            session = async_get_clientsession(self._hass)
+            self._client = F1SignalRClient(session)
+            self._connect_task = self._hass.async_create_task(self._client.connect())
+            _LOGGER.info("[%s] Opened shared upstream connection", DOMAIN)
+
+        _LOGGER.debug(
+            "[%s] Hub acquired by %s (%d entries)", DOMAIN, entry_id, self.entries
+        )
+        return self._client
+
+    def attach(self, entry_id: str, observer: Any, **filters: Any) -> None:
+        """
+        Attach an observer to the shared client on behalf of an entry.
+
+        Args:
+            entry_id: The config entry the observer belongs to.
+            observer: The observer to attach.
+            **filters: Passed on to `F1SignalRClient.attach()`.
+        """
+        if self._client is None or entry_id not in self._observers:
+            raise RuntimeError(f"Hub not acquired by entry {entry_id}")
+
+        self._client.attach(observer, **filters)
+        self._observers[entry_id].append(observer)
+
+    async def release(self, entry_id: str) -> None:
+        """
+        Unregister a config entry and detach its observers.
+
+        The upstream connection is closed once no entry holds the hub anymore.
+
+        Args:
+            entry_id: The config entry's ID.
+        """
+        observers = self._observers.pop(entry_id, None)
+        if observers is None or self._client is None:
+            return
+
+        for observer in observers:
+            self._client.detach(observer)
+        _LOGGER.debug(
+            "[%s] Hub released by %s (%d entries)", DOMAIN, entry_id, self.entries
+        )
+
+        if self._observers:
+            return
+
+        client, connect_task = self._client, self._connect_task
+        self._client = self._connect_task = None
+
+        # Ask client to stop reconnect loop and close WS
+        await client.disconnect()
+
+        # Now cancel the outer loop task that HA owns
+        if connect_task and not connect_task.done():
+            connect_task.cancel()
+        _LOGGER.info("[%s] Closed shared upstream connection", DOMAIN)
@@ -0,0 +1 @@
+"""Tests for the RacePulse custom component."""
@@ -0,0 +1,44 @@
+"""Fixtures shared by the tests."""
+
+import copy
+from typing import Any, Dict
+
+import pytest
+
+from benchmarks.samples import TIMING_DATA
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+from custom_components.racepulse.client.models import TimingData
+from custom_components.racepulse.client.state import TopicStateStore
+
+
+class TimingFeed:
+    """
+    `TimingData` events parsed the way the client parses them.
+
+    Starts from the sample snapshot of 20 drivers, and merges and parses
+    every partial update incrementally, so unchanged lines are shared with
+    the previous event.
+    """
+
+    def __init__(self, snapshot: Dict[str, Any]) -> None:
+        self.store = TopicStateStore()
+        self.store.replace(LiveTimingEvent.TIMING_DATA, copy.deepcopy(snapshot))
+        self.event: TimingData = EventFactory.parse(
+            LiveTimingEvent.TIMING_DATA, self.store.get(LiveTimingEvent.TIMING_DATA)
+        )
+
+    def apply(self, lines: Dict[str, Any]) -> TimingData:
+        """Merge an update of some drivers' lines and parse it."""
+        delta = {"Lines": lines}
+        merged = self.store.apply(LiveTimingEvent.TIMING_DATA, delta)
+        self.event = EventFactory.parse_incremental(
+            LiveTimingEvent.TIMING_DATA, self.event, merged, delta
+        )
+        return self.event
+
+
+@pytest.fixture
+def timing() -> TimingFeed:
+    """A `TimingFeed` starting from the sample snapshot."""
+    return TimingFeed(TIMING_DATA)
@@ -0,0 +1,158 @@
+"""Tests for reading sessions from the static live timing archive."""
+
+import base64
+from datetime import timedelta
+import json
+import zlib
+
+from custom_components.racepulse.client.archive_importer import ArchiveImporter
+from custom_components.racepulse.client.enums import LiveTimingEvent
+
+RACE = "2025/2025-10-05_Singapore_Grand_Prix/2025-10-05_Race/"
+
+
+def deflate(payload):
+    """Compress a payload the way the feed sends `.z` topics."""
+    compressor = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+    data = compressor.compress(json.dumps(payload).encode()) + compressor.flush()
+    return json.dumps(base64.b64encode(data).decode())
+
+
+def write_stream(root, session, topic, lines, bom=True):
+    directory = root / session
+    directory.mkdir(parents=True, exist_ok=True)
+    text = "".join(f"{offset}{payload}\r\n" for offset, payload in lines)
+    (directory / f"{topic.value}.jsonStream").write_text(
+        ("\ufeff" if bom else "") + text, encoding="utf-8"
+    )
+
+
+def test_offsets(tmp_path):
+    # The byte order mark on the first line does not hide its offset.
+    write_stream(
+        tmp_path,
+        RACE,
+        LiveTimingEvent.TRACK_STATUS,
+        [
+            ("00:00:00.1", '{"Status":"1"}'),
+            ("00:01:02.34", '{"Status":"2"}'),
+            ("01:00:00.345", '{"Status":"4"}'),
+            ("12:34:56.789", '{"Status":"5"}'),
+        ],
+    )
+    importer = ArchiveImporter(tmp_path, topics=[LiveTimingEvent.TRACK_STATUS])
+
+    assert [
+        (offset, payload["Status"])
+        for offset, _, _, payload in importer.iter_topic(
+            RACE, LiveTimingEvent.TRACK_STATUS
+        )
+    ] == [
+        (100, "1"),
+        (62_340, "2"),
+        (3_600_345, "4"),
+        (45_296_789, "5"),
+    ]
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    write_stream(
+        tmp_path,
+        RACE,
+        LiveTimingEvent.TRACK_STATUS,
+        [
+            ("", "garbage"),
+            ("00:00:01.000", "{not json"),
+            ("00:00:02.000", '{"Status":"2"}'),
+        ],
+    )
+    write_stream(
+        tmp_path,
+        RACE,
+        LiveTimingEvent.POSITION,
+        [("00:00:01.500", '"bm90IGRlZmxhdGVk"'), ("00:00:03.000", '"%%%"')],
+    )
+    importer = ArchiveImporter(tmp_path)
+
+    assert [(offset, topic) for offset, _, topic, _ in importer.iter_raw(RACE)] == [
+        (2000, LiveTimingEvent.TRACK_STATUS)
+    ]
+
+
+def test_topics_are_merged_by_time(tmp_path):
+    frame = {
+        "Position": [
+            {
+                "Timestamp": "2025-10-05T12:00:01.5Z",
+                "Entries": {"44": {"Status": "OnTrack", "X": 1, "Y": 2, "Z": 3}},
+            }
+        ]
+    }
+    write_stream(
+        tmp_path,
+        RACE,
+        LiveTimingEvent.TRACK_STATUS,
+        [
+            ("00:00:01.000", '{"Status":"1","Message":"AllClear"}'),
+            ("00:00:02.000", '{"Message":"Yellow"}'),
+            ("00:00:03.000", '{"Status":"2"}'),
+        ],
+    )
+    write_stream(
+        tmp_path,
+        RACE,
+        LiveTimingEvent.SESSION_INFO,
+        [("00:00:02.000", '{"Path":"' + RACE + '"}')],
+        bom=False,
+    )
+    write_stream(
+        tmp_path,
+        RACE,
+        LiveTimingEvent.POSITION,
+        [("00:00:01.500", deflate(frame))],
+    )
+    importer = ArchiveImporter(
+        tmp_path,
+        topics=[
+            LiveTimingEvent.SESSION_INFO,
+            LiveTimingEvent.TRACK_STATUS,
+            LiveTimingEvent.POSITION,
+        ],
+    )
+
+    events = list(importer.iter_events(RACE))
+
+    # Equal offsets keep the order the topics were given in.
+    assert [(offset, event.data_type) for offset, event in events] == [
+        (timedelta(seconds=1), LiveTimingEvent.TRACK_STATUS),
+        (timedelta(seconds=1.5), LiveTimingEvent.POSITION),
+        (timedelta(seconds=2), LiveTimingEvent.SESSION_INFO),
+        (timedelta(seconds=2), LiveTimingEvent.TRACK_STATUS),
+        (timedelta(seconds=3), LiveTimingEvent.TRACK_STATUS),
+    ]
+    # Partial updates are merged into the topic's state.
+    statuses = [
+        event for _, event in events if event.data_type == LiveTimingEvent.TRACK_STATUS
+    ]
+    assert [(event.status, event.message) for event in statuses] == [
+        ("1", "AllClear"),
+        ("1", "Yellow"),
+        ("2", "Yellow"),
+    ]
+    assert events[1][1].frames[0].entries["44"].x == 1
+    assert events[2][1].path == RACE
+
+
+def test_sessions(tmp_path):
+    qualifying = "2025/2025-10-05_Singapore_Grand_Prix/2025-10-04_Qualifying/"
+    older = "2024/2024-09-22_Singapore_Grand_Prix/2024-09-22_Race/"
+    for session in (RACE, qualifying, older):
+        for topic in (LiveTimingEvent.TRACK_STATUS, LiveTimingEvent.SESSION_INFO):
+            write_stream(tmp_path, session, topic, [])
+    (tmp_path / "2025" / "notes.txt").write_text("")
+    importer = ArchiveImporter(tmp_path)
+
+    assert list(importer.sessions()) == [older, qualifying, RACE]
+    assert list(importer.sessions("2025")) == [qualifying, RACE]
+    assert list(importer.sessions("2023")) == []
+    assert list(importer.iter_events("2023/missing/")) == []
@@ -0,0 +1,59 @@
+"""Tests for the shared event pipeline of the timing clients."""
+
+import json
+
+from custom_components.racepulse.client.base_client import BaseTimingClient
+from custom_components.racepulse.client.enums import LiveTimingEvent
+
+
+class Collector:
+    """An observer keeping every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, subject, message):
+        self.events.append(message)
+
+
+def frame(**payload):
+    return json.dumps(payload)
+
+
+def feed(topic, data):
+    """A frame pushing one partial update of a topic."""
+    return frame(
+        C="d-1",
+        M=[{"H": "Streaming", "M": "feed", "A": [topic, data, "2025-10-05T12:00Z"]}],
+    )
+
+
+def test_partial_update_is_merged_into_the_snapshot():
+    client = BaseTimingClient()
+    observer = Collector()
+    client.attach(observer)
+
+    client._handle_frame(
+        frame(R={"TrackStatus": {"Status": "1", "Message": "AllClear"}}, I="1")
+    )
+    payload = client._handle_frame(feed("TrackStatus", {"Message": "Yellow"}))
+
+    assert payload["C"] == "d-1"
+    assert [event.message for event in observer.events] == ["AllClear", "Yellow"]
+    assert observer.events[-1].status == "1"
+    assert observer.events[-1].data_type == LiveTimingEvent.TRACK_STATUS
+    assert client.events == 2
+
+
+def test_other_messages_are_ignored():
+    client = BaseTimingClient()
+    observer = Collector()
+    client.attach(observer)
+
+    assert client._handle_frame("[]") == {}
+    client._handle_frame(feed("NoSuchTopic", {}))
+    client._handle_frame(
+        frame(M=[{"M": "status", "A": ["TrackStatus", {}]}, {"M": "feed", "A": []}])
+    )
+
+    assert observer.events == []
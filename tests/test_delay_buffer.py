@@ -0,0 +1,211 @@
+"""Tests for the live-delay buffer."""
+
+import asyncio
+
+import pytest
+
+from custom_components.racepulse.client import DelayBuffer
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.enums.overflow_policy import OverflowPolicy
+from custom_components.racepulse.client.subject import Subject
+
+TIMING = LiveTimingEvent.TIMING_DATA
+TRACK = LiveTimingEvent.TRACK_STATUS
+
+
+class Message:
+    def __init__(self, data_type, name):
+        self.data_type = data_type
+        self.name = name
+
+
+class Collector:
+    def __init__(self):
+        self.received = []
+
+    def update(self, subject, message):
+        self.received.append(message.name)
+
+
+class Clock:
+    """Drives an event loop whose time only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.loop = asyncio.new_event_loop()
+        self.loop.time = lambda: self.now
+
+    def run(self, call=None):
+        async def step():
+            if call is not None:
+                call()
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        self.loop.run_until_complete(step())
+
+    def advance(self, seconds):
+        self.now += seconds
+        self.run()
+
+    def close(self):
+        self.loop.close()
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    yield clock
+    clock.close()
+
+
+def buffered(delay=30.0):
+    buffer = DelayBuffer(delay)
+    observer = Collector()
+    buffer.attach(observer)
+    return buffer, observer
+
+
+def test_released_at_the_deadline(clock):
+    buffer, observer = buffered()
+    clock.run(lambda: buffer.push(Message(TRACK, "yellow")))
+
+    clock.advance(29.9)
+    assert observer.received == []
+    assert buffer.pending == 1
+
+    clock.advance(0.2)
+    assert observer.received == ["yellow"]
+    assert (buffer.pending, buffer.released) == (0, 1)
+
+
+def test_released_in_arrival_order(clock):
+    buffer, observer = buffered()
+    clock.run(lambda: buffer.push(Message(TRACK, "yellow")))
+    clock.advance(5)
+    clock.run(lambda: buffer.push(Message(TIMING, "timing")))
+    clock.advance(2)
+    clock.run(lambda: buffer.push(Message(TRACK, "green")))
+
+    clock.advance(23)
+    assert observer.received == ["yellow"]
+
+    clock.advance(10)
+    assert observer.received == ["yellow", "timing", "green"]
+
+
+def test_updates_of_a_topic_coalesce(clock):
+    buffer, observer = buffered()
+    clock.run(lambda: buffer.push(Message(TIMING, "first")))
+    clock.now += 0.5
+    clock.run(lambda: buffer.push(Message(TIMING, "second")))
+    # The next coalescing window.
+    clock.now += 0.6
+    clock.run(lambda: buffer.push(Message(TIMING, "third")))
+
+    assert (buffer.pending, buffer.coalesced) == (2, 1)
+
+    # Only released once the replacing event is due, at 30.5 s.
+    clock.advance(29.3)
+    assert observer.received == []
+
+    clock.advance(0.2)
+    assert observer.received == ["second"]
+
+    clock.advance(1)
+    assert observer.received == ["second", "third"]
+
+
+@pytest.mark.parametrize(
+    "first, second, woken",
+    [
+        ({"44"}, {"1"}, {"1", "44"}),
+        ({"44"}, {"44"}, {"44"}),
+        ({"44"}, set(), {"1", "44", "16"}),
+        (None, {"44"}, {"1", "44", "16"}),
+    ],
+)
+def test_coalesced_events_keep_their_drivers(clock, first, second, woken):
+    buffer = DelayBuffer(30)
+    observers = {num: Collector() for num in ("1", "44", "16")}
+    for num, observer in observers.items():
+        buffer.attach(observer, drivers={num})
+
+    clock.run(lambda: buffer.push(Message(TIMING, "first"), first))
+    clock.run(lambda: buffer.push(Message(TIMING, "second"), second))
+    clock.advance(31)
+
+    assert {num for num, o in observers.items() if o.received} == woken
+
+
+def test_drivers_relayed_from_the_client(clock):
+    client = Subject()
+    buffer = DelayBuffer(30)
+    client.attach(buffer)
+    followed, other = Collector(), Collector()
+    buffer.attach(followed, drivers={"44"})
+    buffer.attach(other, drivers={"16"})
+
+    clock.run(lambda: client.notify(Message(TIMING, "timing"), {"44"}))
+    clock.advance(30)
+
+    assert followed.received == ["timing"]
+    assert other.received == []
+
+
+def test_relay_without_delay(clock):
+    buffer, observer = buffered(delay=0)
+    filtered = Collector()
+    buffer.attach(filtered, drivers={"16"})
+
+    buffer.update(None, Message(TRACK, "yellow"))
+    buffer.push(Message(TIMING, "timing"), {"44"})
+
+    assert observer.received == ["yellow", "timing"]
+    assert filtered.received == ["yellow"]
+
+
+def test_close_drops_pending_events(clock):
+    buffer, observer = buffered()
+    clock.run(lambda: buffer.push(Message(TRACK, "yellow")))
+
+    buffer.close()
+    clock.advance(31)
+
+    assert observer.received == []
+    assert buffer.pending == 0
+
+
+def test_blocked_observers_are_drained(clock):
+    class Slow:
+        def __init__(self):
+            self.received = []
+            self.release = asyncio.Event()
+
+        async def async_receive(self, subject, message):
+            await self.release.wait()
+            self.received.append(message.name)
+
+    buffer = DelayBuffer(30)
+    slow = Slow()
+    clock.run(lambda: buffer.attach(slow, policy=OverflowPolicy.BLOCK, maxsize=1))
+    for name in ("a", "b", "c"):
+        clock.run(lambda: buffer.push(Message(TIMING, name)))
+        clock.now += 1.5
+    clock.advance(30)
+
+    clock.run(slow.release.set)
+    clock.run()
+    metrics = buffer.queue_metrics[slow]
+    clock.run(buffer.close)
+
+    assert slow.received == ["a", "b", "c"]
+    assert (metrics.delivered, metrics.blocked) == (3, 1)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        DelayBuffer(-1)
+    with pytest.raises(ValueError):
+        DelayBuffer(30, coalesce_window=0)
+    assert DelayBuffer(30).delay == 30
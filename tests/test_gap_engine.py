@@ -0,0 +1,136 @@
+"""Tests for the incremental gap engine."""
+
+import pytest
+
+# The analytics package requires NumPy, though the engine does not use it.
+pytest.importorskip("numpy")
+
+from custom_components.racepulse.client.analytics import (  # noqa: E402
+    GapEngine,
+    TowerEntry,
+)
+from custom_components.racepulse.client.models import TrackStatus  # noqa: E402
+
+
+def engine_for(timing):
+    engine = GapEngine()
+    engine.update(None, timing.event)
+    return engine
+
+
+def test_tower_in_running_order(timing):
+    engine = engine_for(timing)
+    tower = engine.tower
+
+    assert len(tower) == 20
+    assert tower is engine.tower
+    assert tower[0] == TowerEntry("1", 1, 0, None, False)
+    assert tower[1] == TowerEntry("4", 2, 624, 312, False)
+    assert engine.get("44") == tower[14]
+    assert engine.get("99") is None
+    assert engine.version == 1
+
+
+def test_neighbours(timing):
+    engine = engine_for(timing)
+
+    assert engine.ahead("4").racing_number == "1"
+    assert engine.behind("4").racing_number == "10"
+    assert engine.ahead("1") is None
+    assert engine.behind("5") is None
+    assert engine.ahead("99") is None
+    assert engine.behind("99") is None
+
+
+def test_race_gaps_take_precedence(timing):
+    engine = engine_for(timing)
+
+    engine.apply(
+        timing.apply(
+            {
+                "44": {
+                    "GapToLeader": "+5.000",
+                    "IntervalToPositionAhead": {"Value": "+0.500", "Catching": True},
+                }
+            }
+        )
+    )
+
+    assert engine.get("44") == TowerEntry("44", 15, 5000, 500, True)
+
+
+def test_missing_values_are_derived(timing):
+    engine = engine_for(timing)
+
+    engine.apply(timing.apply({"10": {"TimeDiffToFastest": ""}}))
+    assert engine.get("10").gap_to_leader_ms == 624 + 312
+
+    engine.apply(timing.apply({"11": {"TimeDiffToPositionAhead": ""}}))
+    assert engine.get("11").interval_ms == 1248 - 936
+
+    # Neither: the gap stays unknown, and so does the next car's interval.
+    engine.apply(
+        timing.apply({"10": {"TimeDiffToPositionAhead": "1L"}, "4": {"Position": "2"}})
+    )
+    assert engine.get("10").gap_to_leader_ms is None
+    assert engine.get("11").interval_ms is None
+
+
+def test_one_car_update_recomputes_few_cars(timing):
+    engine = engine_for(timing)
+    engine.recomputed = 0
+
+    engine.apply(timing.apply({"44": {"TimeDiffToPositionAhead": "+0.400"}}))
+
+    assert engine.get("44").interval_ms == 400
+    assert engine.recomputed == 2
+    assert engine.version == 2
+
+
+def test_unchanged_values_keep_the_tower(timing):
+    engine = engine_for(timing)
+    tower = engine.tower
+
+    engine.apply(timing.apply({"44": {"NumberOfLaps": 25}}))
+    # The leader's gap is always 0, whatever the feed says.
+    engine.apply(timing.apply({"1": {"TimeDiffToFastest": "+0.100"}}))
+    engine.apply(timing.event)
+
+    assert engine.tower is tower
+    assert engine.version == 1
+
+
+def test_position_change_reorders(timing):
+    engine = engine_for(timing)
+
+    engine.apply(timing.apply({"1": {"Position": "2"}, "4": {"Position": "1"}}))
+
+    assert [entry.racing_number for entry in engine.tower[:3]] == ["4", "1", "10"]
+    assert engine.get("4").gap_to_leader_ms == 0
+    assert engine.get("1").interval_ms == 312
+    assert engine.version == 2
+
+
+def test_unclassified_and_dropped_cars(timing):
+    engine = engine_for(timing)
+
+    engine.apply(timing.apply({"44": {"Position": "0"}}))
+    assert engine.get("44") is None
+    assert len(engine.tower) == 19
+
+    engine.apply(timing.apply({"44": {"TimeDiffToPositionAhead": "+0.400"}}))
+    assert engine.version == 2
+
+    engine.apply(timing.apply({"_deleted": ["55"]}))
+    assert engine.get("55") is None
+    assert len(engine.tower) == 18
+    assert engine.behind("44") is None
+
+
+def test_update_follows_timing_data_only():
+    engine = GapEngine()
+
+    engine.update(None, TrackStatus(status="1", message="AllClear"))
+
+    assert engine.tower == ()
+    assert engine.version == 0
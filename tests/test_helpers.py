@@ -0,0 +1,112 @@
+"""Tests for the timestamp and time parsing helpers."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from custom_components.racepulse.helpers import (
+    _parse_fixed_timestamp,
+    parse_datetime,
+    parse_time_ms,
+    parse_timestamp,
+)
+
+UTC = timezone.utc
+
+
+@pytest.mark.parametrize("parse", [parse_timestamp, _parse_fixed_timestamp])
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        # The feed's 7 fractional digits are truncated to microseconds.
+        (
+            "2025-10-03T15:37:14.4783763Z",
+            datetime(2025, 10, 3, 15, 37, 14, 478376, UTC),
+        ),
+        (
+            "2025-10-03T15:37:14.4783763z",
+            datetime(2025, 10, 3, 15, 37, 14, 478376, UTC),
+        ),
+        ("2025-10-03T15:37:14Z", datetime(2025, 10, 3, 15, 37, 14, tzinfo=UTC)),
+        ("2025-10-03T15:37:14.5Z", datetime(2025, 10, 3, 15, 37, 14, 500000, UTC)),
+        ("2025-10-03T15:37:14", datetime(2025, 10, 3, 15, 37, 14)),
+        (
+            "2025-10-03T15:37:14.123+02:30",
+            datetime(
+                2025,
+                10,
+                3,
+                15,
+                37,
+                14,
+                123000,
+                timezone(timedelta(hours=2, minutes=30)),
+            ),
+        ),
+        (
+            "2025-10-03T15:37:14.4783763-05:00",
+            datetime(2025, 10, 3, 15, 37, 14, 478376, timezone(timedelta(hours=-5))),
+        ),
+    ],
+)
+def test_parse_timestamp(parse, value, expected):
+    parsed = parse(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize("parse", [parse_timestamp, _parse_fixed_timestamp])
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "2025/10/03T15:37:14Z",
+        "2025-10-03T15:37:14+0530Z",
+        "2025-10-03T15:37:14.5xZ",
+    ],
+)
+def test_parse_timestamp_rejects_other_forms(parse, value):
+    with pytest.raises(ValueError):
+        parse(value)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (
+            "2025-10-03T15:37:14.4783763Z",
+            datetime(2025, 10, 3, 15, 37, 14, 478376, UTC),
+        ),
+        ("2025-10-03", datetime(2025, 10, 3)),
+        (None, None),
+        ("", None),
+        (12, None),
+        ("not a timestamp", None),
+    ],
+)
+def test_parse_datetime(value, expected):
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1:30.857", 90857),
+        ("28.111", 28111),
+        ("+0.143", 143),
+        ("-0.5", -500),
+        ("+12.3456", 12345),
+        ("1:02:03.4", 3723400),
+        ("90", 90000),
+        ("LAP 57", None),
+        ("1L", None),
+        ("1.x", None),
+        ("1:3a.000", None),
+        ("", None),
+        (None, None),
+        (90.857, None),
+    ],
+)
+def test_parse_time_ms(value, expected):
+    assert parse_time_ms(value) == expected
@@ -0,0 +1,309 @@
+"""Tests for the per-driver lap history."""
+
+import copy
+from dataclasses import replace
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.samples import TIMING_APP_DATA  # noqa: E402
+from custom_components.racepulse.client.analytics import (  # noqa: E402
+    LapHistory,
+    LapRing,
+)
+from custom_components.racepulse.client.analytics.lap_history import (  # noqa: E402
+    COMPOUNDS,
+)
+from custom_components.racepulse.client.enums import (  # noqa: E402
+    LiveTimingEvent,
+    TyreCompound,
+)
+from custom_components.racepulse.client.event_factory import (  # noqa: E402
+    EventFactory,
+)
+from custom_components.racepulse.client.models import TrackStatus  # noqa: E402
+
+
+def lap(number, time=None, **line):
+    """A `TimingData` line update completing lap `number`."""
+    line["NumberOfLaps"] = number
+    if time is not None:
+        line["LastLapTime"] = {"Value": time}
+    return line
+
+
+def timing_app(payload=TIMING_APP_DATA):
+    return EventFactory.parse(LiveTimingEvent.TIMING_APP, copy.deepcopy(payload))
+
+
+def session_info(key, path="2025/2025-10-05_Singapore_Grand_Prix/"):
+    return EventFactory.parse(LiveTimingEvent.SESSION_INFO, {"Key": key, "Path": path})
+
+
+@pytest.fixture
+def history(timing):
+    """A history that has seen the sample snapshot, and its lap listener calls."""
+    history = LapHistory()
+    history.calls = []
+    history.subscribe(lambda num, ring, row: history.calls.append((num, row)))
+    history.update(None, timing.event)
+    return history
+
+
+# --- LapRing ---
+def test_ring_appends_and_wraps():
+    ring = LapRing(capacity=3)
+    assert ring.last is None
+
+    for number in range(1, 5):
+        ring.append(lap=number, lap_ms=90_000 + number, sectors=(1, 2))
+
+    assert len(ring) == ring.capacity == 3
+    assert ring.last == 0
+    assert ring.column("lap").tolist() == [2, 3, 4]
+    assert ring.column("lap_ms").tolist() == [90_002, 90_003, 90_004]
+    assert ring.column("sectors")[0, :2].tolist() == [1, 2]
+    assert math.isnan(ring.column("sectors")[0, 2])
+
+
+def test_ring_columns_are_read_only():
+    ring = LapRing()
+    ring.append(lap=1, lap_ms=90_000, sectors=())
+    column = ring.column("lap")
+
+    with pytest.raises(ValueError):
+        column[0] = 2
+    with pytest.raises(KeyError):
+        ring.column("capacity")
+
+
+def test_ring_clear():
+    ring = LapRing()
+    ring.append(lap=1, lap_ms=90_000, sectors=())
+
+    ring.clear()
+
+    assert len(ring) == 0
+    assert ring.last is None
+    assert ring.column("lap").tolist() == []
+
+
+def test_ring_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        LapRing(capacity=0)
+
+
+# --- Recording laps ---
+def test_first_lap_count_is_the_starting_point(history, timing):
+    history.update(None, timing.event)
+
+    assert len(history.racing_numbers) == 20
+    assert len(history.laps("44")) == 0
+    assert history.laps("99") is None
+    assert history.recorded == 0
+
+
+def test_completed_lap_is_recorded(history, timing):
+    history.update(None, timing.apply({"44": lap(25, "1:30.500", InPit=True)}))
+    history.update(None, timing.apply({"44": lap(26, "1:30.400", InPit=False)}))
+
+    ring = history.laps("44")
+    assert ring.column("lap").tolist() == [25, 26]
+    assert ring.column("lap_ms").tolist() == [90_500, 90_400]
+    assert ring.column("sectors")[0].tolist() == [28_111] * 3
+    assert ring.column("pit").tolist() == [True, True]
+    assert ring.column("stint").tolist() == [-1, -1]
+    assert history.recorded == 2
+    assert history.calls == [("44", 0), ("44", 1)]
+
+    history.update(None, timing.apply({"44": lap(27, "1:30.300")}))
+
+    assert ring.column("pit").tolist() == [True, True, False]
+
+
+def test_stale_lap_time_is_filled_in_later(history, timing):
+    # The lap count arrives with the previous lap's time still in place.
+    history.update(None, timing.apply({"44": lap(25)}))
+
+    ring = history.laps("44")
+    assert math.isnan(ring.lap_ms[ring.last])
+
+    history.update(None, timing.apply({"44": {"LastLapTime": {"Value": "1:30.500"}}}))
+
+    assert ring.lap_ms[ring.last] == 90_500
+    assert history.calls == [("44", 0), ("44", 0)]
+
+
+def test_lap_time_is_corrected(history, timing):
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+    history.update(None, timing.apply({"44": lap(26, "1:30.400")}))
+
+    # Back to the previous lap's time: a stale repeat, not a correction.
+    history.update(None, timing.apply({"44": {"LastLapTime": {"Value": "1:30.500"}}}))
+    history.update(None, timing.apply({"44": {"LastLapTime": {"Value": "1:30.450"}}}))
+    history.update(None, timing.apply({"44": {"Position": "3"}}))
+
+    ring = history.laps("44")
+    assert ring.column("lap_ms").tolist() == [90_500, 90_450]
+    assert history.calls == [("44", 0), ("44", 1), ("44", 1)]
+
+
+def test_final_sector_is_filled_in_later(history, timing):
+    history.update(
+        None,
+        timing.apply({"44": lap(25, "1:30.500", Sectors={"2": {"Value": ""}})}),
+    )
+
+    ring = history.laps("44")
+    assert math.isnan(ring.sectors[ring.last, 2])
+
+    history.update(None, timing.apply({"44": {"Sectors": {"2": {"Value": "28.500"}}}}))
+
+    assert ring.sectors[ring.last, 2] == 28_500
+
+
+def test_unchanged_lap_count_before_any_lap(history, timing):
+    history.update(None, timing.apply({"44": {"LastLapTime": {"Value": "1:29.000"}}}))
+
+    assert len(history.laps("44")) == 0
+    assert history.calls == []
+
+
+# --- Stints ---
+def test_laps_carry_the_current_stint(history, timing):
+    app = timing_app()
+    history.update(None, app)
+    history.update(None, app)
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+
+    ring = history.laps("44")
+    assert ring.stint[ring.last] == 1
+    assert COMPOUNDS[ring.compound[ring.last]] == TyreCompound.HARD
+    assert ring.tyre_age[ring.last] == 1
+
+    history.update(None, timing.apply({"44": lap(26, "1:30.400")}))
+
+    assert ring.tyre_age[ring.last] == 2
+
+
+def test_stint_change_restarts_tyre_age(history, timing):
+    payload = copy.deepcopy(TIMING_APP_DATA)
+    stints = payload["Lines"]["44"]["Stints"]
+    history.update(None, timing_app(payload))
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+
+    stints.append(dict(stints[-1], Compound="SOFT", StartLaps=3))
+    history.update(None, timing_app(payload))
+    history.update(None, timing.apply({"44": lap(26, "1:30.400")}))
+
+    ring = history.laps("44")
+    assert ring.column("stint").tolist() == [1, 2]
+    assert ring.column("tyre_age").tolist() == [1, 4]
+
+
+def test_stints_of_unknown_drivers():
+    history = LapHistory()
+    app = timing_app()
+    line = app.lines["44"]
+    history.update(
+        None,
+        replace(
+            app,
+            lines={
+                "44": replace(line, stints={"1": line.stints["1"]}),
+                "1": replace(line, stints={}),
+            },
+        ),
+    )
+
+    assert len(history.laps("44")) == 0
+    assert history.laps("1") is None
+
+
+# --- Resets ---
+def test_new_session_drops_every_lap(timing):
+    history = LapHistory()
+    resets = []
+    history.subscribe(lambda *args: None, resets.append)
+
+    history.update(None, session_info(9))
+    history.update(None, timing.event)
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+    history.update(None, session_info(9))
+
+    assert len(history.laps("44")) == 1
+    assert resets == []
+
+    history.update(None, session_info(10, path="2025/other/"))
+
+    assert history.laps("44") is None
+    assert resets == [None]
+
+
+def test_lap_count_going_down_restarts_driver(history, timing):
+    resets = []
+    history.subscribe(lambda *args: None, resets.append)
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+
+    history.update(None, timing.apply({"44": lap(1, "1:35.000")}))
+
+    assert len(history.laps("44")) == 0
+    assert resets == ["44"]
+
+    # The time held at the restart belongs to an unrecorded lap.
+    history.update(None, timing.apply({"44": lap(2)}))
+
+    ring = history.laps("44")
+    assert ring.column("lap").tolist() == [2]
+    assert math.isnan(ring.lap_ms[ring.last])
+
+
+def test_reset(history):
+    resets = []
+    history.subscribe(lambda *args: None, resets.append)
+
+    history.reset("44")
+    history.reset("99")
+
+    assert history.laps("44") is None
+    assert len(history.racing_numbers) == 19
+
+    history.reset()
+
+    assert history.racing_numbers == []
+    assert resets == ["44", "99", None]
+
+
+# --- Listeners ---
+def test_unsubscribe(history, timing):
+    calls = []
+    unsubscribe = history.subscribe(
+        lambda num, ring, row: calls.append(num), calls.append
+    )
+
+    unsubscribe()
+    unsubscribe()
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+    history.reset()
+
+    assert calls == []
+
+
+def test_failing_listeners_are_logged(history, timing, caplog):
+    def fail(*args):
+        raise RuntimeError("boom")
+
+    history.subscribe(fail, fail)
+    history.update(None, timing.apply({"44": lap(25, "1:30.500")}))
+    history.reset("44")
+
+    assert history.calls == [("44", 0)]
+    assert caplog.text.count("Failed to notify lap listener") == 2
+
+
+def test_update_ignores_other_topics(history):
+    history.update(None, TrackStatus(status="1", message="AllClear"))
+
+    assert history.recorded == 0
@@ -0,0 +1,157 @@
+"""Tests for the connection liveness monitor."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+import math
+import statistics
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.racepulse.client import link_monitor
+from custom_components.racepulse.client.f1_signalr_client import F1SignalRClient
+from custom_components.racepulse.client.link_monitor import LinkMonitor, RunningStats
+from custom_components.racepulse.client.models.heartbeat import Heartbeat
+
+
+class Clock:
+    """A `time.monotonic()` that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    # Only the monitor's clock; the event loop keeps the real one.
+    monkeypatch.setattr(link_monitor, "time", clock)
+    return clock
+
+
+def test_running_stats():
+    samples = [0.5, 2.0, 0.25, 1.25]
+    stats = RunningStats()
+    assert (stats.count, stats.stdev, stats.minimum) == (0, 0.0, math.inf)
+
+    for sample in samples:
+        stats.add(sample)
+
+    assert stats.count == 4
+    assert stats.mean == pytest.approx(statistics.mean(samples))
+    assert stats.stdev == pytest.approx(statistics.stdev(samples))
+    assert (stats.minimum, stats.maximum, stats.last) == (0.25, 2.0, 1.25)
+
+
+def test_stall_threshold(clock):
+    monitor = LinkMonitor(stall_timeout=30)
+
+    # Without any frame, silence counts from the connection.
+    clock.now = 30
+    assert monitor.silence() == 30
+    assert not monitor.stalled()
+    clock.now = 30.5
+    assert monitor.stalled()
+
+    monitor.frame_received()
+    assert monitor.silence() == 0
+    assert not monitor.stalled(clock.now + 30)
+    assert monitor.stalled(clock.now + 30.1)
+
+    monitor.reset()
+    assert monitor.silence() == 0
+
+
+def test_frame_at_time_zero(clock):
+    monitor = LinkMonitor(stall_timeout=30)
+    clock.now = 100
+    monitor.reset()
+
+    monitor.frame_received(0.0)
+
+    assert monitor.silence() == 100
+
+
+def test_interarrival_stats(clock):
+    monitor = LinkMonitor(stall_timeout=30)
+    assert monitor.stats.frames == 0
+    assert monitor.stats.silence is None
+
+    for received, keep_alive in ((1.0, False), (1.5, True), (4.0, False), (4.5, True)):
+        monitor.frame_received(received, keep_alive=keep_alive)
+    clock.now = 6.0
+    stats = monitor.stats
+
+    assert (stats.frames, stats.keep_alives) == (4, 2)
+    assert stats.silence == 1.5
+    assert stats.interarrival_mean == pytest.approx(statistics.mean([0.5, 2.5, 0.5]))
+    assert stats.interarrival_stdev == pytest.approx(statistics.stdev([0.5, 2.5, 0.5]))
+    assert stats.interarrival_max == 2.5
+
+    # A new connection starts its own statistics.
+    monitor.reset()
+    assert (monitor.stats.frames, monitor.stats.keep_alives) == (0, 0)
+    assert monitor.stats.interarrival_max == 0.0
+
+
+def test_round_trips(clock):
+    monitor = LinkMonitor(stall_timeout=30)
+    assert monitor.stats.rtt_last is None
+
+    monitor.request_sent(1)
+    clock.now = 0.25
+    monitor.request_sent("2")
+    monitor.response_received("1", received=0.5)
+    monitor.response_received(2, received=0.5)
+    monitor.response_received(3, received=0.5)
+    monitor.reset()
+
+    assert monitor.stats.rtt_last == 0.25
+    assert monitor.stats.rtt_mean == 0.375
+
+
+def test_heartbeat_lag():
+    monitor = LinkMonitor(stall_timeout=30)
+    sent = datetime.now(timezone.utc) - timedelta(seconds=2)
+
+    monitor.update(None, Heartbeat(datetime_utc=sent.replace(tzinfo=None)))
+
+    assert monitor.stats.heartbeats == 1
+    assert monitor.stats.heartbeat_lag == pytest.approx(2, abs=1)
+
+
+def test_stall_timeout_must_be_positive():
+    with pytest.raises(ValueError):
+        LinkMonitor(stall_timeout=0)
+
+
+def test_watchdog_drops_stalled_connections(clock):
+    # Checks every 10 ms of real time against the fake clock.
+    client = F1SignalRClient(session=None, stall_timeout=0.04)
+    client._ws = SimpleNamespace(closed=False)
+    client._monitor.frame_received()
+
+    async def watch():
+        watchdog = asyncio.create_task(client._watchdog())
+        await asyncio.sleep(0.05)
+        assert not watchdog.done()
+
+        clock.now = 0.05
+        await asyncio.wait_for(watchdog, 1)
+
+    asyncio.run(watch())
+
+    assert client._monitor.stalls == 1
+    assert client.link_stats.stalls == 1
+
+
+def test_watchdog_stops_with_the_connection(clock):
+    client = F1SignalRClient(session=None, stall_timeout=0.04)
+    client._ws = SimpleNamespace(closed=True)
+
+    asyncio.run(asyncio.wait_for(client._watchdog(), 1))
+
+    assert client._monitor.stalls == 0
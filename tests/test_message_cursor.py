@@ -0,0 +1,140 @@
+"""Tests for tracking the SignalR message cursor."""
+
+import pytest
+
+from custom_components.racepulse.client import message_cursor
+from custom_components.racepulse.client.message_cursor import (
+    MessageCursor,
+    parse_cursor,
+)
+
+
+class Clock:
+    """A `time.monotonic()` that only moves when told to."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(message_cursor, "time", clock)
+    return clock
+
+
+def frame(cursor, messages=1, **payload):
+    return {"C": cursor, "M": [{"M": "feed"}] * messages, **payload}
+
+
+@pytest.mark.parametrize(
+    ("cursor", "expected"),
+    [
+        ("d-1A2B3C4D-B,41|C,0", {"B": 41, "C": 0}),
+        ("d-1-B,7", {"B": 7}),
+        ("d-1A2B3C4D-B,1|C,0|D,2", {"B": 1, "C": 0, "D": 2}),
+        ("d-1-B,x", None),
+        ("d-1-B", None),
+        ("", None),
+        ("d-1-B,4|,5", None),
+    ],
+)
+def test_parse_cursor(cursor, expected):
+    assert parse_cursor(cursor) == expected
+
+
+def test_consecutive_messages_are_no_gap():
+    cursor = MessageCursor()
+
+    cursor.update(frame("d-1-B,10|C,0"))
+    cursor.update(frame("d-1-B,11|C,0"))
+    cursor.update(frame("d-1-B,13|C,1", messages=3))
+    cursor.update({"C": "d-1-B,13|C,1"})
+
+    assert (cursor.gaps, cursor.missed) == (0, 0)
+    assert cursor.message_id == "d-1-B,13|C,1"
+
+
+def test_gaps_count_the_missed_messages():
+    cursor = MessageCursor()
+
+    cursor.update(frame("d-1-B,10|C,0"))
+    cursor.update(frame("d-1-B,14|C,0"))
+    cursor.update(frame("d-1-B,15|C,3", messages=2))
+
+    assert cursor.stats.gaps == 2
+    assert cursor.stats.missed == 3 + 2
+
+
+def test_unexpected_cursors_keep_the_last_sequence():
+    cursor = MessageCursor()
+
+    cursor.update(frame("d-1-B,10"))
+    cursor.update(frame("d-1-other-format"))
+    # Streams going backwards or appearing later are not gaps.
+    cursor.update(frame("d-1-B,11"))
+    cursor.update(frame("d-1-B,3|C,9"))
+
+    assert (cursor.gaps, cursor.missed) == (0, 0)
+    assert cursor.message_id == "d-1-B,3|C,9"
+
+
+def test_frames_without_a_cursor_are_ignored():
+    cursor = MessageCursor()
+
+    cursor.update({"I": "1", "R": {}})
+    cursor.update({"C": 5})
+
+    assert cursor.message_id is None
+    assert not cursor.resumable(disconnect_timeout=30)
+
+
+def test_groups_token_is_kept_until_reset():
+    cursor = MessageCursor()
+
+    cursor.update(frame("d-1-B,1", G="token-1"))
+    cursor.update(frame("d-1-B,2"))
+    assert cursor.groups_token == "token-1"
+
+    cursor.update(frame("d-1-B,3", G="token-2"))
+    assert cursor.groups_token == "token-2"
+
+    cursor.reset()
+    assert cursor.groups_token is None
+    assert cursor.message_id is None
+
+
+def test_resumable_until_the_disconnect_timeout(clock):
+    cursor = MessageCursor()
+    assert not cursor.resumable(disconnect_timeout=30)
+
+    clock.now = 100
+    cursor.update(frame("d-1-B,1"))
+    clock.now = 129.9
+    assert cursor.resumable(disconnect_timeout=30)
+    clock.now = 130
+    assert not cursor.resumable(disconnect_timeout=30)
+
+    # Every frame with a cursor extends the window.
+    cursor.update(frame("d-1-B,2"))
+    assert cursor.resumable(disconnect_timeout=30)
+
+    cursor.reset()
+    assert not cursor.resumable(disconnect_timeout=30)
+
+
+def test_reset_keeps_the_stats():
+    cursor = MessageCursor()
+    cursor.update(frame("d-1-B,1"))
+    cursor.update(frame("d-1-B,5"))
+    cursor.resumes = 2
+
+    cursor.reset()
+    # The first frame after a reset has nothing to compare with.
+    cursor.update(frame("d-1-B,50"))
+
+    assert (cursor.stats.gaps, cursor.stats.missed) == (1, 3)
+    assert cursor.stats.resumes == 2
@@ -0,0 +1,188 @@
+"""Tests for the bounded queues of async observers."""
+
+import asyncio
+
+import pytest
+
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.enums.overflow_policy import OverflowPolicy
+from custom_components.racepulse.client.observer_queue import ObserverQueue
+from custom_components.racepulse.client.subject import Subject
+
+
+class Message:
+    def __init__(self, data_type, name):
+        self.data_type = data_type
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+TIMING = LiveTimingEvent.TIMING_DATA
+TRACK = LiveTimingEvent.TRACK_STATUS
+WEATHER = LiveTimingEvent.WEATHER_DATA
+
+
+class Receiver:
+    """An async observer that waits for `release` before each event."""
+
+    def __init__(self, fail=()):
+        self.received = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = fail
+
+    async def async_receive(self, subject, message):
+        await self.release.wait()
+        self.received.append(message.name)
+        if message.name in self.fail:
+            raise RuntimeError(message.name)
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def test_drop_oldest():
+    async def run():
+        receiver = Receiver()
+        queue = ObserverQueue(None, receiver, maxsize=2)
+        for name in ("a", "b", "c"):
+            assert queue.offer(Message(TIMING, name))
+
+        queue.start()
+        await settle()
+        queue.stop()
+        return receiver, queue.metrics
+
+    receiver, metrics = asyncio.run(run())
+
+    assert receiver.received == ["b", "c"]
+    assert (metrics.delivered, metrics.dropped, metrics.max_depth) == (2, 1, 2)
+    assert metrics.depth == 0
+
+
+def test_coalesce_keeps_latest_per_topic():
+    async def run():
+        receiver = Receiver()
+        queue = ObserverQueue(None, receiver, 2, OverflowPolicy.COALESCE)
+        queue.offer(Message(TIMING, "timing 1"))
+        queue.offer(Message(TRACK, "track 1"))
+        queue.offer(Message(TIMING, "timing 2"))
+        # Full: the oldest topic makes room.
+        queue.offer(Message(WEATHER, "weather 1"))
+
+        queue.start()
+        await settle()
+        queue.stop()
+        return receiver, queue.metrics
+
+    receiver, metrics = asyncio.run(run())
+
+    assert receiver.received == ["track 1", "weather 1"]
+    assert (metrics.coalesced, metrics.dropped) == (1, 1)
+
+
+def test_block_counts_each_wait_once():
+    async def run():
+        receiver = Receiver()
+        receiver.release.clear()
+        queue = ObserverQueue(None, receiver, 1, OverflowPolicy.BLOCK)
+        queue.start()
+        assert queue.offer(Message(TIMING, "a"))
+        await settle()  # "a" is being received, the queue is empty.
+        assert queue.offer(Message(TIMING, "b"))
+        assert not queue.offer(Message(TIMING, "c"))
+
+        # Two producers wait; each free slot wakes both, one of them retries.
+        puts = [
+            asyncio.create_task(queue.put(Message(TIMING, name))) for name in ("c", "d")
+        ]
+        await settle()
+        assert not any(put.done() for put in puts)
+
+        receiver.release.set()
+        await asyncio.gather(*puts)
+        await settle()
+        queue.stop()
+        return receiver, queue.metrics
+
+    receiver, metrics = asyncio.run(run())
+
+    assert receiver.received == ["a", "b", "c", "d"]
+    assert (metrics.blocked, metrics.dropped, metrics.delivered) == (2, 0, 4)
+
+
+def test_put_without_waiting():
+    async def run():
+        queue = ObserverQueue(None, Receiver(), 1, OverflowPolicy.BLOCK)
+        await queue.put(Message(TIMING, "a"))
+        return queue.metrics
+
+    metrics = asyncio.run(run())
+
+    assert (metrics.depth, metrics.blocked) == (1, 0)
+
+
+def test_failures_are_counted_apart(caplog):
+    async def run():
+        receiver = Receiver(fail={"b"})
+        queue = ObserverQueue(None, receiver)
+        queue.start()
+        for name in ("a", "b", "c"):
+            queue.offer(Message(TIMING, name))
+        await settle()
+        queue.stop()
+        return receiver, queue.metrics
+
+    receiver, metrics = asyncio.run(run())
+
+    assert receiver.received == ["a", "b", "c"]
+    assert (metrics.delivered, metrics.failed) == (2, 1)
+    assert "Failed to notify async observer" in caplog.text
+
+
+def test_stop_discards_queued_events():
+    async def run():
+        queue = ObserverQueue(None, Receiver())
+        queue.start()
+        queue.offer(Message(TIMING, "a"))
+        queue.stop()
+        queue.stop()
+        return queue.metrics
+
+    assert asyncio.run(run()).depth == 0
+
+
+def test_maxsize_must_be_positive():
+    with pytest.raises(ValueError):
+        ObserverQueue(None, Receiver(), maxsize=0)
+
+
+def test_subject_applies_back_pressure():
+    async def run():
+        subject = Subject()
+        receiver = Receiver()
+        receiver.release.clear()
+        subject.attach(receiver, policy=OverflowPolicy.BLOCK, maxsize=1)
+        for name in ("a", "b", "c"):
+            subject.notify(Message(TIMING, name))
+            await settle()
+
+        drain = asyncio.create_task(subject._drain_blocked())
+        await settle()
+        assert not drain.done()
+
+        receiver.release.set()
+        await drain
+        await settle()
+        metrics = subject.queue_metrics[receiver]
+        subject._stop_queues()
+        return receiver, metrics
+
+    receiver, metrics = asyncio.run(run())
+
+    assert receiver.received == ["a", "b", "c"]
+    assert metrics.blocked == 1
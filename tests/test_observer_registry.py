@@ -0,0 +1,142 @@
+"""Tests for routing events to the observers interested in them."""
+
+import json
+
+import pytest
+
+from custom_components.racepulse.client.base_client import BaseTimingClient
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.observer_registry import ObserverRegistry
+from custom_components.racepulse.client.state import touched_drivers
+
+TIMING_DATA = LiveTimingEvent.TIMING_DATA
+TRACK_STATUS = LiveTimingEvent.TRACK_STATUS
+
+
+class Collector:
+    """An observer keeping every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, subject, message):
+        self.events.append(message)
+
+
+@pytest.fixture
+def registry():
+    return ObserverRegistry()
+
+
+def test_topic_index(registry):
+    everything, timing, status = Collector(), Collector(), Collector()
+    registry.add(everything)
+    registry.add(timing, topics={TIMING_DATA})
+    registry.add(status, topics=[TRACK_STATUS, TIMING_DATA])
+
+    assert list(registry.observers_for(TIMING_DATA)) == [everything, timing, status]
+    assert list(registry.observers_for(TRACK_STATUS)) == [everything, status]
+    assert list(registry.observers_for(LiveTimingEvent.WEATHER_DATA)) == [everything]
+    assert len(registry) == 3
+
+
+def test_driver_index(registry):
+    everyone, hamilton, both = Collector(), Collector(), Collector()
+    registry.add(everyone, topics={TIMING_DATA})
+    registry.add(hamilton, topics={TIMING_DATA}, drivers={44})
+    registry.add(both, topics={TIMING_DATA}, drivers={"44", "1"})
+
+    assert list(registry.observers_for(TIMING_DATA, {"44"})) == [
+        everyone,
+        hamilton,
+        both,
+    ]
+    assert list(registry.observers_for(TIMING_DATA, {"1"})) == [everyone, both]
+    assert list(registry.observers_for(TIMING_DATA, {"63"})) == [everyone]
+    # Each observer at most once, however many of its drivers are touched.
+    assert sorted(
+        map(id, registry.observers_for(TIMING_DATA, {"1", "44", "63"}))
+    ) == sorted(map(id, [everyone, hamilton, both]))
+
+
+@pytest.mark.parametrize("drivers", [None, frozenset(), set()])
+def test_driver_less_updates_reach_filtered_observers(registry, drivers):
+    everyone, hamilton = Collector(), Collector()
+    registry.add(everyone)
+    registry.add(hamilton, drivers={"44"})
+
+    assert list(registry.observers_for(TIMING_DATA, drivers)) == [everyone, hamilton]
+
+
+def test_only_filtered_observers(registry):
+    hamilton = Collector()
+    registry.add(hamilton, topics={TIMING_DATA}, drivers={"44"})
+
+    assert list(registry.observers_for(TIMING_DATA, {"1"})) == []
+    assert list(registry.observers_for(TIMING_DATA, {"44"})) == [hamilton]
+    assert list(registry.observers_for(TRACK_STATUS, {"44"})) == []
+
+
+def test_add_replaces_and_remove_drops(registry):
+    observer = Collector()
+    registry.add(observer, topics={TIMING_DATA}, drivers={"44"})
+
+    subscription = registry.add(observer, topics={TRACK_STATUS})
+
+    assert subscription.topics == frozenset({TRACK_STATUS})
+    assert subscription.drivers is None
+    assert registry.subscriptions == [subscription]
+    assert list(registry.observers_for(TIMING_DATA, {"44"})) == []
+    assert list(registry.observers_for(TRACK_STATUS)) == [observer]
+
+    assert registry.remove(observer)
+    assert not registry.remove(observer)
+    assert observer not in registry
+    assert list(registry.observers_for(TRACK_STATUS)) == []
+
+
+@pytest.mark.parametrize(
+    ("event_type", "delta", "expected"),
+    [
+        (TIMING_DATA, {"Lines": {"44": {}, "1": {}}}, {"44", "1"}),
+        (TIMING_DATA, {"Lines": {"_deleted": ["5", 81]}}, {"5", "81"}),
+        (TIMING_DATA, {"Lines": {"44": {}, "_deleted": ["5"]}}, {"44", "5"}),
+        (TIMING_DATA, {"Withheld": False}, set()),
+        (LiveTimingEvent.TIMING_APP, {"Lines": {"16": {"Stints": []}}}, {"16"}),
+        (LiveTimingEvent.TIMING_STATS, {"Lines": {"_deleted": "5"}}, set()),
+        (LiveTimingEvent.DRIVER_LIST, {"44": {}, "_kf": True}, {"44"}),
+        (LiveTimingEvent.DRIVER_LIST, {"_deleted": ["5"]}, {"5"}),
+        (
+            LiveTimingEvent.TEAM_RADIO,
+            {"Captures": {"3": {"RacingNumber": "44"}, "4": {"Path": "x"}}},
+            {"44"},
+        ),
+        (LiveTimingEvent.TEAM_RADIO, {"Captures": [{"RacingNumber": 1}]}, {"1"}),
+        (LiveTimingEvent.TEAM_RADIO, {}, set()),
+        (TRACK_STATUS, {"Status": "1"}, None),
+        (TIMING_DATA, ["not", "a", "dict"], None),
+    ],
+)
+def test_touched_drivers(event_type, delta, expected):
+    touched = touched_drivers(event_type, delta)
+
+    assert touched == (None if expected is None else frozenset(expected))
+
+
+def test_deleted_driver_reaches_its_observers():
+    client = BaseTimingClient()
+    hamilton, verstappen = Collector(), Collector()
+    client.attach(hamilton, topics={TIMING_DATA}, drivers={"44"})
+    client.attach(verstappen, topics={TIMING_DATA}, drivers={"1"})
+
+    def feed(data):
+        client._handle_frame(
+            json.dumps({"M": [{"M": "feed", "A": ["TimingData", data, "2025-10-05"]}]})
+        )
+
+    feed({"Lines": {"44": {"Position": "1"}, "1": {"Position": "2"}}})
+    feed({"Lines": {"_deleted": ["44"]}})
+
+    assert len(hamilton.events) == 2
+    assert "44" not in hamilton.events[-1].lines
+    assert len(verstappen.events) == 1
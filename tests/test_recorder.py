@@ -0,0 +1,184 @@
+"""Tests for frame recording and replay."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+from aiohttp import WSMsgType
+
+from custom_components.racepulse.client.base_client import BaseTimingClient
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.f1_signalr_client import (
+    KEEP_ALIVE_FRAME,
+    F1SignalRClient,
+)
+from custom_components.racepulse.client.recorder import FrameRecorder, read_capture
+from custom_components.racepulse.client.replay_client import ReplayClient
+
+PRACTICE = "2025/2025-10-05_Singapore_Grand_Prix/2025-10-03_Practice_2/"
+RACE = "2025/2025-10-05_Singapore_Grand_Prix/2025-10-05_Race/"
+
+
+class Collector:
+    """An observer keeping every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def update(self, subject, message):
+        self.events.append(message)
+
+
+class FakeWebSocket:
+    """Yields text frames, then closes."""
+
+    def __init__(self, frames):
+        self.closed = False
+        self._frames = frames
+
+    async def __aiter__(self):
+        for data in self._frames:
+            yield SimpleNamespace(type=WSMsgType.TEXT, data=data)
+        self.closed = True
+
+
+def snapshot(path, message="AllClear"):
+    return json.dumps(
+        {
+            "R": {
+                "SessionInfo": {"Path": path},
+                "TrackStatus": {"Status": "1", "Message": message},
+            },
+            "I": "1",
+        }
+    )
+
+
+def feed(topic, data):
+    return json.dumps(
+        {
+            "C": "d-1",
+            "M": [{"H": "Streaming", "M": "feed", "A": [topic, data, "2025-10-05"]}],
+        }
+    )
+
+
+def frames_of(recorder, session):
+    return [frame for _, frame in read_capture(recorder.session_directory(session))]
+
+
+def test_frames_follow_the_session(tmp_path):
+    recorder = FrameRecorder(tmp_path)
+    client = BaseTimingClient()
+    client.attach(recorder, topics={LiveTimingEvent.SESSION_INFO})
+    frames = [
+        snapshot(PRACTICE),
+        feed("TrackStatus", {"Message": "Yellow"}),
+        feed("SessionInfo", {"Path": RACE}),
+        feed("TrackStatus", {"Message": "AllClear"}),
+        feed("SessionInfo", {"Name": "Race"}),
+    ]
+
+    # Frames are recorded before they are parsed, as the live client does.
+    for received, frame in enumerate(frames):
+        recorder.record(frame, received)
+        client._handle_frame(frame)
+    asyncio.run(recorder.flush())
+
+    assert recorder.session == RACE
+    assert recorder.frames == 5
+    assert frames_of(recorder, PRACTICE) == frames[:2]
+    assert frames_of(recorder, RACE) == frames[2:]
+
+
+def test_frames_before_the_first_session(tmp_path):
+    recorder = FrameRecorder(tmp_path)
+    recorder.record(KEEP_ALIVE_FRAME, 1.0)
+    recorder.set_session(PRACTICE)
+    recorder.record(KEEP_ALIVE_FRAME, 2.0)
+    asyncio.run(recorder.flush())
+
+    assert list(read_capture(recorder.session_directory(PRACTICE))) == [
+        (1.0, KEEP_ALIVE_FRAME),
+        (2.0, KEEP_ALIVE_FRAME),
+    ]
+
+
+def test_files_rotate_by_size(tmp_path):
+    recorder = FrameRecorder(tmp_path, max_file_bytes=1)
+    recorder.set_session(RACE)
+
+    async def record():
+        for received in range(3):
+            recorder.record(feed("TrackStatus", {"Status": str(received)}), received)
+            await recorder.flush()
+        # Reopening a session continues after its last full file.
+        reopened = FrameRecorder(tmp_path, max_file_bytes=1)
+        reopened.set_session(RACE)
+        reopened.record(KEEP_ALIVE_FRAME, 3)
+        await reopened.close()
+
+    asyncio.run(record())
+
+    directory = recorder.session_directory(RACE)
+    assert sorted(path.name for path in directory.iterdir()) == [
+        f"frames-{index:04d}.txt.gz" for index in range(4)
+    ]
+    assert [received for received, _ in read_capture(directory)] == [0, 1, 2, 3]
+
+
+def test_session_paths_stay_in_the_capture_directory(tmp_path):
+    recorder = FrameRecorder(tmp_path)
+
+    assert recorder.session_directory("../../etc/") == tmp_path / "etc"
+    assert recorder.session_directory(None) == tmp_path / "unknown"
+    assert recorder.session_directory("a\\b") == tmp_path / "a" / "b"
+
+
+def test_live_client_records_every_frame(tmp_path):
+    recorder = FrameRecorder(tmp_path)
+    client = F1SignalRClient(session=None)
+    frames = [
+        snapshot(RACE),
+        KEEP_ALIVE_FRAME,
+        feed("TrackStatus", {"Message": "Yellow"}),
+        json.dumps({"C": "d-2", "D": 1}),
+        feed("TrackStatus", {"Message": "Red"}),
+    ]
+
+    async def listen():
+        client.attach_recorder(recorder)
+        client._ws = FakeWebSocket(frames)
+        await client._listen()
+        await client.detach_recorder()
+
+    asyncio.run(listen())
+
+    # The reconnect request ends the loop after it has been recorded.
+    assert recorder.frames == 4
+    assert frames_of(recorder, RACE) == frames[:4]
+
+
+def test_replay_of_a_recorded_session(tmp_path):
+    recorder = FrameRecorder(tmp_path)
+    frames = [
+        snapshot(RACE),
+        KEEP_ALIVE_FRAME,
+        feed("TrackStatus", {"Message": "Yellow"}),
+        "not json",
+        feed("TrackStatus", {"Message": "Red"}),
+    ]
+    recorder.set_session(RACE)
+    for received, frame in enumerate(frames):
+        recorder.record(frame, 100.0 + received / 2)
+    asyncio.run(recorder.close())
+
+    client = ReplayClient(recorder.session_directory(RACE), speed=None)
+    observer = Collector()
+    client.attach(observer, topics={LiveTimingEvent.TRACK_STATUS})
+    stats = asyncio.run(client.replay())
+
+    assert [event.message for event in observer.events] == ["AllClear", "Yellow", "Red"]
+    assert stats.frames == 5
+    assert stats.events == client.events
+    assert stats.recorded == 2.0
@@ -0,0 +1,191 @@
+"""Tests for the generated feed parsers."""
+
+import copy
+from dataclasses import dataclass, field
+import traceback
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from benchmarks.samples import DRIVER_LIST, TIMING_APP_DATA, WEATHER_DATA
+from benchmarks.schema_parsers import (
+    hand_written_driver_list,
+    hand_written_timing_app,
+    hand_written_weather_data,
+)
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+from custom_components.racepulse.client.models import (
+    DriverList,
+    TimingApp,
+    WeatherData,
+)
+from custom_components.racepulse.client.schema import (
+    compile_parser,
+    dict_of,
+    feed,
+    indexed,
+    list_of,
+    model,
+    optional,
+)
+
+
+@dataclass(frozen=True)
+class Point:
+    x: int = feed("X", int, default=0)
+    y: int = feed("Y", int, default=0)
+
+
+@dataclass(frozen=True)
+class Shape:
+    name: str = feed("Name", default="")
+    origin: Point = feed("Origin", model(Point))
+    depth: Optional[int] = feed(("Meta", "Depth"), optional(int))
+    points: List[Point] = feed("Points", list_of(model(Point)))
+    named: Dict[str, Point] = feed("Named", dict_of(model(Point)))
+    indexed: Dict[str, Point] = feed("Indexed", indexed(model(Point)))
+    tags: List[str] = feed("Tags", default=())
+    raw: Any = feed(None)
+    kind: str = field(default="shape", init=False)
+
+
+def test_parse_payload():
+    parse = compile_parser(Shape)
+    shape = parse(
+        {
+            "Name": "square",
+            "Origin": {"X": "1", "Y": "2"},
+            "Meta": {"Depth": "3"},
+            "Points": [{"X": "4"}],
+            "Named": {"a": {"Y": "5"}, "_kf": True},
+            "Indexed": [{"X": "6"}, {"X": "7"}],
+        }
+    )
+
+    assert shape.name == "square"
+    assert shape.origin == Point(1, 2)
+    assert shape.depth == 3
+    assert shape.points == [Point(4, 0)]
+    assert shape.named == {"a": Point(0, 5)}
+    assert shape.indexed == {"0": Point(6, 0), "1": Point(7, 0)}
+    assert shape.raw["Name"] == "square"
+    assert shape.kind == "shape"
+
+
+def test_missing_keys_use_defaults():
+    for payload in ({}, None):
+        shape = compile_parser(Shape)(payload)
+
+        assert shape.name == ""
+        assert shape.origin == Point(0, 0)
+        assert shape.depth is None
+        assert shape.points == []
+        assert shape.named == {}
+        assert shape.indexed == {}
+        assert shape.tags == ()
+        assert shape.raw == payload
+
+
+def test_non_literal_default_is_shared():
+    parse = compile_parser(Shape)
+
+    assert parse({}).tags is parse({}).tags
+
+
+def test_parser_is_compiled_once():
+    assert compile_parser(Shape) is compile_parser(Shape)
+    assert compile_parser(Shape).__qualname__ == "parse_Shape"
+
+
+def test_model_parser():
+    weather = compile_parser(WeatherData)({"AirTemp": "28.5", "Rainfall": "1"})
+
+    assert weather.air_temperature == 28.5
+    assert weather.rainfall == 1.0
+
+
+def test_traceback_shows_generated_source():
+    parse = compile_parser(Point)
+
+    with pytest.raises(ValueError) as info:
+        parse({"X": "one"})
+
+    source = "".join(traceback.format_tb(info.tb))
+    assert "<feed parser" in source
+    assert "x=" in source
+
+
+def test_not_a_dataclass():
+    class Plain:
+        pass
+
+    with pytest.raises(TypeError, match="not a dataclass"):
+        compile_parser(Plain)
+
+
+def test_field_without_feed():
+    @dataclass
+    class Partial:
+        name: str = feed("Name")
+        other: int = 0
+
+    with pytest.raises(TypeError, match="Partial.other"):
+        compile_parser(Partial)
+
+
+# Raw values the feed leaves out of partial updates, as the models default them.
+BLANK_DRIVER = {
+    "RacingNumber": None,
+    "BroadcastName": "",
+    "FullName": "",
+    "Tla": "",
+    "Line": None,
+    "TeamName": "",
+    "TeamColour": "",
+    "FirstName": "",
+    "LastName": "",
+    "Reference": "",
+    "HeadshotUrl": "",
+    "PublicIdRight": "",
+}
+
+
+@pytest.mark.parametrize(
+    "model, hand_written, payload",
+    [
+        (DriverList, hand_written_driver_list, DRIVER_LIST),
+        (TimingApp, hand_written_timing_app, TIMING_APP_DATA),
+        (WeatherData, hand_written_weather_data, WEATHER_DATA),
+    ],
+)
+def test_generated_parsers_match_hand_written(model, hand_written, payload):
+    assert compile_parser(model)(copy.deepcopy(payload)) == hand_written(payload)
+
+
+def test_partial_driver_list():
+    partial = {"44": {"Line": 3}, "1": {"Tla": "VER", "TeamName": "Red Bull"}}
+
+    # The hand-written parser needed every key of every driver.
+    with pytest.raises(KeyError):
+        hand_written_driver_list(partial)
+
+    parsed = EventFactory.parse(LiveTimingEvent.DRIVER_LIST, partial)
+    filled = {num: {**BLANK_DRIVER, **data} for num, data in partial.items()}
+
+    assert isinstance(parsed, DriverList)
+    assert parsed == hand_written_driver_list(filled)
+
+
+def test_partial_timing_data():
+    partial = {"Lines": {"99": {"Position": "21", "Sectors": [{"Value": "28.1"}]}}}
+
+    parsed = EventFactory.parse(LiveTimingEvent.TIMING_DATA, partial)
+
+    line = parsed.lines["99"]
+    assert parsed.withheld is False
+    assert (line.position, line.number_of_laps, line.racing_number) == ("21", 0, 0)
+    assert (line.gap_to_leader, line.gap_to_leader_ms) == ("", None)
+    assert line.speeds is line.best_lap_time is line.last_lap_time is None
+    assert line.sectors[0].value_ms == 28_100
+    assert line.sectors[0].segments == []
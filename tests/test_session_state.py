@@ -0,0 +1,107 @@
+"""Tests for the canonical session state."""
+
+import pytest
+
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.models import TrackStatus
+from custom_components.racepulse.client.state.session_state import (
+    SessionState,
+    resolve,
+)
+
+
+def test_value_and_versions(timing):
+    state = SessionState()
+    state.update(None, timing.event)
+    state.update(None, timing.apply({"44": {"NumberOfLaps": 25}}))
+
+    assert state.get(LiveTimingEvent.TIMING_DATA) is timing.event
+    assert state.get(LiveTimingEvent.TRACK_STATUS) is None
+    assert state.value("TimingData.lines.44.number_of_laps") == 25
+    assert state.value("TimingData.lines.44.sectors.2.value_ms") == 28111
+    assert state.value("TimingData.lines.99.position") is None
+    assert state.version(LiveTimingEvent.TIMING_DATA) == 2
+    assert state.version(LiveTimingEvent.TRACK_STATUS) == 0
+    assert state.driver_version(LiveTimingEvent.TIMING_DATA, "44") == 2
+    assert state.driver_version(LiveTimingEvent.TIMING_DATA, "1") == 1
+    assert state.driver_version(LiveTimingEvent.TIMING_APP, "1") == 0
+
+
+def test_subscribers_see_changes_only(timing):
+    state = SessionState()
+    calls = []
+    state.subscribe(
+        "TimingData.lines.44.number_of_laps", lambda *args: calls.append(args)
+    )
+
+    state.update(None, timing.event)
+    state.update(None, timing.apply({"1": {"NumberOfLaps": 25}}))
+    state.update(None, timing.apply({"44": {"Position": "3"}}))
+    state.update(None, timing.apply({"44": {"NumberOfLaps": 25}}))
+
+    assert calls == [
+        ("TimingData.lines.44.number_of_laps", 24),
+        ("TimingData.lines.44.number_of_laps", 25),
+    ]
+
+
+def test_subscribe_to_topic():
+    state = SessionState()
+    calls = []
+    state.subscribe("TrackStatus", lambda path, value: calls.append(value))
+    event = TrackStatus(status="1", message="AllClear")
+
+    state.update(None, event)
+    state.update(None, TrackStatus(status="1", message="AllClear"))
+
+    assert calls == [event]
+
+
+def test_unsubscribe():
+    state = SessionState()
+    calls = []
+    unsubscribe = state.subscribe("TrackStatus.status", calls.append)
+
+    unsubscribe()
+    unsubscribe()
+    state.update(None, TrackStatus(status="1", message="AllClear"))
+
+    assert calls == []
+
+
+def test_failing_subscriber_is_logged(caplog):
+    state = SessionState()
+    calls = []
+
+    def fail(path, value):
+        raise RuntimeError("boom")
+
+    state.subscribe("TrackStatus.status", fail)
+    state.subscribe("TrackStatus.status", lambda path, value: calls.append(value))
+    state.update(None, TrackStatus(status="1", message="AllClear"))
+
+    assert calls == ["1"]
+    assert "TrackStatus.status" in caplog.text
+
+
+def test_topic_names_with_dots():
+    state = SessionState()
+    state.subscribe("CarData.z.entries", lambda path, value: None)
+
+    assert state.value("CarData.z") is None
+    assert state.value("CarData.z.entries") is None
+
+
+def test_unknown_topic():
+    with pytest.raises(ValueError, match="Unknown topic"):
+        SessionState().value("Nope.lines")
+
+
+def test_resolve():
+    assert resolve(None, "a") is None
+    assert resolve({"a": 1}, "a") == 1
+    assert resolve(["a", "b"], "1") == "b"
+    assert resolve(("a",), "1") is None
+    assert resolve(["a"], "first") is None
+    assert resolve(TrackStatus(status="1", message=""), "status") == "1"
+    assert resolve(TrackStatus(status="1", message=""), "nope") is None
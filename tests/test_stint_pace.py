@@ -0,0 +1,252 @@
+"""Tests for the stint pace analytics."""
+
+import copy
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.samples import TIMING_APP_DATA  # noqa: E402
+from custom_components.racepulse.client.analytics import (  # noqa: E402
+    LapHistory,
+    LapRing,
+    StintPace,
+    StintStats,
+)
+from custom_components.racepulse.client.analytics.lap_history import (  # noqa: E402
+    COMPOUNDS,
+)
+from custom_components.racepulse.client.enums import (  # noqa: E402
+    LiveTimingEvent,
+    TyreCompound,
+)
+from custom_components.racepulse.client.event_factory import (  # noqa: E402
+    EventFactory,
+)
+
+
+def race(laps=20):
+    """Lap numbers and times of a stint losing 80 ms per lap."""
+    rng = random.Random(0)
+    numbers = list(range(1, laps + 1))
+    times = [90_000 + 80 * lap + rng.randint(-300, 300) for lap in numbers]
+    return numbers, times
+
+
+HARD = COMPOUNDS.index(TyreCompound.HARD)
+
+
+def append(ring, lap, lap_ms, stint=0, pit=False):
+    """Record a lap on hard tyres and return its row."""
+    ring.append(lap=lap, lap_ms=lap_ms, sectors=(), compound=HARD, stint=stint, pit=pit)
+    return ring.last
+
+
+# --- StintStats ---
+def test_fit_matches_least_squares():
+    stats = StintStats(0, TyreCompound.MEDIUM)
+    laps, times = race()
+    for lap, lap_ms in zip(laps, times):
+        stats.add(lap, lap_ms)
+
+    slope, intercept = np.polyfit(laps, times, 1)
+
+    assert stats.laps == 20
+    assert stats.mean_pace_ms == pytest.approx(np.mean(times))
+    assert stats.slope_ms == pytest.approx(slope)
+    assert stats.degradation == pytest.approx(slope / 1000)
+    assert stats.predict_ms(30) == pytest.approx(intercept + slope * 30)
+    assert "laps=20" in repr(stats)
+
+
+def test_fit_needs_two_laps():
+    stats = StintStats(0, None)
+    assert stats.mean_pace_ms is None
+
+    stats.add(1, 90_000)
+
+    assert stats.mean_pace_ms == 90_000
+    assert stats.slope_ms is None
+    assert stats.degradation is None
+    assert stats.predict_ms(2) is None
+
+
+def test_remove_undoes_add():
+    stats = StintStats(0, None)
+    laps, times = race()
+    for lap, lap_ms in zip(laps, times):
+        stats.add(lap, lap_ms)
+
+    stats.remove(laps[-1], times[-1])
+    stats.remove(laps[3], times[3])
+    del laps[3], times[3]
+    slope, _ = np.polyfit(laps[:-1], times[:-1], 1)
+
+    assert stats.laps == 18
+    assert stats.mean_pace_ms == pytest.approx(np.mean(times[:-1]))
+    assert stats.slope_ms == pytest.approx(slope)
+
+
+def test_remove_last_lap():
+    stats = StintStats(0, None)
+    stats.add(1, 90_000)
+
+    stats.remove(1, 90_000)
+
+    assert stats.laps == 0
+    assert stats.mean_pace_ms is None
+    assert stats.slope_ms is None
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_remove_down_to_one_lap(seed):
+    stats = StintStats(0, None)
+    laps = list(zip(*race()))
+    for lap, lap_ms in laps:
+        stats.add(lap, lap_ms)
+
+    # Removing in any order may leave float residue in the sums.
+    random.Random(seed).shuffle(laps)
+    for lap, lap_ms in laps[1:]:
+        stats.remove(lap, lap_ms)
+
+    assert stats.laps == 1
+    assert stats.mean_pace_ms == pytest.approx(laps[0][1])
+    assert stats.slope_ms is None
+    assert stats.degradation is None
+    assert stats.predict_ms(2) is None
+
+
+# --- StintPace ---
+def test_laps_go_to_their_stint():
+    pace = StintPace(LapHistory())
+    ring = LapRing()
+    for lap in range(1, 5):
+        pace.add("44", ring, append(ring, lap, 90_000 + lap))
+    pace.add("44", ring, append(ring, 5, 95_000, pit=True))
+    pace.add("44", ring, append(ring, 6, 95_000, stint=1, pit=True))
+    for lap in range(7, 10):
+        pace.add("44", ring, append(ring, lap, 91_000 + lap, stint=1))
+
+    first, second = pace.stints("44")
+    assert (first.stint, first.laps) == (0, 4)
+    assert (second.stint, second.laps) == (1, 3)
+    assert first.compound == TyreCompound.HARD
+    assert pace.current("44") is second
+    assert pace.current("1") is None
+    assert pace.stints("1") == ()
+
+
+def test_unknown_laps_are_left_out():
+    pace = StintPace(LapHistory())
+    ring = LapRing()
+
+    pace.add("44", ring, append(ring, 1, np.nan))
+    pace.add("44", ring, append(ring, 2, 90_000, stint=-1))
+    ring.append(lap=3, lap_ms=90_000, sectors=(), stint=0)
+    pace.add("44", ring, ring.last)
+
+    assert pace.current("44").laps == 1
+    assert pace.current("44").compound is None
+
+
+def test_repeated_and_older_laps_are_ignored():
+    pace = StintPace(LapHistory())
+    ring = LapRing()
+    first = append(ring, 1, 90_000)
+    second = append(ring, 2, 90_100)
+
+    pace.add("44", ring, first)
+    pace.add("44", ring, second)
+    pace.add("44", ring, second)
+    pace.add("44", ring, first)
+
+    assert pace.current("44").laps == 2
+
+
+def test_corrected_lap_replaces_the_old_time():
+    pace = StintPace(LapHistory())
+    ring = LapRing()
+    for lap in range(1, 4):
+        pace.add("44", ring, append(ring, lap, 90_000))
+
+    ring.lap_ms[ring.last] = 90_300
+    pace.add("44", ring, ring.last)
+
+    assert pace.current("44").laps == 3
+    assert pace.current("44").mean_pace_ms == pytest.approx(90_100)
+
+
+def test_corrected_first_lap_of_stint():
+    pace = StintPace(LapHistory())
+    ring = LapRing()
+    pace.add("44", ring, append(ring, 1, 90_000))
+    pace.add("44", ring, append(ring, 2, 91_000, stint=1))
+
+    ring.lap_ms[ring.last] = 91_500
+    pace.add("44", ring, ring.last)
+
+    first, second = pace.stints("44")
+    assert (second.stint, second.laps, second.mean_pace_ms) == (1, 1, 91_500)
+
+
+def test_follows_the_lap_history(timing):
+    history = LapHistory()
+    pace = StintPace(history)
+    history.update(None, timing.event)
+    history.update(
+        None,
+        EventFactory.parse(LiveTimingEvent.TIMING_APP, copy.deepcopy(TIMING_APP_DATA)),
+    )
+
+    history.update(None, timing.apply({"44": {"NumberOfLaps": 25}}))
+    assert pace.current("44") is None
+
+    history.update(None, timing.apply({"44": {"LastLapTime": {"Value": "1:30.500"}}}))
+    history.update(
+        None,
+        timing.apply(
+            {"44": {"NumberOfLaps": 26, "LastLapTime": {"Value": "1:30.600"}}}
+        ),
+    )
+
+    stats = pace.current("44")
+    assert (stats.stint, stats.laps) == (1, 2)
+    assert stats.slope_ms == pytest.approx(100)
+
+    history.update(None, timing.apply({"44": {"LastLapTime": {"Value": "1:30.700"}}}))
+    assert stats.slope_ms == pytest.approx(200)
+
+
+def test_history_reset_drops_stints(timing):
+    history = LapHistory()
+    pace = StintPace(history)
+    ring = LapRing()
+    for num in ("1", "44"):
+        pace.add(num, ring, append(ring, 1, 90_000))
+
+    history.reset("44")
+    assert pace.current("44") is None
+    assert pace.current("1") is not None
+
+    # Starting over from the lap already counted.
+    pace.add("44", ring, ring.last)
+    assert pace.current("44").laps == 1
+
+    history.reset()
+    assert pace.current("1") is None
+    assert pace.current("44") is None
+
+
+def test_close():
+    history = LapHistory()
+    pace = StintPace(history)
+    ring = LapRing()
+    pace.add("44", ring, append(ring, 1, 90_000))
+
+    pace.close()
+    pace.close()
+    history.reset()
+
+    assert pace.current("44") is not None
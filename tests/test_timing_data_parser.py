@@ -0,0 +1,50 @@
+"""Tests for incremental TimingData parsing."""
+
+import copy
+
+import pytest
+
+from benchmarks.samples import timing_line
+from custom_components.racepulse.client.enums import LiveTimingEvent
+from custom_components.racepulse.client.event_factory import EventFactory
+
+UPDATES = [
+    {"44": {"Sectors": {"1": {"Value": "29.001", "PersonalFastest": False}}}},
+    {"44": {"Sectors": {"2": {"Segments": {"3": {"Status": 2051}}}}}},
+    {"1": {"Sectors": {"0": {"Segments": {"_deleted": ["7"]}}}}},
+    {"44": {"Speeds": {"ST": {"Value": "318"}}, "NumberOfLaps": 25}},
+    {"44": {"LastLapTime": {"Value": "1:30.500"}, "_deleted": ["BestLapTime"]}},
+    {"44": {"Sectors": {"_deleted": ["2"]}}},
+    {"_deleted": ["5"]},
+    {"99": timing_line(21, "99")},
+    {"99": {"Position": "1"}, "1": {"Position": "21"}},
+]
+
+
+@pytest.mark.parametrize("count", range(1, len(UPDATES) + 1))
+def test_incremental_parse_matches_full_parse(timing, count):
+    for lines in UPDATES[:count]:
+        previous = timing.event
+        event = timing.apply(copy.deepcopy(lines))
+
+    merged = copy.deepcopy(timing.store.get(LiveTimingEvent.TIMING_DATA))
+    assert event == EventFactory.parse(LiveTimingEvent.TIMING_DATA, merged)
+
+    # Lines the update did not touch are shared with the previous event.
+    untouched = set(previous.lines) & set(event.lines) - set(lines)
+    assert all(event.lines[num] is previous.lines[num] for num in untouched)
+
+
+def test_withheld_update_keeps_every_line(timing):
+    previous = timing.event
+
+    event = EventFactory.parse_incremental(
+        LiveTimingEvent.TIMING_DATA,
+        previous,
+        timing.store.apply(LiveTimingEvent.TIMING_DATA, {"Withheld": True}),
+        {"Withheld": True},
+    )
+
+    assert event.withheld is True
+    assert event.lines == previous.lines
+    assert all(event.lines[num] is line for num, line in previous.lines.items())
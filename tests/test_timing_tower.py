@@ -0,0 +1,162 @@
+"""Tests for the columnar timing tower."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from custom_components.racepulse.client.analytics import TimingTower  # noqa: E402
+from custom_components.racepulse.client.models import TrackStatus  # noqa: E402
+
+
+def test_columns_mirror_timing_data(timing):
+    tower = TimingTower()
+    tower.apply(timing.event)
+
+    assert tower.size == 20
+    assert tower.racing_numbers[:3].tolist() == ["1", "4", "10"]
+    assert tower.position.tolist() == list(range(1, 21))
+    assert tower.gap_to_leader[1] == 624
+    assert tower.interval[1] == 312
+    assert (tower.laps == 24).all()
+    assert (tower.pit_stops == 1).all()
+    assert (tower.last_lap == 91102).all()
+    assert (tower.best_lap == 90857).all()
+    assert (tower.sectors == 28111).all()
+    assert not tower.in_pit.any()
+    assert not tower.retired.any()
+    assert tower.active.all()
+    assert tower.slot("44") == 14
+    assert tower.slot("99") is None
+
+
+def test_race_gaps_take_precedence(timing):
+    tower = TimingTower()
+    tower.apply(
+        timing.apply(
+            {
+                "44": {
+                    "GapToLeader": "+5.000",
+                    "IntervalToPositionAhead": {"Value": "+0.500"},
+                }
+            }
+        )
+    )
+
+    assert tower.gap_to_leader[tower.slot("44")] == 5000
+    assert tower.interval[tower.slot("44")] == 500
+
+
+def test_only_changed_lines_are_rewritten(timing):
+    tower = TimingTower()
+    tower.apply(timing.event)
+    tower.last_lap[:] = 0  # Marks the slots the next event writes.
+
+    tower.apply(timing.apply({"44": {"NumberOfLaps": 25}}))
+
+    assert tower.laps[tower.slot("44")] == 25
+    assert tower.last_lap[tower.slot("44")] == 91102
+    assert np.count_nonzero(tower.last_lap) == 1
+    assert tower.updates == 2
+
+
+def test_order_follows_positions(timing):
+    tower = TimingTower()
+    tower.apply(timing.event)
+    order = tower.order()
+
+    assert order is tower.order()
+    assert not order.flags.writeable
+
+    tower.apply(timing.apply({"1": {"Position": "2"}, "4": {"Position": "1"}}))
+
+    assert tower.racing_numbers[tower.order()[:3]].tolist() == ["4", "1", "10"]
+
+
+def test_gaps_are_derived_from_intervals(timing):
+    tower = TimingTower()
+    tower.apply(timing.apply({"1": {"TimeDiffToFastest": ""}}))
+    tower.apply(timing.apply({"10": {"TimeDiffToFastest": ""}}))
+
+    slots, gaps = tower.gaps()
+
+    assert gaps[0] == 0
+    assert gaps[2] == gaps[1] + 312
+    assert gaps[3] == 1248
+    assert tower.gaps()[1] is gaps
+
+
+def test_unknown_interval_leaves_gap_unknown(timing):
+    tower = TimingTower()
+    tower.apply(
+        timing.apply({"10": {"TimeDiffToFastest": "", "TimeDiffToPositionAhead": "1L"}})
+    )
+
+    _, gaps = tower.gaps()
+
+    assert math.isnan(gaps[2])
+    assert gaps[3] == 1248
+
+
+def test_gaps_without_drivers():
+    slots, gaps = TimingTower().gaps()
+
+    assert len(slots) == len(gaps) == 0
+
+
+def test_battles(timing):
+    tower = TimingTower()
+    tower.apply(timing.apply({"4": {"TimeDiffToPositionAhead": "+0.250"}}))
+
+    assert tower.battles(threshold_ms=300) == [("1", "4", 250.0)]
+    assert tower.battles(threshold_ms=100) == []
+    assert len(tower.battles()) == 19
+
+
+def test_dropped_driver_is_inactive(timing):
+    tower = TimingTower()
+    tower.apply(timing.event)
+    tower.order()
+
+    tower.apply(timing.apply({"_deleted": ["44"]}))
+
+    assert not tower.active[tower.slot("44")]
+    assert tower.slot("44") not in tower.order()
+    assert tower.size == 20
+
+
+def test_columns_grow(timing):
+    tower = TimingTower(capacity=2)
+    tower.apply(timing.event)
+
+    assert tower.size == 20
+    assert tower.racing_numbers[-1] == "5"
+    assert tower.position.tolist() == list(range(1, 21))
+    assert tower.sectors.shape == (20, 3)
+
+
+def test_rank_changes(timing):
+    tower = TimingTower()
+    tower.apply(timing.event)
+    before = tower.snapshot()
+
+    tower.apply(timing.apply({"1": {"Position": "2"}, "4": {"Position": "1"}}))
+    tower.apply(timing.apply({"44": {"Position": "0"}}))
+
+    changes = tower.rank_changes(before)
+
+    assert changes[tower.slot("1")] == -1
+    assert changes[tower.slot("4")] == 1
+    assert changes[tower.slot("44")] == 0
+    assert np.count_nonzero(changes) == 2
+
+
+def test_update_follows_timing_data_only(timing):
+    tower = TimingTower()
+
+    tower.update(None, TrackStatus(status="1", message="AllClear"))
+    assert tower.updates == 0
+
+    tower.update(None, timing.event)
+    assert tower.updates == 1
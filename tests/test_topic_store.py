@@ -0,0 +1,169 @@
+"""Tests for the merged topic state."""
+
+import copy
+
+import pytest
+
+from benchmarks.samples import TIMING_DATA
+from custom_components.racepulse.client.state.topic_store import (
+    TopicStateStore,
+    diff,
+    merge,
+)
+
+
+def test_merge_dicts():
+    target = {"A": {"B": 1, "C": 2}, "D": 3}
+
+    merged = merge(target, {"A": {"B": 5}, "E": [1]})
+
+    assert merged is target
+    assert merged == {"A": {"B": 5, "C": 2}, "D": 3, "E": [1]}
+
+
+def test_merge_deletions():
+    merged = merge(
+        {"Lines": {"1": {}, "44": {}}, "Items": ["a", "b", "c", "d"]},
+        {"Lines": {"_deleted": ["44", 7]}, "Items": {"_deleted": [1, "3", "x", 9]}},
+    )
+
+    assert merged == {"Lines": {"1": {}}, "Items": ["a", "c"]}
+
+
+def test_merge_list_by_index():
+    target = {"Sectors": [{"Value": "28.1"}, {"Value": "29.2"}]}
+
+    merge(target, {"Sectors": {"1": {"Value": "29.0"}, "2": {"Value": "30.3"}}})
+    assert target["Sectors"] == [
+        {"Value": "28.1"},
+        {"Value": "29.0"},
+        {"Value": "30.3"},
+    ]
+
+    # An index beyond the end pads the gap, so the item keeps its index.
+    merge(target, {"Sectors": {"5": "late", "first": "ignored", "0": "flat"}})
+    assert target["Sectors"] == [
+        "flat",
+        {"Value": "29.0"},
+        {"Value": "30.3"},
+        None,
+        None,
+        "late",
+    ]
+
+
+def test_merge_replaces_other_values():
+    assert merge({"A": [1, 2]}, {"A": [3]}) == {"A": [3]}
+    assert merge({"A": 1}, {"A": {"B": 2}}) == {"A": {"B": 2}}
+    assert merge("old", {"A": 1}) == {"A": 1}
+    assert merge({"A": 1}, "new") == "new"
+
+
+def test_merge_copy_on_write():
+    target = {"Lines": {"1": {"Position": "1"}, "44": {"Position": "2"}}, "L": [1]}
+    before = copy.deepcopy(target)
+
+    merged = merge(target, {"Lines": {"44": {"Position": "1"}}, "L": {"0": 2}}, True)
+
+    assert target == before
+    assert merged["Lines"]["44"] == {"Position": "1"}
+    assert merged["L"] == [2]
+    assert merged["Lines"]["1"] is target["Lines"]["1"]
+
+
+def test_diff():
+    assert diff({"A": 1, "B": [1, 2]}, {"A": 1, "B": [1, 3], "C": 4}) == {
+        "B": {"1": 3},
+        "C": 4,
+    }
+    assert diff({"A": 1, "B": 2}, {"A": 1}) == {"_deleted": ["B"]}
+    assert diff({"A": [1, 2]}, {"A": [1, 2, 3]}) == {"A": {"2": 3}}
+    assert diff({"A": [1, 2]}, {"A": [1]}) == {"A": [1]}
+    assert diff({"A": 1}, {"A": 1.0}) == {"A": 1.0}
+    assert diff({"A": [1]}, {"A": [1]}) is None
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"Withheld": True},
+        {"Lines": {"44": {"Position": "1"}, "1": {"Position": "15"}}},
+        {"Lines": {"44": {"Sectors": {"2": {"Segments": {"8": {"Status": 2051}}}}}}},
+        {"Lines": {"_deleted": ["44"], "99": {"Position": "21"}}},
+    ],
+)
+def test_diff_merge_round_trip(change):
+    old = copy.deepcopy(TIMING_DATA)
+    new = merge(copy.deepcopy(TIMING_DATA), copy.deepcopy(change))
+
+    delta = diff(old, new)
+
+    assert delta is not None
+    assert merge(old, delta) == new
+
+
+def test_store_apply():
+    store = TopicStateStore()
+    assert "TimingData" not in store
+
+    assert store.apply("TimingData", {"Lines": {}}) == {"Lines": {}}
+    store.apply("TimingData", {"Lines": {"1": {"Position": "1"}}})
+
+    assert "TimingData" in store
+    assert store.get("TimingData") == {"Lines": {"1": {"Position": "1"}}}
+
+
+def test_store_copy_on_write_keeps_earlier_states():
+    store = TopicStateStore(copy_on_write=True)
+    first = store.replace("TimingData", {"Lines": {"1": {"Position": "1"}}})
+
+    second = store.apply("TimingData", {"Lines": {"1": {"Position": "2"}}})
+
+    assert first == {"Lines": {"1": {"Position": "1"}}}
+    assert second == {"Lines": {"1": {"Position": "2"}}}
+
+
+def test_sync_first_snapshot_is_returned_as_is():
+    store = TopicStateStore()
+    snapshot = {"Status": "1"}
+
+    assert store.sync("TrackStatus", snapshot) is snapshot
+    assert store.get("TrackStatus") is snapshot
+
+
+def test_sync_identical_snapshot():
+    store = TopicStateStore()
+    store.replace("TimingData", copy.deepcopy(TIMING_DATA))
+
+    assert store.sync("TimingData", copy.deepcopy(TIMING_DATA)) is None
+    # Once hashed, the digest is kept until the state changes.
+    assert store.sync("TimingData", copy.deepcopy(TIMING_DATA)) is None
+
+    store.apply("TimingData", {"Withheld": True})
+    assert store.sync("TimingData", copy.deepcopy(TIMING_DATA)) == {"Withheld": False}
+
+
+def test_sync_changed_snapshot():
+    store = TopicStateStore()
+    store.sync("TimingData", copy.deepcopy(TIMING_DATA))
+    snapshot = copy.deepcopy(TIMING_DATA)
+    snapshot["Lines"]["44"]["NumberOfLaps"] = 25
+    del snapshot["Lines"]["5"]
+
+    delta = store.sync("TimingData", snapshot)
+
+    assert delta == {"Lines": {"44": {"NumberOfLaps": 25}, "_deleted": ["5"]}}
+    assert store.get("TimingData") is snapshot
+
+
+def test_reset():
+    store = TopicStateStore()
+    store.replace("TimingData", {})
+    store.replace("TrackStatus", {})
+
+    store.reset("TimingData")
+    assert "TimingData" not in store
+    assert "TrackStatus" in store
+
+    store.reset()
+    assert "TrackStatus" not in store